@@ -0,0 +1,7 @@
+# effootball/async_views.py
+"""Async GET ya /api/efootball/ chini ya ASGI - angalia games/async_views.py"""
+from games.async_views import fixture_list_view
+
+from .views import EfootballListCreateView
+
+efootball_list = fixture_list_view(EfootballListCreateView)
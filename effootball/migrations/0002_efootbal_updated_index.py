@@ -0,0 +1,17 @@
+# Generated by Django 5.2.11 on 2026-10-17 02:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('effootball', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='efootbal',
+            index=models.Index(fields=['updated_at', 'id'], name='efootbal_updated_idx'),
+        ),
+    ]
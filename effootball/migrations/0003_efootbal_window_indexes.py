@@ -0,0 +1,21 @@
+# Generated by Django 5.2.11 on 2026-10-17 02:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('effootball', '0002_efootbal_updated_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='efootbal',
+            index=models.Index(fields=['date', 'time'], name='efootbal_kickoff_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='efootbal',
+            index=models.Index(fields=['league', 'date'], name='efootbal_league_idx'),
+        ),
+    ]
@@ -0,0 +1,9 @@
+# effootball/signals.py
+from django.db.models.signals import post_save
+
+from games.signals import fixture_saved
+
+from .models import Efootbal
+
+# Receiver ile ile ya MatchFixture
+post_save.connect(fixture_saved, sender=Efootbal, dispatch_uid='efootball_saved')
@@ -1,3 +1,190 @@
+import asyncio
+from datetime import time, timedelta
+from decimal import Decimal
+
 from django.test import TestCase
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from games.live import fixture_channel, get_hub
+from games.models import MatchFixture
+from games.serializers import fixture_rows
+from games.views import FixtureListCreateView
+
+from .models import Efootbal
+from .serializers import EfootbalSerializer
+from .views import EfootballListCreateView
+
+
+def make_efootball(event_id=1, **kwargs):
+    defaults = {
+        'eventId': event_id,
+        'time': time(20, 0),
+        'date': timezone.localdate() + timedelta(days=event_id % 28 + 1),
+        'homeTeam': f'Home {event_id}',
+        'awayTeam': f'Away {event_id}',
+        'league': 'eFootball Elite',
+        'homeOdds': Decimal('2.10'),
+        'drawOdds': Decimal('3.40'),
+        'awayOdds': Decimal('3.05'),
+    }
+    defaults.update(kwargs)
+    return Efootbal.objects.create(**defaults)
+
+
+class EfootballListTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        make_efootball(event_id=1)
+        make_efootball(event_id=2, hasBoostedOdds=True, drawOddsFire=True)
+        make_efootball(event_id=3, awayOddsFire=True, betCount=7, hasTwoUp=True)
+
+    def test_list_matches_serializer_output(self):
+        with self.assertNumQueries(2):
+            response = self.client.get('/api/efootball/')
+        fixtures = Efootbal.objects.order_by('date', 'time')
+        self.assertEqual(
+            response.content,
+            JSONRenderer().render(EfootbalSerializer(fixtures, many=True).data),
+        )
+
+    def test_conditional_get(self):
+        etag = self.client.get('/api/efootball/')['ETag']
+        response = self.client.get('/api/efootball/', headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 304)
+
+        make_efootball(event_id=4)
+        response = self.client.get('/api/efootball/', headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data), 4)
+
+
+class EfootballBulkWriteTests(TestCase):
+
+    def test_bulk_create_and_upsert(self):
+        make_efootball(event_id=1)
+        payload = [
+            {
+                'eventId': event_id, 'time': '20:00', 'date': '2026-03-02',
+                'homeTeam': 'A', 'awayTeam': 'B', 'league': 'eFootball Elite',
+                'homeOdds': {'value': '2.00'}, 'drawOdds': {'value': '3.00'}, 'awayOdds': {'value': '4.00'},
+            }
+            for event_id in (1, 2, 3)
+        ]
+        response = self.client.post('/api/efootball/bulk/', payload, content_type='application/json')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['total_created'], 2)
+        self.assertEqual(response.data['total_errors'], 1)
+
+        response = self.client.post('/api/efootball/bulk/?upsert=1', payload, content_type='application/json')
+        self.assertEqual(response.data['total_updated'], 3)
+        self.assertEqual(Efootbal.objects.get(eventId=1).homeOdds, Decimal('2.00'))
+
+    def test_bulk_update(self):
+        fixture = make_efootball(event_id=1)
+        payload = [{
+            'id': fixture.pk, 'eventId': 1, 'time': '21:00', 'date': '2026-03-02',
+            'homeTeam': 'A', 'awayTeam': 'B', 'league': 'eFootball Elite',
+            'homeOdds': {'value': '2.00'}, 'drawOdds': {'value': '3.00'}, 'awayOdds': {'value': '4.00'},
+        }, {'id': 12345}]
+        response = self.client.put('/api/efootball/bulk/update/', payload, content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['total_updated'], 1)
+        self.assertEqual(response.data['errors'][0]['index'], 1)
+        fixture.refresh_from_db()
+        self.assertEqual(fixture.awayOdds, Decimal('4.00'))
+
+    def test_bulk_delete(self):
+        fixtures = [make_efootball(event_id=i) for i in (1, 2, 3)]
+        response = self.client.delete(
+            '/api/efootball/bulk/delete/',
+            {'ids': [fixtures[0].pk, fixtures[2].pk, 404]},
+            content_type='application/json',
+        )
+        self.assertEqual(response.data['total_deleted'], 2)
+        self.assertEqual(response.data['not_found'], [404])
+        self.assertEqual(list(Efootbal.objects.values_list('eventId', flat=True)), [2])
+
+
+class EfootballPushTests(TestCase):
+
+    def test_save_publishes_on_efootball_channel_only(self):
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+
+        async def subscribe():
+            return [get_hub().subscribe(fixture_channel(model)) for model in (Efootbal, MatchFixture)]
+        efootball, fixtures = loop.run_until_complete(subscribe())
+        for subscription in (efootball, fixtures):
+            self.addCleanup(get_hub().unsubscribe, subscription)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            make_efootball(event_id=4)
+        loop.run_until_complete(asyncio.sleep(0))
+
+        message = efootball.queue.get_nowait()
+        self.assertTrue(message.startswith(b'event: fixtures\n'))
+        self.assertIn(JSONRenderer().render(fixture_rows(Efootbal.objects.all())), message)
+        self.assertTrue(fixtures.queue.empty())
+
+
+class EfootballDeltaSyncTests(TestCase):
+    url = '/api/efootball/'
+
+    def test_since_returns_changes_and_deletions(self):
+        fixtures = [make_efootball(event_id=i) for i in (1, 2, 3)]
+        token = self.client.get(self.url, {'since': '0'}).data['since']
+        Efootbal.objects.update(updated_at=timezone.now() - timedelta(minutes=1))
+
+        fixtures[0].awayOdds = Decimal('2.75')
+        fixtures[0].save()
+        self.client.delete(f'{self.url}{fixtures[1].pk}/')
+
+        response = self.client.get(self.url, {'since': token})
+        self.assertEqual(response.data['results'], fixture_rows(Efootbal.objects.filter(pk=fixtures[0].pk)))
+        self.assertEqual(response.data['deleted'], [fixtures[1].pk])
+        self.assertTrue(response.data['since'].isdigit())
+
+
+class FixtureEngineParityTests(TestCase):
+    """/api/efootball/ na /api/fixtures/ ni engine moja - majibu ni sawa"""
+
+    payload = {
+        'eventId': 50, 'time': '18:30:00', 'date': '2099-04-02', 'homeTeam': 'Simba', 'awayTeam': 'Yanga',
+        'league': 'NBC Premier', 'homeOdds': {'value': '1.85', 'hasFireIcon': True},
+        'drawOdds': '3.20', 'awayOdds': {'value': '4.10'}, 'hasBoostedOdds': True,
+    }
+
+    def responses(self, method, suffix='', data=None):
+        return [
+            getattr(self.client, method)(f'/api/{prefix}/{suffix}', data, content_type='application/json')
+            for prefix in ('fixtures', 'efootball')
+        ]
+
+    def assertSameResponses(self, responses, key=None):
+        games, efootball = responses
+        self.assertEqual(games.status_code, efootball.status_code)
+        games, efootball = games.json(), efootball.json()
+        if key:
+            games, efootball = games[key], efootball[key]
+        for data in (games, efootball):
+            for row in data if isinstance(data, list) else [data]:
+                row.pop('id', None)
+        self.assertEqual(games, efootball)
+
+    def test_views_share_the_engine(self):
+        self.assertTrue(issubclass(EfootballListCreateView, FixtureListCreateView))
+        self.assertIs(EfootballListCreateView.model, Efootbal)
+
+    def test_same_responses_for_both_sports(self):
+        self.assertSameResponses(self.responses('post', 'bulk/', [self.payload, {'eventId': 'x'}]), 'created')
+        self.assertSameResponses(self.responses('get'))
 
-# Create your tests here.
+        games, efootball = MatchFixture.objects.get(), Efootbal.objects.get()
+        change = {'betCount': 9, 'homeOdds': '1.90', 'drawOdds': '3.20', 'awayOdds': '4.10'}
+        self.assertSameResponses([
+            self.client.patch(f'/api/fixtures/{games.pk}/', change, content_type='application/json'),
+            self.client.patch(f'/api/efootball/{efootball.pk}/', change, content_type='application/json'),
+        ])
+        self.assertSameResponses(self.responses('get', '0/'))
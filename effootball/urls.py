@@ -1,12 +1,15 @@
 from django.urls import path
-from . import views
+from games.async_views import read_view
+
+from . import async_views, views
 
 
 urlpatterns = [
-    path('efootball/', views.EfootballListCreateView.as_view(), name='efootball-list-create'),
+    path('efootball/', read_view(views.EfootballListCreateView, async_views.efootball_list), name='efootball-list-create'),
     path('efootball/bulk/', views.EfootballBulkCreateView.as_view(), name='efootball-bulk-create'),
     path('efootball/<int:pk>/', views.EfootbalDetailView.as_view(), name='efootball-detail'),
     path('efootball/bulk/update/', views.EfootballBulkUpdateView.as_view(), name='efootball-bulk-update'),
     path('efootball/bulk/delete/', views.EfootballBulkDeleteView.as_view(), name='efootball-bulk-delete'),
+    path('efootball/stream/', views.efootball_stream, name='efootball-stream'),
 
 ]
\ No newline at end of file
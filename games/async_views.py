@@ -0,0 +1,171 @@
+# games/async_views.py
+"""
+Async versions za read endpoints zenye traffic kubwa (bets list, bet detail, bet
+summary, fixtures, eFootball). Zinatumika chini ya ASGI kukiwa na ASYNC_READ_VIEWS=1:
+GET inaendeshwa kwa async ORM, methods nyingine (POST/PUT/...) zinapelekwa kwenye
+APIView ya sync kama zamani.
+
+Queries na serialization ni zile zile za views za sync, hivyo JSON ni sawa byte kwa byte.
+"""
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework.renderers import JSONRenderer
+
+from .cache import abet_summary_key, afixture_list_etag, bet_summary_timeout, not_modified
+from .filters import InvalidFixtureFilter, filter_fixtures, fixture_window, window_key
+from .models import Game
+from .pagination import InvalidCursor, keyset_queryset, keyset_result
+from .renderers import ColumnarJSONRenderer, wants_columnar
+from .serializers import (
+    FIXTURE_COLUMNAR_FIELDS, FIXTURE_LIST_COLUMNS, GameResponseSerializer, build_columnar_rows, build_fixture_rows,
+    serialize_games,
+)
+from .streaming import astream_queryset, streaming_json_response, wants_stream
+from .sync import InvalidSyncToken, SyncTokenExpired, changes_since
+from .views import BetCRUDView, BetDetailView, BetFilterView, MatchFixtureListCreateView
+
+
+def json_response(data, status=200, headers=None, content_type='application/json'):
+    """Kama DRF Response (JSONRenderer) bila content negotiation ya APIView"""
+    return HttpResponse(JSONRenderer().render(data), status=status, content_type=content_type, headers=headers)
+
+
+def with_async_get(view_class, get):
+    """View moja: GET ni async, methods nyingine zinaenda kwenye APIView ya sync"""
+    sync_view = sync_to_async(view_class.as_view())
+
+    # APIView ni csrf_exempt; wrapper lazima iwe hivyo pia
+    @csrf_exempt
+    async def view(request, *args, **kwargs):
+        if request.method == 'GET':
+            return await get(request, *args, **kwargs)
+        return await sync_view(request, *args, **kwargs)
+
+    return view
+
+
+def read_view(view_class, async_view):
+    """Chagua async view chini ya ASGI (ASYNC_READ_VIEWS), APIView ya sync vinginevyo"""
+    if getattr(settings, 'ASYNC_READ_VIEWS', False):
+        return async_view
+    return view_class.as_view()
+
+
+# ============================================
+# BETS - GET /api/bets/, /api/bets/<id>/, /api/bets/filter/summary/
+# ============================================
+async def bet_list_get(request):
+    """Kama BetCRUDView.get"""
+    params = request.GET
+    games = BetCRUDView.list_queryset(params.get('status'))
+
+    cursor, page_size = params.get('cursor'), params.get('page_size')
+    if cursor is not None or page_size is not None:
+        page_size = BetCRUDView.page_size_param(page_size)
+        try:
+            queryset = keyset_queryset(games, cursor, page_size)
+        except InvalidCursor:
+            return json_response({'error': 'Invalid cursor'}, status=400)
+        page, next_cursor = keyset_result([game async for game in queryset], page_size)
+        return json_response({
+            'results': GameResponseSerializer(page, many=True).data,
+            'next': next_cursor
+        })
+
+    limit = BetCRUDView.limit_param(params.get('limit'))
+    if limit is not None:
+        games = games[:limit]
+    if wants_stream(params):
+        return streaming_json_response(astream_queryset(games, serialize_games))
+    return json_response(GameResponseSerializer([game async for game in games], many=True).data)
+
+
+async def bet_detail_get(request, game_id):
+    """Kama BetDetailView.get (matches kwa prefetch badala ya query ya serializer)"""
+    try:
+        game = await Game.objects.prefetch_related('matches').aget(id=game_id)
+    except Game.DoesNotExist:
+        return json_response({'error': 'Game not found'}, status=404)
+    return json_response(GameResponseSerializer(game).data)
+
+
+async def bet_summary_get(request):
+    """Kama BetFilterView.get - cache hit haigusi DB wala thread"""
+    view = BetFilterView()
+    page_size, active_page, settled_page = view.summary_params(request.GET)
+
+    cache_key = await abet_summary_key(page_size, active_page, settled_page)
+    data = await cache.aget(cache_key)
+    if data is None:
+        queries = view.summary_queries(page_size, active_page, settled_page)
+        counts = await Game.objects.aaggregate(**queries['counts'])
+        active, settled = view.summary_pages(queries, counts)
+        data = view.summary_data(
+            queries,
+            counts,
+            [game async for game in active],
+            [game async for game in settled],
+            [game async for game in queries['recent']],
+        )
+        await cache.aset(cache_key, data, bet_summary_timeout())
+    return json_response(data)
+
+
+# ============================================
+# FIXTURES - GET /api/fixtures/ (na /api/efootball/)
+# ============================================
+def fixture_list_get(model):
+    """Kama MatchFixtureListCreateView.get kwa model yoyote ya fixtures"""
+
+    async def get(request):
+        since = request.GET.get('since')
+        if since is not None:
+            try:
+                data = await sync_to_async(changes_since)(model, since)
+            except InvalidSyncToken:
+                return json_response({'error': 'Invalid since token'}, status=400)
+            except SyncTokenExpired:
+                return json_response({'error': 'since token has expired, reload the full list'}, status=410)
+            return json_response(data)
+
+        try:
+            window = fixture_window(request.GET)
+        except InvalidFixtureFilter as exc:
+            return json_response({'error': str(exc)}, status=400)
+        fixtures = filter_fixtures(model.objects.all(), window)
+
+        renderer = ColumnarJSONRenderer if wants_columnar(request) else JSONRenderer
+        etag = await afixture_list_etag(model, f'{window_key(window)}:{renderer.format}', queryset=fixtures)
+        if not_modified(request, etag):
+            return HttpResponse(status=304, headers={'ETag': etag})
+
+        rows = fixtures.order_by('date', 'time').values_list(*FIXTURE_LIST_COLUMNS)
+        headers = {'ETag': etag, 'Cache-Control': 'no-cache', 'Vary': 'Accept'}
+        if renderer is ColumnarJSONRenderer:
+            build, head = build_columnar_rows, [list(FIXTURE_COLUMNAR_FIELDS)]
+        else:
+            build, head = build_fixture_rows, []
+
+        if wants_stream(request.GET):
+            return streaming_json_response(
+                astream_queryset(rows, build, head=head), headers=headers, content_type=renderer.media_type
+            )
+        return json_response(
+            [*head, *build([row async for row in rows])], headers=headers, content_type=renderer.media_type
+        )
+
+    return get
+
+
+def fixture_list_view(view_class):
+    """Async GET + APIView ya sync kwa subclass yoyote ya FixtureListCreateView"""
+    return with_async_get(view_class, fixture_list_get(view_class.model))
+
+
+bet_crud = with_async_get(BetCRUDView, bet_list_get)
+bet_detail = with_async_get(BetDetailView, bet_detail_get)
+bet_summary = with_async_get(BetFilterView, bet_summary_get)
+fixture_list = fixture_list_view(MatchFixtureListCreateView)
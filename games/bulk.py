@@ -0,0 +1,347 @@
+# games/bulk.py
+"""
+Bulk write engine ya fixtures (MatchFixture na Efootbal) na settlement ya bets.
+
+Batch nzima ina-validate kwanza (serializer moja, bila query kwa kila row),
+kisha inaandikwa kwa chunked bulk_create/bulk_update ndani ya transaction moja.
+"""
+from collections import defaultdict
+from decimal import Decimal
+
+from django.db import transaction
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.validators import UniqueValidator
+
+from .cache import invalidate_bet_summary
+from .live import publish_fixture_changes
+from .models import Game
+from .serializers import fixture_rows
+from .sync import record_deletions
+
+# Rows kwa kila INSERT/UPDATE na ids kwa kila `IN (...)` - chini ya SQLite variable limit
+BULK_BATCH_SIZE = 500
+
+
+def chunks(items, size=BULK_BATCH_SIZE):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def fixture_pk(fixture_id):
+    """Id ya fixture iliyotumwa kama int, au None kama si namba (isdigit() inakubali '²')"""
+    fixture_id = str(fixture_id)
+    return int(fixture_id) if fixture_id.isdecimal() else None
+
+
+def existing_event_ids(model, event_ids):
+    """{eventId: pk} kwa eventIds zilizopo tayari - query moja kwa kila chunk"""
+    found = {}
+    for chunk in chunks(list(event_ids)):
+        found.update(model.objects.filter(eventId__in=chunk).order_by().values_list('eventId', 'id'))
+    return found
+
+
+def validate_fixtures(serializer_class, entries):
+    """
+    Validate kila (index, item) kwa serializer moja (fields zinajengwa mara moja tu).
+    UniqueValidator ya eventId inaondolewa - uniqueness inaangaliwa kwa bulk.
+
+    Returns (valid, invalid, unique_message) - valid ni [(index, item, validated_data)],
+    invalid ni [(index, item, errors)]
+    """
+    serializer = serializer_class()
+    event_id_field = serializer.fields['eventId']
+    unique_message = None
+    for validator in event_id_field.validators:
+        if isinstance(validator, UniqueValidator):
+            unique_message = validator.message
+    event_id_field.validators = [
+        v for v in event_id_field.validators if not isinstance(v, UniqueValidator)
+    ]
+
+    valid, invalid = [], []
+    for index, item in entries:
+        if not isinstance(item, dict):
+            invalid.append((index, item, {'non_field_errors': ['Expected a fixture object']}))
+            continue
+        try:
+            valid.append((index, item, serializer.run_validation(item)))
+        except serializers.ValidationError as exc:
+            invalid.append((index, item, exc.detail))
+
+    return valid, invalid, unique_message
+
+
+def bulk_create_fixtures(model, serializer_class, items, upsert=False):
+    """
+    Create (au upsert kwa eventId) fixtures nyingi kwa pamoja.
+
+    Returns (created, updated, errors) - created/updated ni model instances,
+    errors ni list ya {'index', 'data', 'errors'} kama zamani.
+    """
+    valid, invalid, unique_message = validate_fixtures(serializer_class, enumerate(items))
+    errors = [
+        {'index': index, 'data': item, 'errors': detail} for index, item, detail in invalid
+    ]
+
+    # Duplicates ndani ya batch: ya kwanza inashinda
+    seen = set()
+    unique_rows = []
+    for index, item, data in valid:
+        if data['eventId'] in seen:
+            errors.append({'index': index, 'data': item, 'errors': {'eventId': [unique_message]}})
+            continue
+        seen.add(data['eventId'])
+        unique_rows.append((index, item, data))
+
+    existing = existing_event_ids(model, seen)
+
+    to_create, updated = [], []
+    # Kama serializer.save(): fields ambazo hazikutumwa hazibadilishwi
+    to_update = defaultdict(list)
+    now = timezone.now()
+    for index, item, data in unique_rows:
+        pk = existing.get(data['eventId'])
+        if pk is None:
+            to_create.append(model(**data))
+        elif upsert:
+            fixture = model(pk=pk, updated_at=now, **data)
+            to_update[tuple(sorted(data.keys() - {'eventId'}))].append(fixture)
+            updated.append(fixture)
+        else:
+            errors.append({'index': index, 'data': item, 'errors': {'eventId': [unique_message]}})
+
+    with transaction.atomic():
+        created = model.objects.bulk_create(to_create, batch_size=BULK_BATCH_SIZE)
+        for fields, fixtures in to_update.items():
+            model.objects.bulk_update(fixtures, [*fields, 'updated_at'], batch_size=BULK_BATCH_SIZE)
+        # bulk_create/bulk_update hazitumi signals; upserts zina fields zilizotumwa tu
+        publish_fixture_changes(model, fixtures=created, pks=[fixture.pk for fixture in updated])
+
+    errors.sort(key=lambda error: error['index'])
+    return created, updated, errors
+
+
+def fixture_rows_by_pk(model, pks):
+    """Fixture list ya rows zilizoandikwa, ikisomwa upya kutoka DB kwa chunks"""
+    rows = []
+    for chunk in chunks(list(pks)):
+        rows += fixture_rows(model.objects.filter(pk__in=chunk).order_by('pk'))
+    return rows
+
+
+def bulk_update_fixtures(model, serializer_class, items):
+    """
+    Full update (PUT) ya fixtures nyingi: in_bulk moja kupakia rows zote,
+    validation kwenye memory, kisha chunked bulk_update ndani ya transaction moja.
+    Rows ambazo hazikubadilika haziandikwi (updated_at na ETag hazibadiliki).
+
+    Returns (updated, errors) - updated ni instances (moja kwa kila item iliyofaulu),
+    errors ni list ya {'index', 'id', 'data', 'errors'} kama zamani.
+    """
+    errors, wanted = [], []
+    for index, item in enumerate(items):
+        fixture_id = item.get('id') if isinstance(item, dict) else None
+        if not fixture_id:
+            errors.append({
+                'index': index,
+                'data': item,
+                'errors': {'id': 'This field is required for updates'}
+            })
+            continue
+        wanted.append((index, item, fixture_id))
+
+    # in_bulk ina-chunk yenyewe kulingana na SQLite variable limit
+    fixtures = model.objects.in_bulk({fixture_pk(fixture_id) for _, _, fixture_id in wanted} - {None})
+
+    found = {}
+    for index, item, fixture_id in wanted:
+        fixture = fixtures.get(fixture_pk(fixture_id))
+        if fixture is None:
+            errors.append({
+                'index': index,
+                'id': fixture_id,
+                'data': item,
+                'errors': {'id': f'Fixture with id {fixture_id} not found'}
+            })
+            continue
+        found[index] = fixture
+
+    valid, invalid, unique_message = validate_fixtures(
+        serializer_class, ((index, item) for index, item, _ in wanted if index in found)
+    )
+    for index, item, detail in invalid:
+        errors.append({'index': index, 'id': item['id'], 'data': item, 'errors': detail})
+
+    # eventId isichukuliwe na fixture nyingine (DB au batch hii)
+    owners = existing_event_ids(model, {data['eventId'] for _, _, data in valid})
+    updated, dirty = [], {}
+    now = timezone.now()
+    for index, item, data in valid:
+        fixture = found[index]
+        owner = owners.setdefault(data['eventId'], fixture.pk)
+        if owner != fixture.pk:
+            errors.append({
+                'index': index,
+                'id': item['id'],
+                'data': item,
+                'errors': {'eventId': [unique_message]}
+            })
+            continue
+
+        # Kama ModelSerializer.update(), lakini fields zilizobadilika tu ndizo
+        # zinaandikwa - odds refresh ya matchday ni UPDATE ya column 1-3 tu
+        changed = {field for field, value in data.items() if getattr(fixture, field) != value}
+        for field in changed:
+            setattr(fixture, field, data[field])
+        if changed:
+            fixture.updated_at = now
+            dirty.setdefault(fixture.pk, (fixture, set()))[1].update(changed)
+        updated.append(fixture)
+
+    to_update = defaultdict(list)
+    for fixture, fields in dirty.values():
+        to_update[tuple(sorted(fields))].append(fixture)
+
+    with transaction.atomic():
+        for fields, group in to_update.items():
+            model.objects.bulk_update(group, [*fields, 'updated_at'], batch_size=BULK_BATCH_SIZE)
+        publish_fixture_changes(model, fixtures=[fixture for fixture, _ in dirty.values()])
+
+    errors.sort(key=lambda error: error['index'])
+    return updated, errors
+
+
+def bulk_delete_fixtures(model, fixture_ids):
+    """
+    Delete fixtures nyingi: values() moja kwa report, DELETE ... WHERE id IN (...)
+    moja kwa kila chunk, yote ndani ya transaction moja.
+
+    Returns (deleted, not_found) kwa order ya ids zilizotumwa.
+    """
+    pks = {fixture_pk(fixture_id) for fixture_id in fixture_ids} - {None}
+
+    with transaction.atomic():
+        found = {}
+        for chunk in chunks(list(pks)):
+            found.update(
+                (row['id'], row)
+                for row in model.objects.filter(pk__in=chunk).values('id', 'eventId', 'homeTeam', 'awayTeam')
+            )
+        for chunk in chunks(list(found)):
+            model.objects.filter(pk__in=chunk).delete()
+        record_deletions(model, found)
+        publish_fixture_changes(model, deleted=list(found))
+
+    deleted, not_found = [], []
+    for fixture_id in fixture_ids:
+        row = found.pop(fixture_pk(fixture_id), None)
+        if row is None:
+            not_found.append(fixture_id)
+        else:
+            deleted.append(row)
+    return deleted, not_found
+
+
+# ============================================
+# BETS - batch settlement
+# ============================================
+SETTLE_RESULTS = ('WON', 'LOST')
+CENTS = Decimal('0.01')
+
+
+def bulk_settle_games(items):
+    """
+    Settle games nyingi kwa pamoja (sheria sawa na BetApproveView): query moja
+    kupakia na ku-lock games zote, payouts zinahesabiwa kwa pass moja, kisha
+    chunked bulk_update ndani ya transaction moja.
+
+    Returns (settled, errors) kwa order ya items zilizotumwa.
+    """
+    errors, wanted = [], []
+    for index, item in enumerate(items):
+        game_id = item.get('game_id') if isinstance(item, dict) else None
+        result = item.get('result', 'LOST') if isinstance(item, dict) else None
+        if not game_id:
+            errors.append({'index': index, 'game_id': None, 'error': 'game_id is required'})
+        elif result not in SETTLE_RESULTS:
+            errors.append({
+                'index': index,
+                'game_id': game_id,
+                'error': f'result must be one of {list(SETTLE_RESULTS)}'
+            })
+        else:
+            wanted.append((index, str(game_id), result))
+
+    settled, to_update = [], []
+    with transaction.atomic():
+        games = Game.objects.select_for_update().in_bulk({game_id for _, game_id, _ in wanted})
+        now = timezone.now()
+        seen = set()
+        for index, game_id, result in wanted:
+            game = games.get(game_id)
+            if game is None:
+                error = 'Game not found'
+            elif game_id in seen:
+                error = 'Duplicate game_id in batch'
+            elif game.status != 'OPEN':
+                error = f'Game cannot be settled. Current status: {game.status}'
+            elif game.active_until < now:
+                error = 'Game has expired. Cannot settle.'
+            else:
+                error = None
+            if error:
+                errors.append({'index': index, 'game_id': game_id, 'error': error})
+                continue
+
+            seen.add(game_id)
+            game.result = result
+            game.status = 'SETTLED'
+            game.settled_at = now
+            game.payout = (game.stake * game.odds).quantize(CENTS) if result == 'WON' else Decimal('0.00')
+            to_update.append(game)
+            settled.append({
+                'index': index,
+                'game_id': game_id,
+                'result': result,
+                'payout': str(game.payout)
+            })
+
+        Game.objects.bulk_update(
+            to_update, ['result', 'status', 'settled_at', 'payout'], batch_size=BULK_BATCH_SIZE
+        )
+
+    # bulk_update haitumi post_save signals
+    if to_update:
+        invalidate_bet_summary()
+
+    errors.sort(key=lambda error: error['index'])
+    return settled, errors
+
+
+# ============================================
+# BETS - expiry sweep
+# ============================================
+def expired_games(now):
+    """OPEN games zilizopita active_until - range scan ya game_summary_idx"""
+    return Game.objects.filter(status='OPEN', active_until__lt=now)
+
+
+def expire_games_batch(now, batch_size=BULK_BATCH_SIZE):
+    """
+    Hamisha hadi batch_size expired games kwenda EXPIRED kwa UPDATE moja
+    (WHERE id IN (SELECT ... LIMIT n)), hivyo write lock ni fupi hata backlog ikiwa kubwa.
+    status='OPEN' inarudiwa kwenye UPDATE ili game iliyo-settle katikati isiguswe.
+
+    Returns idadi ya games zilizo-expire.
+    """
+    batch = expired_games(now).order_by().values('pk')[:batch_size]
+    expired = Game.objects.filter(pk__in=batch, status='OPEN').update(
+        status='EXPIRED', settled_at=now
+    )
+    # update() haitumi post_save signals
+    if expired:
+        invalidate_bet_summary()
+    return expired
+
@@ -0,0 +1,80 @@
+# games/cache.py
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Max
+from django.utils.http import parse_etags
+
+BET_SUMMARY_VERSION_KEY = 'games:bet-summary:version'
+
+
+def bet_summary_timeout():
+    return getattr(settings, 'BET_SUMMARY_CACHE_TIMEOUT', 5)
+
+
+def bet_summary_key(*parts):
+    """
+    Cache key for one summary page. The version changes on every Game/Match write,
+    so old pages are never read again and simply expire.
+
+    The version lives in the default cache, so a write only invalidates the
+    processes that share it: with REDIS_URL that is every worker, with the
+    per-process LocMemCache fallback only the writer's own worker - other
+    workers serve their page until BET_SUMMARY_CACHE_TIMEOUT expires.
+    """
+    version = cache.get_or_set(BET_SUMMARY_VERSION_KEY, time.time_ns(), None)
+    return 'games:bet-summary:{}:{}'.format(version, ':'.join(str(p) for p in parts))
+
+
+async def abet_summary_key(*parts):
+    """bet_summary_key() kwa async views"""
+    version = await cache.aget_or_set(BET_SUMMARY_VERSION_KEY, time.time_ns(), None)
+    return 'games:bet-summary:{}:{}'.format(version, ':'.join(str(p) for p in parts))
+
+
+def invalidate_bet_summary():
+    """
+    Call after any Game write that bypasses signals (bulk_update, queryset.update).
+    Reaches other workers only through a shared cache - see bet_summary_key()
+    """
+    cache.set(BET_SUMMARY_VERSION_KEY, time.time_ns(), None)
+
+
+# ============================================
+# CONDITIONAL GET - fixture lists
+# ============================================
+def fixture_list_etag(model, variant='', queryset=None):
+    """
+    ETag ya bei nafuu kwa list ya fixtures: max(updated_at) + count() kwa query
+    moja. Insert/update hubadilisha max(updated_at), delete hubadilisha count.
+    `variant` (query string) inatenganisha responses tofauti za URL moja.
+    `queryset` (list iliyochujwa) inafanya aggregate isome dirisha tu.
+    """
+    queryset = model.objects.all() if queryset is None else queryset
+    state = queryset.aggregate(last_updated=Max('updated_at'), total=Count('*'))
+    return etag_from_state(model, state, variant)
+
+
+async def afixture_list_etag(model, variant='', queryset=None):
+    """fixture_list_etag() kwa async views"""
+    queryset = model.objects.all() if queryset is None else queryset
+    state = await queryset.aaggregate(last_updated=Max('updated_at'), total=Count('*'))
+    return etag_from_state(model, state, variant)
+
+
+def etag_from_state(model, state, variant):
+    last_updated = state['last_updated'].isoformat() if state['last_updated'] else '-'
+    raw = f"{model._meta.label}:{last_updated}:{state['total']}:{variant}"
+    return '"{}"'.format(hashlib.md5(raw.encode(), usedforsecurity=False).hexdigest())
+
+
+def not_modified(request, etag):
+    """True kama client tayari ana version hii (If-None-Match)"""
+    if_none_match = request.headers.get('If-None-Match')
+    if not if_none_match:
+        return False
+    etags = parse_etags(if_none_match)
+    # Weak comparison (RFC 9110): W/"x" inalingana na "x"
+    return '*' in etags or etag in (e.removeprefix('W/') for e in etags)
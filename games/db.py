@@ -0,0 +1,140 @@
+# games/db.py
+"""
+Database plumbing:
+
+- Connection setup ya SQLite: SQLITE_PRAGMAS (busy_timeout, synchronous,
+  mmap_size, cache_size) zinawekwa kwenye kila connection mpya. SQLITE_JOURNAL_MODE
+  (WAL) ni ya file la database - set_journal_mode() inaiweka server inapoanza.
+- Read/write split: GET/HEAD/OPTIONS zinasoma kutoka REPLICA_DATABASE, writes zote
+  (na reads za request ya write) zinaenda kwenye primary. Client aliyeandika
+  anasomeshwa primary kwa REPLICA_PIN_SECONDS (read-your-writes).
+"""
+import sqlite3
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+REPLICA_PIN_COOKIE = 'primary_pin'
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+# Nje ya requests (management commands, shell, tests) reads zinabaki primary
+_read_from_replica = ContextVar('read_from_replica', default=False)
+
+
+@receiver(connection_created)
+def apply_sqlite_pragmas(sender, connection, **kwargs):
+    if connection.vendor != 'sqlite':
+        return
+    for name, value in getattr(settings, 'SQLITE_PRAGMAS', {}).items():
+        # Moja kwa moja kwenye sqlite3 connection - si query ya app (haiingii debug log)
+        connection.connection.execute(f'PRAGMA {name} = {value}')
+
+
+def set_journal_mode():
+    """
+    PRAGMA journal_mode kwa kila SQLite database (file). Inaitwa na wsgi.py/asgi.py
+    kabla ya workers kupokea requests; connection inafungwa ili isirithiwe na fork
+    """
+    mode = getattr(settings, 'SQLITE_JOURNAL_MODE', None)
+    if not mode:
+        return
+    for alias in connections:
+        connection = connections[alias]
+        if connection.vendor != 'sqlite' or connection.is_in_memory_db():
+            continue
+        with connection.cursor() as cursor:
+            cursor.execute(f'PRAGMA journal_mode = {mode}')
+        connection.close()
+
+
+def replica_alias():
+    return getattr(settings, 'REPLICA_DATABASE', None)
+
+
+def pin_seconds():
+    return getattr(settings, 'REPLICA_PIN_SECONDS', 5)
+
+
+class PrimaryReplicaRouter:
+    """Reads za requests salama -> replica; kila kitu kingine -> primary (default)"""
+
+    def db_for_read(self, model, **hints):
+        replica = replica_alias()
+        if replica and _read_from_replica.get():
+            return replica
+        return DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replica ni nakala ya primary - objects za pande zote ni data ile ile
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Replica inapata schema kwa kunakili primary (sync_replica)
+        return db != replica_alias()
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Inaamua kwa kila request kama reads ziende replica. Request ya write (au ya
+    client mwenye pin cookie) inasoma primary; write iliyofaulu inaweka pin cookie.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        token = _read_from_replica.set(self.use_replica(request))
+        try:
+            response = self.get_response(request)
+        finally:
+            _read_from_replica.reset(token)
+        return self.pin(request, response)
+
+    async def __acall__(self, request):
+        token = _read_from_replica.set(self.use_replica(request))
+        try:
+            response = await self.get_response(request)
+        finally:
+            _read_from_replica.reset(token)
+        return self.pin(request, response)
+
+    def use_replica(self, request):
+        return (
+            replica_alias() is not None
+            and request.method in SAFE_METHODS
+            and REPLICA_PIN_COOKIE not in request.COOKIES
+        )
+
+    def pin(self, request, response):
+        if replica_alias() and request.method not in SAFE_METHODS and response.status_code < 400:
+            response.set_cookie(
+                REPLICA_PIN_COOKIE, '1', max_age=pin_seconds(), httponly=True, samesite='Lax'
+            )
+        return response
+
+
+def copy_database(source, target):
+    """
+    Nakala kamili na consistent ya SQLite file (backup API) - replica ya muda
+    kwa local testing. Readers wa target wanaona snapshot ya zamani au mpya, si nusu.
+    """
+    source_db = sqlite3.connect(source)
+    target_db = sqlite3.connect(target)
+    try:
+        source_db.backup(target_db)
+    finally:
+        target_db.close()
+        source_db.close()
@@ -0,0 +1,95 @@
+# games/filters.py
+"""
+Filters za fixture lists (GET /api/fixtures/, /api/efootball/):
+
+    ?date=YYYY-MM-DD                 siku moja
+    ?date_from=...&date_to=...       dirisha la siku (inclusive)
+    ?league=X (inaweza kurudiwa)     ligi moja au zaidi
+    ?kickoff_after=YYYY-MM-DDTHH:MM  mechi zinazoanza muda huu au baadaye
+    ?upcoming=false                  zima default (fixtures zote, hata za zamani)
+
+Bila filter ya tarehe list ni ya mechi zijazo tu (kickoff_after = sasa). Filters
+zote ni range scans za indexes (date, time) na (league, date), hivyo gharama
+inategemea ukubwa wa dirisha - si idadi ya fixtures za zamani zilizohifadhiwa.
+"""
+import json
+from datetime import date, datetime
+
+from django.utils import timezone
+
+
+class InvalidFixtureFilter(ValueError):
+    pass
+
+
+FALSE_VALUES = ('0', 'false', 'no')
+
+
+def parse_date(params, name):
+    value = params.get(name)
+    if value is None:
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise InvalidFixtureFilter(f'{name} must be a date (YYYY-MM-DD)')
+
+
+def parse_kickoff(value):
+    """ISO datetime; bila timezone ni saa za TIME_ZONE kama date/time za fixtures"""
+    try:
+        moment = datetime.fromisoformat(value)
+    except ValueError:
+        raise InvalidFixtureFilter('kickoff_after must be a datetime (YYYY-MM-DDTHH:MM)')
+    if timezone.is_aware(moment):
+        moment = timezone.make_naive(moment)
+    return moment
+
+
+def fixture_window(params):
+    """
+    Query params -> dict ya filters (date_from, date_to, leagues, kickoff_after).
+    Default ya kickoff_after imekatwa kwenye dakika ili ETag ibaki ile ile ndani
+    ya dakika moja.
+    """
+    day = parse_date(params, 'date')
+    date_from = parse_date(params, 'date_from')
+    date_to = parse_date(params, 'date_to')
+    if day is not None:
+        date_from = date_to = day
+
+    kickoff_after = params.get('kickoff_after')
+    if kickoff_after is not None:
+        kickoff_after = parse_kickoff(kickoff_after)
+    elif date_from is None and date_to is None and params.get('upcoming', '').lower() not in FALSE_VALUES:
+        kickoff_after = timezone.localtime().replace(tzinfo=None, second=0, microsecond=0)
+
+    return {
+        'date_from': date_from,
+        'date_to': date_to,
+        # ?league= tupu ni sawa na kutotuma filter
+        'leagues': sorted({league for league in params.getlist('league') if league.strip()}),
+        'kickoff_after': kickoff_after,
+    }
+
+
+def filter_fixtures(queryset, window):
+    if window['leagues']:
+        queryset = queryset.filter(league__in=window['leagues'])
+    if window['date_from'] is not None:
+        queryset = queryset.filter(date__gte=window['date_from'])
+    if window['date_to'] is not None:
+        queryset = queryset.filter(date__lte=window['date_to'])
+
+    kickoff = window['kickoff_after']
+    if kickoff is not None:
+        # date >= d AND NOT (date = d AND time < t): range scan ya index, si OR
+        queryset = queryset.filter(date__gte=kickoff.date()).exclude(
+            date=kickoff.date(), time__lt=kickoff.time()
+        )
+    return queryset
+
+
+def window_key(window):
+    """Sehemu ya ETag variant - filters zilizotumika kweli (pamoja na default ya sasa)"""
+    return json.dumps(window, default=str)
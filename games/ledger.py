@@ -0,0 +1,134 @@
+# games/ledger.py
+"""
+Balance ledger: kila mabadiliko ni INSERT ya BalanceEntry (hakuna read-modify-write).
+Balance.amount ni snapshot inayosogezwa kwa F() expression kila baada ya
+BALANCE_SNAPSHOT_EVERY entries, hivyo read ni snapshot + entries chache za karibuni.
+"""
+from decimal import Decimal
+
+from django.conf import settings
+from django.db import connections, router, transaction
+from django.db.models import Count, F, Max, Sum
+from django.utils import timezone
+
+from .models import Balance, BalanceEntry
+
+
+class InsufficientBalance(ValueError):
+    pass
+
+
+def snapshot_every():
+    return getattr(settings, 'BALANCE_SNAPSHOT_EVERY', 100)
+
+
+def get_balance():
+    """Get or create the single balance record (snapshot tu, bila entries mpya)"""
+    balance = Balance.objects.order_by('pk').first()
+    if not balance:
+        # Replica inaweza kuchelewa - angalia primary kabla ya kuunda ya pili
+        primary = Balance.objects.db_manager(router.db_for_write(Balance))
+        balance = primary.order_by('pk').first() or primary.create(amount=0.00, currency='TSh')
+    return balance
+
+
+def recent_entries(balance):
+    """Jumla ya entries ambazo bado hazijaingia kwenye snapshot - index seek moja"""
+    return BalanceEntry.objects.filter(
+        balance_id=balance.pk, id__gt=balance.snapshot_entry_id
+    ).aggregate(
+        total=Sum('delta'), count=Count('*'), last_id=Max('id'), last_at=Max('created_at')
+    )
+
+
+def with_current_amount(balance):
+    """
+    Weka balance halisi kwenye instance (kwa kusoma/serializer tu).
+    Usiite save() kwenye instance hii - tumia apply_delta()/set_amount()
+    """
+    recent = recent_entries(balance)
+    if recent['count']:
+        balance.amount += recent['total']
+        balance.updated_at = max(balance.updated_at, recent['last_at'])
+    return balance
+
+
+def apply_delta(balance, delta, reason=''):
+    """
+    Credit (delta > 0) ni INSERT moja tu. Debit (delta < 0) ni INSERT ... SELECT moja
+    yenye sharti la balance halisi + delta >= 0 - hakuna lock wala read tofauti,
+    na debit isiyotosha inakataliwa kwa InsufficientBalance
+    """
+    if delta < 0:
+        entry = insert_debit(balance.pk, delta, reason)
+    else:
+        entry = BalanceEntry.objects.create(balance_id=balance.pk, delta=delta, reason=reason)
+    if entry.id - balance.snapshot_entry_id >= snapshot_every():
+        take_snapshot(balance.pk)
+    return entry
+
+
+def insert_debit(balance_pk, delta, reason):
+    """
+    Snapshot + entries mpya + delta zinahesabiwa ndani ya statement ile ile ya INSERT,
+    hivyo debit mbili za wakati mmoja haziwezi kushusha balance chini ya sifuri.
+    Row 0 zilizoingizwa = balance haitoshi
+    """
+    entry = BalanceEntry(balance_id=balance_pk, delta=delta, reason=reason, created_at=timezone.now())
+    connection = connections[router.db_for_write(BalanceEntry)]
+    quote = connection.ops.quote_name
+    entries, balances = quote(BalanceEntry._meta.db_table), quote(Balance._meta.db_table)
+    fields = [BalanceEntry._meta.get_field(name) for name in ('balance', 'delta', 'reason', 'created_at')]
+    columns = ', '.join(quote(field.column) for field in fields)
+    values = [field.get_db_prep_save(getattr(entry, field.attname), connection) for field in fields]
+    # ROUND: SQLite inahifadhi decimal kama REAL - jumla kama -1e-13 isihesabiwe hasi
+    sql = f"""
+        INSERT INTO {entries} ({columns})
+        SELECT %s, %s, %s, %s FROM {balances} b
+        WHERE b.id = %s AND ROUND(b.amount + COALESCE((
+            SELECT SUM(e.delta) FROM {entries} e
+            WHERE e.balance_id = b.id AND e.id > b.snapshot_entry_id
+        ), 0) + %s, 2) >= 0
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [*values, balance_pk, values[1]])
+        if not cursor.rowcount:
+            raise InsufficientBalance('Balance cannot be negative')
+        entry.id = connection.ops.last_insert_id(cursor, BalanceEntry._meta.db_table, 'id')
+    entry._state.adding = False
+    entry._state.db = connection.alias
+    return entry
+
+
+def set_amount(balance_pk, amount, reason='adjustment'):
+    """
+    Weka balance kamili (PUT/PATCH) kama entry ya tofauti na balance halisi.
+    Row ya Balance ina-lock ili PUT mbili zisihesabu tofauti ile ile mara mbili;
+    deltas za apply_delta() haziguswi na lock hii.
+    """
+    with transaction.atomic():
+        balance = with_current_amount(Balance.objects.select_for_update().get(pk=balance_pk))
+        delta = Decimal(amount) - balance.amount
+        if not delta:
+            return None
+        return BalanceEntry.objects.create(balance_id=balance_pk, delta=delta, reason=reason)
+
+
+def take_snapshot(balance_pk):
+    """
+    Hamisha entries mpya kwenye Balance.amount kwa UPDATE moja ya F() expression.
+    Sharti la snapshot_entry_id linazuia snapshot mbili kuhesabu entries zile zile.
+    (SQLite ina writer mmoja, hivyo hakuna entry ya id ndogo inayo-commit baadaye)
+    """
+    with transaction.atomic():
+        balance = Balance.objects.only('id', 'snapshot_entry_id').get(pk=balance_pk)
+        recent = recent_entries(balance)
+        if not recent['count']:
+            return 0
+        return Balance.objects.filter(
+            pk=balance_pk, snapshot_entry_id=balance.snapshot_entry_id
+        ).update(
+            amount=F('amount') + recent['total'],
+            snapshot_entry_id=recent['last_id'],
+            updated_at=recent['last_at'],
+        )
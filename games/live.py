@@ -0,0 +1,181 @@
+# games/live.py
+"""
+Server-push ya odds (Server-Sent Events) kwa fixture lists.
+
+Kila save/bulk write ya MatchFixture/Efootbal ina-publish rows zilizobadilika tu
+kwenye hub baada ya transaction ku-commit. Stream endpoints (async views, ASGI tu)
+zinasubscribe kwenye hub na kutuma kila event kwa client.
+
+Hub inachaguliwa kwa FIXTURE_PUSH_HUB (dotted path). InProcessHub inafanya kazi
+ndani ya worker mmoja; hub ya broker (mf. Redis pub/sub kwa workers wengi) inahitaji
+methods zile zile: subscribe(channel), unsubscribe(subscription), publish(channel,
+message) na has_subscribers(channel).
+"""
+import asyncio
+import json
+import threading
+from collections import defaultdict
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.core.handlers.asgi import ASGIRequest
+from django.db import transaction
+from django.http import JsonResponse, StreamingHttpResponse
+from django.utils.module_loading import import_string
+
+from .serializers import fixture_rows, fixture_rows_from_objects
+
+# Message maalum: subscriber amechelewa (queue imejaa) - client asome list upya
+RESYNC = b'event: resync\ndata: {}\n\n'
+
+
+def queue_size():
+    return getattr(settings, 'FIXTURE_PUSH_QUEUE_SIZE', 100)
+
+
+def keepalive_interval():
+    return getattr(settings, 'FIXTURE_PUSH_KEEPALIVE', 15)
+
+
+def fixture_channel(model):
+    return model._meta.label_lower
+
+
+class Subscription:
+    def __init__(self, channel, loop, maxsize):
+        self.channel = channel
+        self.loop = loop
+        self.queue = asyncio.Queue(maxsize)
+
+    def deliver(self, message):
+        """Inaitwa ndani ya loop ya subscriber tu"""
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # Subscriber mzito asizuie wengine: futa backlog yake, mwambie a-resync
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(RESYNC)
+
+    async def get(self):
+        return await self.queue.get()
+
+
+class InProcessHub:
+    """
+    Fan-out ndani ya process moja. publish() inaweza kuitwa kutoka thread yoyote
+    (sync views zinaendeshwa kwenye threads chini ya ASGI); kila event loop inapata
+    call_soon_threadsafe moja tu kwa kila message, si moja kwa kila subscriber.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = defaultdict(set)
+
+    def subscribe(self, channel):
+        """Lazima iitwe ndani ya event loop inayoendesha stream"""
+        subscription = Subscription(channel, asyncio.get_running_loop(), queue_size())
+        with self._lock:
+            self._subscribers[channel].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            self._subscribers[subscription.channel].discard(subscription)
+
+    def has_subscribers(self, channel):
+        return bool(self._subscribers.get(channel))
+
+    def subscriber_count(self, channel=None):
+        with self._lock:
+            if channel:
+                return len(self._subscribers.get(channel, ()))
+            return sum(len(subscribers) for subscribers in self._subscribers.values())
+
+    def publish(self, channel, message):
+        with self._lock:
+            by_loop = defaultdict(list)
+            for subscription in self._subscribers.get(channel, ()):
+                by_loop[subscription.loop].append(subscription)
+        for loop, subscriptions in by_loop.items():
+            try:
+                loop.call_soon_threadsafe(_deliver_all, subscriptions, message)
+            except RuntimeError:
+                # Loop imefungwa (worker ina-shutdown) - streams zake zimeshakufa
+                pass
+
+
+def _deliver_all(subscriptions, message):
+    for subscription in subscriptions:
+        subscription.deliver(message)
+
+
+@lru_cache(maxsize=None)
+def get_hub():
+    return import_string(getattr(settings, 'FIXTURE_PUSH_HUB', 'games.live.InProcessHub'))()
+
+
+def sse_message(event, data):
+    """SSE frame moja - ina-encode mara moja tu kwa subscribers wote"""
+    payload = json.dumps(data, cls=DjangoJSONEncoder, separators=(',', ':'))
+    return f'event: {event}\ndata: {payload}\n\n'.encode()
+
+
+def publish_fixture_changes(model, fixtures=(), pks=(), deleted=()):
+    """
+    Push rows zilizobadilika ('fixtures' event) na ids zilizofutwa ('deleted' event)
+    baada ya transaction ku-commit. Hakuna kazi kama hakuna subscriber.
+
+    `fixtures` ni instances kamili; `pks` ni rows zinazosomwa upya baada ya commit
+    (mf. upsert ambayo instance zake zina fields zilizotumwa tu).
+    """
+    hub = get_hub()
+    channel = fixture_channel(model)
+    if not hub.has_subscribers(channel) or not (fixtures or pks or deleted):
+        return
+    rows = fixture_rows_from_objects(fixtures)
+    pks, deleted = list(pks), list(deleted)
+
+    def send():
+        for start in range(0, len(pks), 500):
+            rows.extend(fixture_rows(model.objects.filter(pk__in=pks[start:start + 500]).order_by('pk')))
+        if rows:
+            hub.publish(channel, sse_message('fixtures', rows))
+        if deleted:
+            hub.publish(channel, sse_message('deleted', deleted))
+
+    transaction.on_commit(send)
+
+
+async def fixture_events(channel):
+    hub = get_hub()
+    subscription = hub.subscribe(channel)
+    try:
+        yield b'retry: 3000\n\n'
+        while True:
+            try:
+                message = await asyncio.wait_for(subscription.get(), keepalive_interval())
+            except asyncio.TimeoutError:
+                # Comment ya SSE - proxies zisifunge connection iliyokaa kimya
+                yield b': ping\n\n'
+                continue
+            yield message
+            if message is RESYNC:
+                return
+    finally:
+        # Client akikata, Django ina-cancel iterator hii chini ya ASGI
+        hub.unsubscribe(subscription)
+
+
+def fixture_stream_response(request, model):
+    if not isinstance(request, ASGIRequest):
+        # WSGI ingesoma stream nzima (isiyoisha) kwenye memory
+        return JsonResponse(
+            {'error': 'Streaming requires the ASGI server (vbclone_backend.asgi:application)'},
+            status=501
+        )
+    response = StreamingHttpResponse(fixture_events(fixture_channel(model)), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
@@ -0,0 +1,93 @@
+# games/log.py
+"""
+Logging ya views za fixtures bila kuzuia request.
+
+QueueLogHandler ni QueueHandler: request inaweka record kwenye queue tu (bila
+kuformat - prepare() ya QueueHandler ingeformat kwenye thread ya request), na
+thread ya QueueListener ndiyo inaformat na kuandika kwenye stdout. Stdout ya
+gunicorn ikiwa pipe iliyojaa, request haisubiri - queue ikijaa lines zinatupwa
+(zinahesabiwa kwenye `dropped`) badala ya kuzuia worker.
+
+Lines za kila item ya bulk request zinachujwa na `log_items()`: LOG_ITEM_SAMPLE_FIRST
+za kwanza, kisha moja kati ya kila LOG_ITEM_SAMPLE_EVERY. Jumla ya request iko
+kwenye summary line moja. Format ni key=value (logfmt) ili iweze kuchujwa.
+"""
+import atexit
+import logging
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+from django.conf import settings
+
+
+class QueueLogHandler(QueueHandler):
+    """
+    LOGGING = {'handlers': {'queue': {'()': 'games.log.QueueLogHandler', ...}}}
+    Formatter inatumika kwenye thread ya listener, si kwenye request.
+    """
+
+    def __init__(self, stream=None, maxsize=10000):
+        super().__init__(queue.Queue(maxsize))
+        self.target = logging.StreamHandler(stream)
+        self.dropped = 0
+        self.listener = None
+        self.start()
+
+    def start(self):
+        self.pid = os.getpid()
+        self.listener = QueueListener(self.queue, self.target)
+        self.listener.start()
+        atexit.register(self.stop)
+
+    def stop(self):
+        """Andika lines zilizobaki kwenye queue na simamisha thread"""
+        if self.listener is not None and self.pid == os.getpid():
+            self.listener.stop()
+            self.listener = None
+
+    def setFormatter(self, fmt):
+        self.target.setFormatter(fmt)
+
+    def prepare(self, record):
+        # Record yenyewe, si nakala iliyoformatiwa: queue ni ya threads za process
+        # hii, hivyo msg % args na formatter zinafanyika kwenye thread ya listener.
+        # Args za log lines ziwe values zisizobadilika (ids, counts, strings)
+        return record
+
+    def emit(self, record):
+        if self.pid != os.getpid():
+            # Process mpya baada ya fork (gunicorn --preload): thread haikurithiwa,
+            # na lock za queue ya zamani zinaweza kuwa zimeshikwa
+            self.queue = queue.Queue(self.queue.maxsize)
+            self.start()
+        super().emit(record)
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def item_sample():
+    return (
+        getattr(settings, 'LOG_ITEM_SAMPLE_FIRST', 5),
+        getattr(settings, 'LOG_ITEM_SAMPLE_EVERY', 100),
+    )
+
+
+def sampled(items):
+    """Items za kwanza LOG_ITEM_SAMPLE_FIRST, kisha moja kati ya kila LOG_ITEM_SAMPLE_EVERY"""
+    first, every = item_sample()
+    for position, item in enumerate(items):
+        if position < first or (every and position % every == 0):
+            yield item
+
+
+def log_items(logger, level, msg, items, fields):
+    """Line moja kwa kila item iliyochaguliwa na sampled(); `fields(item)` -> args za msg"""
+    if not logger.isEnabledFor(level):
+        return
+    for item in sampled(items):
+        logger.log(level, msg, *fields(item))
@@ -0,0 +1,122 @@
+# games/management/benchmarks.py
+"""
+Helpers za management commands za benchmark (bench_*).
+
+Benchmarks nyingi zinaandika data ndani ya transaction ambayo ina-rollback
+mwishoni. Zinazopima autocommit yenyewe (bench_fixture_bulk_update,
+bench_bet_placement) au zinazohitaji data iliyo-commit kwa process/threads
+nyingine (bench_async_reads) zinafuta data kwenye `finally` - crash au Ctrl-C
+inaweza kuacha rows, hivyo zinakataa kuendeshwa kwenye database yenye data
+(require_scratch_database). Tumia database ya muda:
+
+    SQLITE_PATH=/tmp/bench.sqlite3 python manage.py migrate
+    SQLITE_PATH=/tmp/bench.sqlite3 python manage.py bench_bet_placement
+"""
+import io
+import sys
+import time as timer
+from datetime import date, time, timedelta
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.management.base import CommandError
+
+from games.models import MatchFixture
+
+
+def require_scratch_database(*models):
+    """Benchmark ya autocommit: database isiwe ya production wala iwe na data"""
+    if not settings.DEBUG:
+        raise CommandError('Autocommit benchmarks do not run with DEBUG=False (production settings)')
+    for model in models:
+        if model.objects.exists():
+            raise CommandError(
+                f'{model._meta.db_table} already has rows - run this benchmark against an empty '
+                'database (SQLITE_PATH=/tmp/bench.sqlite3 manage.py migrate)'
+            )
+
+
+def seed_fixtures(rows, model=MatchFixture):
+    start = model.objects.order_by('-eventId').values_list('eventId', flat=True).first() or 0
+    return model.objects.bulk_create([
+        model(
+            eventId=start + i + 1,
+            time=time(12 + i % 10, (i * 7) % 60),
+            date=date(2026, 1, 1) + timedelta(days=i % 365),
+            homeTeam=f'Home {i}',
+            awayTeam=f'Away {i}',
+            league=f'League {i % 40}',
+            homeOdds=Decimal('1.50') + i % 300 / Decimal(100),
+            drawOdds=Decimal('3.10'),
+            awayOdds=Decimal('4.25'),
+            homeOddsFire=i % 3 == 0,
+            hasBoostedOdds=i % 11 == 0,
+            betCount=i % 500,
+        )
+        for i in range(rows)
+    ], batch_size=500)
+
+
+def fixture_payload(fixture, **changes):
+    """Request body ya fixture moja kama frontend inavyotuma"""
+    payload = {
+        'id': fixture.pk,
+        'eventId': fixture.eventId,
+        'time': fixture.time.isoformat(),
+        'date': fixture.date.isoformat(),
+        'homeTeam': fixture.homeTeam,
+        'awayTeam': fixture.awayTeam,
+        'league': fixture.league,
+        'homeOdds': {'value': str(fixture.homeOdds), 'hasFireIcon': fixture.homeOddsFire},
+        'drawOdds': {'value': str(fixture.drawOdds), 'hasFireIcon': fixture.drawOddsFire},
+        'awayOdds': {'value': str(fixture.awayOdds), 'hasFireIcon': fixture.awayOddsFire},
+        'betCount': fixture.betCount,
+    }
+    payload.update(changes)
+    return payload
+
+
+def timed(fn):
+    started = timer.perf_counter()
+    result = fn()
+    return timer.perf_counter() - started, result
+
+
+def best_of(repeat, fn):
+    return min(timed(fn)[0] for _ in range(repeat))
+
+
+def delete_fixtures(fixtures, model=MatchFixture):
+    pks = [fixture.pk for fixture in fixtures]
+    for start in range(0, len(pks), 500):
+        model.objects.filter(pk__in=pks[start:start + 500]).delete()
+
+
+def wsgi_environ(path, method='GET', body=b''):
+    """WSGI environ ya request moja - kwa kuita WSGIHandler bila server"""
+    path, _, query = path.partition('?')
+    return {
+        'REQUEST_METHOD': method,
+        'PATH_INFO': path,
+        'QUERY_STRING': query,
+        'SCRIPT_NAME': '',
+        'SERVER_NAME': 'localhost',
+        'SERVER_PORT': '80',
+        'SERVER_PROTOCOL': 'HTTP/1.1',
+        'HTTP_HOST': 'localhost',
+        'CONTENT_TYPE': 'application/json',
+        'CONTENT_LENGTH': str(len(body)),
+        'wsgi.version': (1, 0),
+        'wsgi.url_scheme': 'http',
+        'wsgi.input': io.BytesIO(body),
+        'wsgi.errors': sys.stderr,
+        'wsgi.multithread': True,
+        'wsgi.multiprocess': False,
+        'wsgi.run_once': False,
+    }
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[max(int(len(values) * fraction) - 1, 0)] if values else 0
+
@@ -0,0 +1,199 @@
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.handlers.asgi import ASGIHandler
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from effootball.models import Efootbal
+from games.management.benchmarks import delete_fixtures, require_scratch_database, seed_fixtures, wsgi_environ
+from games.models import Game, Match, MatchFixture
+
+
+def asgi_scope(path):
+    path, _, query = path.partition('?')
+    return {
+        'type': 'http',
+        'asgi': {'version': '3.0'},
+        'http_version': '1.1',
+        'method': 'GET',
+        'scheme': 'http',
+        'path': path,
+        'raw_path': path.encode(),
+        'root_path': '',
+        'query_string': query.encode(),
+        'headers': [(b'host', b'localhost')],
+        'client': ('127.0.0.1', 50000),
+        'server': ('localhost', 80),
+    }
+
+
+class SyncDeployment:
+    """Stand-in ya gunicorn sync workers: threads `workers`, request moja kwa kila thread"""
+
+    def __init__(self, workers):
+        self.app = WSGIHandler()
+        self.pool = ThreadPoolExecutor(workers)
+
+    def get_blocking(self, path):
+        statuses = []
+        response = self.app(wsgi_environ(path), lambda status, headers: statuses.append(status))
+        b''.join(response)
+        response.close()
+        assert statuses[0].startswith('200'), f'{path}: {statuses[0]}'
+
+    async def get(self, path):
+        await asyncio.get_running_loop().run_in_executor(self.pool, self.get_blocking, path)
+
+
+class AsyncDeployment:
+    """ASGI app moja kwenye event loop moja (worker mmoja wa uvicorn)"""
+
+    def __init__(self):
+        self.app = ASGIHandler()
+
+    async def get(self, path):
+        sent = False
+        finished = asyncio.Event()
+        status = []
+
+        async def receive():
+            nonlocal sent
+            if not sent:
+                sent = True
+                return {'type': 'http.request', 'body': b'', 'more_body': False}
+            await finished.wait()
+            return {'type': 'http.disconnect'}
+
+        async def send(message):
+            if message['type'] == 'http.response.start':
+                status.append(message['status'])
+            elif not message.get('more_body'):
+                finished.set()
+
+        await self.app(asgi_scope(path), receive, send)
+        assert status == [200], f'{path}: {status}'
+
+
+async def load(deployment, path, concurrency, requests):
+    """Clients `concurrency` wanatuma requests mfululizo hadi `requests` zote ziishe"""
+    remaining = iter(range(requests))
+    latencies = []
+
+    async def client():
+        for _ in remaining:
+            started = time.perf_counter()
+            await deployment.get(path)
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return requests / elapsed, latencies[int(len(latencies) * 0.99) - 1] * 1000, statistics.median(latencies) * 1000
+
+
+class Command(BaseCommand):
+    help = (
+        'Benchmark ya read endpoints: APIViews za sync (WSGI, threads --workers) dhidi ya '
+        'async views (ASGI, event loop moja) kwa clients 100 na 1000 kwa wakati mmoja. '
+        'Kila deployment inaendeshwa kwenye process yake; data ya muda inafutwa mwishoni.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--concurrency', type=int, nargs='+', default=[100, 1000])
+        parser.add_argument('--requests', type=int, default=2000, help='Requests kwa kila endpoint na concurrency')
+        parser.add_argument('--workers', type=int, default=4, help='Sync worker threads')
+        parser.add_argument('--run', choices=['sync', 'async'], help=('Ndani: endesha deployment moja na '
+                                                                       'uchapishe JSON'))
+        parser.add_argument('--paths', nargs='+')
+
+    def handle(self, *args, **options):
+        if options['run']:
+            return self.run_deployment(options)
+
+        require_scratch_database(Game, MatchFixture, Efootbal)
+        games, fixtures, efootball = self.seed()
+        paths = [
+            '/api/bets/?limit=20',
+            f'/api/bets/{games[0].id}/',
+            '/api/bets/filter/summary/',
+            '/api/fixtures/',
+            '/api/efootball/',
+        ]
+        try:
+            results = {mode: self.spawn(mode, paths, options) for mode in ('sync', 'async')}
+        finally:
+            for start in range(0, len(games), 500):
+                Game.objects.filter(pk__in=[g.pk for g in games[start:start + 500]]).delete()
+            delete_fixtures(fixtures)
+            delete_fixtures(efootball, Efootbal)
+
+        self.stdout.write(
+            f'{options["requests"]} GETs per cell; sync = {options["workers"]} WSGI worker threads, '
+            'async = one ASGI event loop (both single process):'
+        )
+        self.stdout.write(
+            f'  {"endpoint":<28}{"clients":>8}  {"sync req/s":>10}  {"async req/s":>11}  '
+            f'{"sync p99 ms":>11}  {"async p99 ms":>12}'
+        )
+        for path in paths:
+            for concurrency in options['concurrency']:
+                key = f'{path} {concurrency}'
+                sync, async_ = results['sync'][key], results['async'][key]
+                label = path if len(path) <= 27 else path[:24] + '...'
+                self.stdout.write(
+                    f'  {label:<28}{concurrency:>8}  {sync[0]:>10.0f}  {async_[0]:>11.0f}  '
+                    f'{sync[1]:>11.0f}  {async_[1]:>12.0f}'
+                )
+
+    def seed(self):
+        active_until = timezone.now() + timedelta(days=1)
+        games = Game.objects.bulk_create([
+            Game(stake=Decimal('1000.00'), odds=Decimal('3.38'), total_odds=Decimal('3.38'),
+                 active_until=active_until, status='OPEN' if i % 3 else 'SETTLED')
+            for i in range(500)
+        ])
+        Match.objects.bulk_create([
+            Match(game=game, match_ref=f'M{leg:03}', teams='Simba vs Yanga', market='1X2',
+                  selection='Simba', odds=Decimal('1.50'))
+            for game in games for leg in range(1, 4)
+        ], batch_size=500)
+        return games, seed_fixtures(300), seed_fixtures(300, Efootbal)
+
+    def spawn(self, mode, paths, options):
+        """Process mpya kwa kila deployment (URLconf inachaguliwa na ASYNC_READ_VIEWS)"""
+        env = dict(os.environ, ASYNC_READ_VIEWS='1' if mode == 'async' else '0')
+        command = [
+            sys.executable, sys.argv[0], 'bench_async_reads', '--run', mode,
+            '--requests', str(options['requests']), '--workers', str(options['workers']),
+            '--concurrency', *map(str, options['concurrency']), '--paths', *paths,
+        ]
+        output = subprocess.run(command, env=env, check=True, capture_output=True, text=True).stdout
+        return json.loads(output.strip().splitlines()[-1])
+
+    def run_deployment(self, options):
+        assert settings.ASYNC_READ_VIEWS == (options['run'] == 'async')
+        deployment = SyncDeployment(options['workers']) if options['run'] == 'sync' else AsyncDeployment()
+
+        async def run():
+            results = {}
+            for path in options['paths']:
+                await load(deployment, path, 10, 50)  # warm-up
+                for concurrency in options['concurrency']:
+                    results[f'{path} {concurrency}'] = await load(
+                        deployment, path, concurrency, options['requests']
+                    )
+            return results
+
+        self.stdout.write(json.dumps(asyncio.run(run())))
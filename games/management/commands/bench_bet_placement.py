@@ -0,0 +1,82 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from games.management.benchmarks import require_scratch_database, timed
+from games.models import Game, Match
+from games.serializers import CreateBetSerializer
+
+
+class LegacyCreateBetSerializer(CreateBetSerializer):
+    """create() ya zamani: float odds, Match.objects.create kwa kila leg, autocommit"""
+
+    def create(self, validated_data):
+        matches_data = validated_data.pop('matches', [])
+        total_odds = 1
+        for match in matches_data:
+            total_odds *= float(match['odds'])
+
+        game = Game.objects.create(
+            **validated_data,
+            active_until=timezone.now() + timedelta(days=1),  # NOT NULL
+            total_odds=round(total_odds, 2),
+            odds=round(total_odds, 2),
+            status='OPEN',
+            result='PENDING'
+        )
+        for match_data in matches_data:
+            Match.objects.create(game=game, **match_data)
+        return game
+
+
+def bet_payload(legs):
+    return {
+        'stake': '1000.00',
+        'matches': [
+            {'match_ref': f'M{i:03}', 'teams': f'Team {i} vs Team {i + 1}', 'market': '1X2',
+             'selection': 'Home', 'odds': '1.10'}
+            for i in range(1, legs + 1)
+        ],
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        'Benchmark bet placement (CreateBetSerializer) kwa legs 1/10/30: zamani dhidi ya '
+        'transaction + bulk_create. Bets za muda zinafutwa mwishoni - database isiwe na bets.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--legs', type=int, nargs='+', default=[1, 10, 30])
+        parser.add_argument('--bets', type=int, default=200)
+
+    def place(self, serializer_class, payload, bets):
+        ids = []
+        for _ in range(bets):
+            serializer = serializer_class(data=payload)
+            serializer.is_valid(raise_exception=True)
+            ids.append(serializer.save().id)
+        return ids
+
+    def handle(self, *args, **options):
+        require_scratch_database(Game, Match)
+        bets = options['bets']
+        self.stdout.write(f'{bets} bets per run (validate + save, autocommit):')
+        self.stdout.write(f'  {"legs":>4}  {"legacy bets/s":>14}  {"new bets/s":>11}  speedup')
+
+        for legs in options['legs']:
+            payload = bet_payload(legs)
+            created = []
+            try:
+                legacy, ids = timed(lambda: self.place(LegacyCreateBetSerializer, payload, bets))
+                created += ids
+                new, ids = timed(lambda: self.place(CreateBetSerializer, payload, bets))
+                created += ids
+            finally:
+                for start in range(0, len(created), 500):
+                    Game.objects.filter(pk__in=created[start:start + 500]).delete()
+
+            self.stdout.write(
+                f'  {legs:>4}  {bets / legacy:>14.0f}  {bets / new:>11.0f}  {legacy / new:.1f}x'
+            )
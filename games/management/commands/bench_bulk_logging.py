@@ -0,0 +1,117 @@
+import io
+import json
+import logging
+import subprocess
+import sys
+from contextlib import redirect_stdout
+from datetime import date, time, timedelta
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import RequestFactory
+
+from games.log import QueueLogHandler, sampled
+from games.management.benchmarks import best_of, fixture_payload
+from games.models import MatchFixture
+from games.views import MatchFixtureBulkCreateView
+
+
+def feed(items):
+    start = MatchFixture.objects.order_by('-eventId').values_list('eventId', flat=True).first() or 0
+    return [
+        {**fixture_payload(MatchFixture(
+            eventId=start + i + 1, time=time(12 + i % 10, (i * 7) % 60),
+            date=date(2026, 1, 1) + timedelta(days=i % 365), homeTeam=f'Home {i}', awayTeam=f'Away {i}',
+            league=f'League {i % 40}', homeOdds=Decimal('1.85'), drawOdds=Decimal('3.10'),
+            awayOdds=Decimal('4.25'), betCount=0,
+        )), 'id': None}
+        for i in range(items)
+    ]
+
+
+class Command(BaseCommand):
+    help = (
+        'Benchmark ya handler time ya POST /api/fixtures/bulk/: print() ya zamani (payload na '
+        'lines 2 kwa kila item) dhidi ya QueueLogHandler (LOG_LEVEL INFO na DEBUG). Output '
+        'inaenda kwenye pipe inayosomwa na process nyingine, kama stdout ya gunicorn. '
+        'Fixtures zinaandikwa ndani ya transaction inayo-rollback.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--items', type=int, default=5000)
+        parser.add_argument('--repeat', type=int, default=3)
+        parser.add_argument(
+            '--slow-reader-kbps', type=int, default=2000,
+            help='Kasi ya reader wa pili (log shipper aliyezidiwa); reader wa kwanza ni cat'
+        )
+
+    def handle(self, *args, **options):
+        items, repeat, kbps = options['items'], options['repeat'], options['slow_reader_kbps']
+        # Reader anasoma 4KB, kisha analala - pipe ikijaa print() inasubiri
+        throttled = [
+            sys.executable, '-c',
+            f'import sys, time\nwhile sys.stdin.buffer.read1(4096): time.sleep({4 / kbps})',
+        ]
+        for name, command in (('cat', ['cat']), (f'{kbps} KB/s', throttled)):
+            results = self.run_modes(command, items, repeat)
+            baseline = results[0][1]
+            self.stdout.write(
+                f'Bulk create of {items} fixtures, stdout pipe reader {name}, handler time, best of {repeat}:'
+            )
+            self.stdout.write(f'  {"logging":<18}{"lines":>7}  {"ms":>8}  {"vs none":>8}')
+            for mode, seconds, lines in results:
+                self.stdout.write(f'  {mode:<18}{lines:>7}  {seconds * 1000:>8.1f}  {seconds / baseline:>7.2f}x')
+
+    def run_modes(self, command, items, repeat):
+        reader = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL)
+        pipe = io.TextIOWrapper(reader.stdin, encoding='utf-8', line_buffering=True)
+        games_logger = logging.getLogger('games')
+        saved = games_logger.handlers, games_logger.level
+        view = MatchFixtureBulkCreateView.as_view()
+        factory = RequestFactory()
+
+        try:
+            with transaction.atomic():
+                body = json.dumps(feed(items))
+
+                def bulk_create():
+                    with transaction.atomic():
+                        response = view(factory.post('/api/fixtures/bulk/', body, content_type='application/json'))
+                        response.render()
+                        transaction.set_rollback(True)
+                    assert response.status_code == 201, response.status_code
+
+                def legacy():
+                    # Prints za view ya zamani, kwa idadi na maudhui yale yale
+                    with redirect_stdout(pipe):
+                        print('📥 Bulk create received:', items)
+                        for index, item in enumerate(json.loads(body)):
+                            print(f'Processing fixture {index}:', item)
+                            print(f'✅ Created fixture {index}')
+                        bulk_create()
+                        print(f'✅ Bulk create: {items} created, 0 updated, 0 errors')
+
+                def logged(level):
+                    handler = QueueLogHandler(pipe)
+                    handler.setFormatter(logging.Formatter(settings.LOGGING['formatters']['logfmt']['format']))
+                    games_logger.handlers, games_logger.level = [handler], level
+                    try:
+                        return best_of(repeat, bulk_create)
+                    finally:
+                        handler.stop()
+
+                games_logger.handlers = []
+                results = [
+                    ('no logging', best_of(repeat, bulk_create), 0),
+                    ('print() per item', best_of(repeat, legacy), 2 * items + 2),
+                    ('queue, INFO', logged(logging.INFO), 1),
+                    ('queue, DEBUG', logged(logging.DEBUG), len(list(sampled(range(items)))) + 1),
+                ]
+                transaction.set_rollback(True)
+        finally:
+            games_logger.handlers, games_logger.level = saved
+            pipe.close()
+            reader.wait()
+        return results
@@ -0,0 +1,58 @@
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+
+from games.bulk import bulk_update_fixtures
+from games.management.benchmarks import (
+    delete_fixtures, fixture_payload, require_scratch_database, seed_fixtures, timed,
+)
+from games.models import MatchFixture
+from games.serializers import MatchFixtureSerializer, fixture_rows_from_objects
+
+
+def legacy_bulk_update(items):
+    """Loop ya zamani ya MatchFixtureBulkUpdateView: get() + save() kwa kila item"""
+    updated = []
+    for fixture_data in items:
+        fixture = MatchFixture.objects.get(pk=fixture_data['id'])
+        serializer = MatchFixtureSerializer(fixture, data=fixture_data)
+        if serializer.is_valid():
+            updated.append(MatchFixtureSerializer(serializer.save()).data)
+    return updated
+
+
+class Command(BaseCommand):
+    help = (
+        'Benchmark bulk update ya fixtures: loop ya zamani dhidi ya bulk_update_fixtures(). '
+        'Inaandika fixtures za muda (autocommit, kama production) na kuzifuta mwishoni - '
+        'database isiwe na fixtures.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, nargs='+', default=[1000, 10000])
+
+    def handle(self, *args, **options):
+        require_scratch_database(MatchFixture)
+        for rows in options['rows']:
+            fixtures = seed_fixtures(rows)
+            try:
+                legacy_payload = [fixture_payload(f, homeOdds={'value': '2.10'}) for f in fixtures]
+                bulk_payload = [fixture_payload(f, homeOdds={'value': '2.20'}) for f in fixtures]
+
+                legacy, _ = timed(lambda: legacy_bulk_update(legacy_payload))
+                bulk, (updated, errors) = timed(
+                    lambda: bulk_update_fixtures(MatchFixture, MatchFixtureSerializer, bulk_payload)
+                )
+                fixture_rows_from_objects(updated)
+
+                ok = not errors and set(
+                    MatchFixture.objects.filter(pk__in=[f.pk for f in fixtures[:500]])
+                    .values_list('homeOdds', flat=True)
+                ) == {Decimal('2.20')}
+
+                self.stdout.write(f'{rows} fixtures:')
+                self.stdout.write(f'  legacy loop (get + save):  {legacy * 1000:9.1f} ms')
+                self.stdout.write(f'  bulk_update_fixtures():    {bulk * 1000:9.1f} ms  ({legacy / bulk:.1f}x)')
+                self.stdout.write(f'  all rows updated:          {ok}')
+            finally:
+                delete_fixtures(fixtures)
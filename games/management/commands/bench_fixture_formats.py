@@ -0,0 +1,57 @@
+import gzip
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from games.management.benchmarks import best_of, seed_fixtures
+from games.models import MatchFixture
+from games.serializers import (
+    FIXTURE_COLUMNAR_FIELDS, FIXTURE_LIST_COLUMNS, build_columnar_rows, build_fixture_rows,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Benchmark ya format ya columnar (?format=columnar) dhidi ya format ya kawaida ya '
+        'fixture lists: ukubwa wa payload (raw na gzip) na muda wa encode. Data ya muda '
+        'inaandikwa ndani ya transaction inayo-rollback.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, nargs='+', default=[1000, 10000])
+        parser.add_argument('--repeat', type=int, default=5)
+
+    def handle(self, *args, **options):
+        renderer = JSONRenderer()
+        formats = {
+            'rows': lambda rows: renderer.render(build_fixture_rows(rows)),
+            'columnar': lambda rows: renderer.render([list(FIXTURE_COLUMNAR_FIELDS), *build_columnar_rows(rows)]),
+        }
+
+        self.stdout.write(
+            f'  {"fixtures":>8}  {"format":<9}{"bytes":>10}  {"gzip":>9}  {"encode ms":>9}'
+        )
+        with transaction.atomic():
+            seeded = 0
+            for count in options['rows']:
+                seed_fixtures(count - seeded)
+                seeded = count
+                rows = list(MatchFixture.objects.order_by('date', 'time').values_list(*FIXTURE_LIST_COLUMNS))
+
+                results = {}
+                for name, encode in formats.items():
+                    body = encode(rows)
+                    results[name] = (
+                        len(body), len(gzip.compress(body)), best_of(options['repeat'], lambda: encode(rows))
+                    )
+                    self.stdout.write(
+                        f'  {count:>8}  {name:<9}{results[name][0]:>10}  {results[name][1]:>9}  '
+                        f'{results[name][2] * 1000:>9.1f}'
+                    )
+                (size, zipped, encode), (c_size, c_zipped, c_encode) = results['rows'], results['columnar']
+                self.stdout.write(
+                    f'  {count:>8}  {"saving":<9}{1 - c_size / size:>10.0%}  {1 - c_zipped / zipped:>9.0%}  '
+                    f'{1 - c_encode / encode:>9.0%}'
+                )
+            transaction.set_rollback(True)
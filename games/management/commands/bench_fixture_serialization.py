@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from games.management.benchmarks import best_of, seed_fixtures
+from games.models import MatchFixture
+from games.serializers import MatchFixtureSerializer, fixture_rows
+
+
+class Command(BaseCommand):
+    help = 'Benchmark fixture_rows() dhidi ya MatchFixtureSerializer (data ya muda, inafutwa mwishoni)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=10000)
+        parser.add_argument('--repeat', type=int, default=5)
+
+    def handle(self, *args, **options):
+        rows, repeat = options['rows'], options['repeat']
+
+        with transaction.atomic():
+            seed_fixtures(rows)
+            fixtures = MatchFixture.objects.order_by('date', 'time')
+            renderer = JSONRenderer()
+
+            slow_body = renderer.render(MatchFixtureSerializer(fixtures, many=True).data)
+            fast_body = renderer.render(fixture_rows(fixtures))
+            if slow_body != fast_body:
+                self.stderr.write('Output ya fixture_rows() si sawa na ya serializer!')
+
+            slow = best_of(repeat, lambda: renderer.render(MatchFixtureSerializer(fixtures.all(), many=True).data))
+            fast = best_of(repeat, lambda: renderer.render(fixture_rows(fixtures.all())))
+
+            self.stdout.write(f'{rows} fixtures, best of {repeat} (query + serialize + render):')
+            self.stdout.write(f'  MatchFixtureSerializer: {slow * 1000:8.1f} ms')
+            self.stdout.write(f'  fixture_rows():         {fast * 1000:8.1f} ms  ({slow / fast:.1f}x)')
+            self.stdout.write(f'  identical output:       {slow_body == fast_body}')
+
+            transaction.set_rollback(True)
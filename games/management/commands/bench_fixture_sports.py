@@ -0,0 +1,87 @@
+import json
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import RequestFactory
+from rest_framework.renderers import JSONRenderer
+
+from effootball.models import Efootbal
+from effootball.serializers import EfootbalSerializer
+from effootball.views import EfootballBulkUpdateView, EfootballListCreateView
+from games.management.benchmarks import best_of, fixture_payload, seed_fixtures
+from games.models import MatchFixture
+from games.serializers import MatchFixtureSerializer
+from games.views import MatchFixtureBulkUpdateView, MatchFixtureListCreateView
+
+SPORTS = [
+    ('fixtures', MatchFixture, MatchFixtureSerializer, MatchFixtureListCreateView, MatchFixtureBulkUpdateView),
+    ('efootball', Efootbal, EfootbalSerializer, EfootballListCreateView, EfootballBulkUpdateView),
+]
+
+
+def legacy_list(model, serializer_class):
+    """GET ya zamani: ModelSerializer(many=True) bila ETag"""
+    return JSONRenderer().render(serializer_class(model.objects.order_by('date', 'time'), many=True).data)
+
+
+def legacy_bulk_update(model, serializer_class, items):
+    """Loop ya zamani ya bulk update: get() + save() kwa kila item"""
+    for item in items:
+        serializer = serializer_class(model.objects.get(pk=item['id']), data=item)
+        if serializer.is_valid():
+            serializer_class(serializer.save()).data
+
+
+def call(view, request):
+    response = view(request)
+    response.render()
+    return response
+
+
+class Command(BaseCommand):
+    help = (
+        'Benchmark ya engine ya fixtures kwa kila sport (/api/fixtures/, /api/efootball/): '
+        'list, conditional GET na bulk update dhidi ya njia za zamani. Data ya muda '
+        'inaandikwa ndani ya transaction inayo-rollback.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=2000)
+        parser.add_argument('--repeat', type=int, default=3)
+
+    def handle(self, *args, **options):
+        rows, repeat = options['rows'], options['repeat']
+        factory = RequestFactory()
+
+        self.stdout.write(f'{rows} fixtures per sport, best of {repeat}:')
+        self.stdout.write(
+            f'  {"sport":<10}{"operation":<15}{"legacy ms":>10}  {"engine ms":>10}  {"gain":>6}'
+        )
+        with transaction.atomic():
+            for sport, model, serializer_class, list_view, bulk_update_view in SPORTS:
+                fixtures = seed_fixtures(rows, model)
+                list_view, bulk_update_view = list_view.as_view(), bulk_update_view.as_view()
+                etag = call(list_view, factory.get(f'/api/{sport}/'))['ETag']
+                body = json.dumps([
+                    fixture_payload(f, homeOdds={'value': '2.20', 'hasFireIcon': False}) for f in fixtures
+                ])
+
+                results = [
+                    ('list', best_of(repeat, lambda: legacy_list(model, serializer_class)),
+                     best_of(repeat, lambda: call(list_view, factory.get(f'/api/{sport}/')))),
+                    # Legacy haikuwa na ETag - client anapakua list nzima tena
+                    ('304 revalidate', best_of(repeat, lambda: legacy_list(model, serializer_class)),
+                     best_of(repeat, lambda: call(
+                         list_view, factory.get(f'/api/{sport}/', headers={'If-None-Match': etag})
+                     ))),
+                    ('bulk update', best_of(1, lambda: legacy_bulk_update(model, serializer_class, json.loads(body))),
+                     best_of(1, lambda: call(bulk_update_view, factory.put(
+                         f'/api/{sport}/bulk/update/', body, content_type='application/json'
+                     )))),
+                ]
+                for operation, legacy, engine in results:
+                    self.stdout.write(
+                        f'  {sport:<10}{operation:<15}{legacy * 1000:>10.1f}  {engine * 1000:>10.1f}  '
+                        f'{legacy / engine:>5.1f}x'
+                    )
+            transaction.set_rollback(True)
@@ -0,0 +1,154 @@
+import asyncio
+import statistics
+import time
+import tracemalloc
+from datetime import date, time as clock
+from decimal import Decimal
+
+from django.core.handlers.asgi import ASGIHandler
+from django.core.management.base import BaseCommand
+
+from games.live import fixture_channel, get_hub, publish_fixture_changes
+from games.models import MatchFixture
+
+
+def stream_scope(path):
+    return {
+        'type': 'http',
+        'asgi': {'version': '3.0'},
+        'http_version': '1.1',
+        'method': 'GET',
+        'scheme': 'http',
+        'path': path,
+        'raw_path': path.encode(),
+        'root_path': '',
+        'query_string': b'',
+        'headers': [(b'host', b'localhost'), (b'accept', b'text/event-stream')],
+        'client': ('127.0.0.1', 50000),
+        'server': ('localhost', 80),
+    }
+
+
+class Subscriber:
+    """Client mmoja wa SSE anayeongea na ASGI app moja kwa moja (bila socket)"""
+
+    def __init__(self, app, path, connected, events):
+        self.app = app
+        self.path = path
+        self.connected = connected
+        self.events = events
+        self.disconnect = asyncio.Event()
+        self.body_sent = False
+
+    async def receive(self):
+        if not self.body_sent:
+            self.body_sent = True
+            return {'type': 'http.request', 'body': b'', 'more_body': False}
+        await self.disconnect.wait()
+        return {'type': 'http.disconnect'}
+
+    async def send(self, message):
+        if message['type'] != 'http.response.body':
+            return
+        body = message.get('body', b'')
+        if body.startswith(b'retry:'):
+            self.connected()
+        elif body.startswith(b'event: fixtures'):
+            self.events(time.perf_counter())
+
+    async def run(self):
+        await self.app(stream_scope(self.path), self.receive, self.send)
+
+
+def fake_fixtures(count):
+    """Instances za memory tu - publish haiandiki DB"""
+    return [
+        MatchFixture(
+            pk=i + 1, eventId=i + 1, time=clock(18, 30), date=date(2026, 3, 1),
+            homeTeam=f'Home {i}', awayTeam=f'Away {i}', league='NBC Premier League',
+            homeOdds=Decimal('1.50'), drawOdds=Decimal('3.20'), awayOdds=Decimal('5.75'),
+        )
+        for i in range(count)
+    ]
+
+
+class Command(BaseCommand):
+    help = (
+        'Load test ya /api/fixtures/stream/ ndani ya worker mmoja (event loop moja): '
+        'subscribers N wanaunganishwa kwenye ASGI app, kisha muda wa fan-out wa kila '
+        'odds update hadi subscriber wa mwisho unapimwa'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--subscribers', type=int, nargs='+', default=[100, 1000, 5000])
+        parser.add_argument('--updates', type=int, default=20)
+        parser.add_argument('--rows', type=int, default=5, help='Fixtures zilizobadilika kwa kila update')
+
+    def handle(self, *args, **options):
+        self.stdout.write(
+            f'{options["updates"]} updates x {options["rows"]} rows, one worker (single event loop):'
+        )
+        self.stdout.write(
+            f'  {"subscribers":>11}  {"connect s":>9}  {"KB/sub":>7}  '
+            f'{"fan-out p50 ms":>14}  {"fan-out max ms":>14}  {"deliveries/s":>12}'
+        )
+        for count in options['subscribers']:
+            result = asyncio.run(self.measure(count, options['updates'], options['rows']))
+            self.stdout.write(
+                '  {:>11}  {:>9.2f}  {:>7.1f}  {:>14.1f}  {:>14.1f}  {:>12.0f}'.format(count, *result)
+            )
+
+    async def measure(self, count, updates, rows):
+        app = ASGIHandler()
+        hub = get_hub()
+        channel = fixture_channel(MatchFixture)
+        fixtures = fake_fixtures(rows)
+        connected = 0
+        received = []
+        all_connected = asyncio.Event()
+        all_received = asyncio.Event()
+
+        def on_connect():
+            nonlocal connected
+            connected += 1
+            if connected == count:
+                all_connected.set()
+
+        def on_event(at):
+            received.append(at)
+            if len(received) == count:
+                all_received.set()
+
+        tracemalloc.start()
+        started = time.perf_counter()
+        subscribers = [Subscriber(app, '/api/fixtures/stream/', on_connect, on_event) for _ in range(count)]
+        tasks = [asyncio.create_task(subscriber.run()) for subscriber in subscribers]
+        await all_connected.wait()
+        connect_time = time.perf_counter() - started
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        latencies = []
+        delivery_time = 0
+        for _ in range(updates):
+            received.clear()
+            all_received.clear()
+            published = time.perf_counter()
+            # Kama sync view: publish inatoka kwenye thread nyingine, nje ya transaction
+            await asyncio.to_thread(publish_fixture_changes, MatchFixture, fixtures)
+            await all_received.wait()
+            latencies.append(max(received) - published)
+            delivery_time += latencies[-1]
+
+        for subscriber in subscribers:
+            subscriber.disconnect.set()
+        await asyncio.gather(*tasks)
+        assert hub.subscriber_count(channel) == 0, 'subscribers hawakuondolewa baada ya disconnect'
+
+        return (
+            connect_time,
+            memory / count / 1024,
+            statistics.median(latencies) * 1000,
+            max(latencies) * 1000,
+            count * updates / delivery_time,
+        )
@@ -0,0 +1,68 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.urls import resolve
+
+from games import metrics
+from games.metrics import RequestMetricsMiddleware, count_query, registry
+
+
+def per_call(fn, calls):
+    """Muda wa wastani wa fn() (microseconds), bora ya majaribio 5"""
+    best = float('inf')
+    for _ in range(5):
+        started = time.perf_counter()
+        for _ in range(calls):
+            fn()
+        best = min(best, time.perf_counter() - started)
+    return best / calls * 1e6
+
+
+class Command(BaseCommand):
+    help = (
+        'Gharama ya RequestMetricsMiddleware kwa kila request na ya count_query kwa kila '
+        'SQL query (bila server wala view - overhead peke yake)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--calls', type=int, default=100000)
+
+    def handle(self, *args, **options):
+        calls = options['calls']
+        request = RequestFactory().get('/api/fixtures/')
+        request.resolver_match = resolve('/api/fixtures/')
+        # Kama baada ya CommonMiddleware (Content-Length imewekwa)
+        response = HttpResponse(b'x' * 1000, headers={'Content-Length': '1000'})
+
+        def get_response(request):
+            return response
+
+        middleware = RequestMetricsMiddleware(get_response)
+        bare = per_call(lambda: get_response(request), calls)
+        measured = per_call(lambda: middleware(request), calls)
+        registry.reset()
+
+        # Gharama ya count_query yenyewe dhidi ya wrapper tupu (Django tayari
+        # inapitisha kila query kwenye execute_wrappers)
+        def execute(sql, params, many, context):
+            return None
+
+        def noop(execute, sql, params, many, context):
+            return execute(sql, params, many, context)
+
+        context = {'connection': connection, 'cursor': None}
+        token = metrics._request_sql.set([0, 0])
+        try:
+            wrapped = per_call(lambda: count_query(execute, 'SELECT 1', None, False, context), calls)
+        finally:
+            metrics._request_sql.reset(token)
+        plain = per_call(lambda: noop(execute, 'SELECT 1', None, False, context), calls)
+        with connection.cursor() as cursor:
+            query = per_call(lambda: cursor.execute('SELECT 1'), calls // 10)
+
+        self.stdout.write(f'{calls} calls, best of 5:')
+        self.stdout.write(f'  middleware per request:  {measured - bare:6.2f} us')
+        self.stdout.write(f'  count_query per query:   {wrapped - plain:6.2f} us  (SELECT 1 = {query:.2f} us)')
@@ -0,0 +1,170 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import timedelta
+from decimal import Decimal
+from pathlib import Path
+
+from django.conf import settings
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.utils import timezone
+
+from games.db import set_journal_mode
+from games.management.benchmarks import fixture_payload, percentile, seed_fixtures, wsgi_environ
+from games.models import Game, Match
+
+
+def bet_body(i):
+    return json.dumps({
+        'stake': '1000.00',
+        'matches': [
+            {'match_ref': f'M{leg:03}', 'teams': f'Team {i} vs Team {leg}', 'market': '1X2',
+             'selection': 'Home', 'odds': '1.40'}
+            for leg in range(1, 4)
+        ],
+    }).encode()
+
+
+class Command(BaseCommand):
+    help = (
+        'Benchmark ya mixed read/write (readers GET bets/fixtures, writers POST bets na '
+        'bulk odds updates) kwenye SQLite file mpya, SQLITE_TUNING on (WAL, pragmas, '
+        'persistent connections) dhidi ya off. Kila mode ni process yake.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--readers', type=int, default=8)
+        parser.add_argument('--writers', type=int, default=2)
+        parser.add_argument('--seconds', type=float, default=10)
+        parser.add_argument('--run', action='store_true', help='Ndani: endesha load na uchapishe JSON')
+
+    def handle(self, *args, **options):
+        if options['run']:
+            return self.run_load(options)
+
+        results = {}
+        for mode in ('off', 'on'):
+            # Disk ile ile ya db.sqlite3 (fsync ya /tmp inaweza kuwa tmpfs)
+            with tempfile.TemporaryDirectory(dir=settings.BASE_DIR) as directory:
+                env = dict(
+                    os.environ,
+                    SQLITE_PATH=str(Path(directory) / 'bench.sqlite3'),
+                    SQLITE_TUNING='1' if mode == 'on' else '0',
+                    DB_CONN_MAX_AGE='600' if mode == 'on' else '0',
+                )
+                manage = [sys.executable, sys.argv[0]]
+                subprocess.run([*manage, 'migrate', '-v0'], env=env, check=True)
+                output = subprocess.run(
+                    [*manage, 'bench_sqlite_tuning', '--run', '--readers', str(options['readers']),
+                     '--writers', str(options['writers']), '--seconds', str(options['seconds'])],
+                    env=env, check=True, capture_output=True, text=True,
+                ).stdout
+                results[mode] = json.loads(output.strip().splitlines()[-1])
+
+        self.stdout.write(
+            f'{options["readers"]} readers + {options["writers"]} writers for {options["seconds"]:.0f}s '
+            '(WSGIHandler threads, one process):'
+        )
+        self.stdout.write(
+            f'  {"tuning":<7}{"journal":>8}  {"reads/s":>8}  {"writes/s":>8}  {"read p99 ms":>11}  '
+            f'{"write p99 ms":>12}  {"errors":>6}'
+        )
+        for mode, r in results.items():
+            self.stdout.write(
+                f'  {mode:<7}{r["journal_mode"]:>8}  {r["reads"] / r["seconds"]:>8.0f}  '
+                f'{r["writes"] / r["seconds"]:>8.0f}  {r["read_p99"]:>11.1f}  {r["write_p99"]:>12.1f}  '
+                f'{r["errors"]:>6}'
+            )
+        off, on = results['off'], results['on']
+        self.stdout.write(
+            f'  speedup: reads {on["reads"] / max(off["reads"], 1):.1f}x, '
+            f'writes {on["writes"] / max(off["writes"], 1):.1f}x'
+        )
+
+    def seed(self):
+        active_until = timezone.now() + timedelta(days=1)
+        games = Game.objects.bulk_create([
+            Game(stake=Decimal('1000.00'), odds=Decimal('2.74'), total_odds=Decimal('2.74'),
+                 active_until=active_until)
+            for _ in range(300)
+        ])
+        Match.objects.bulk_create([
+            Match(game=game, match_ref=f'M{leg:03}', teams='Simba vs Yanga', market='1X2',
+                  selection='Simba', odds=Decimal('1.40'))
+            for game in games for leg in range(1, 4)
+        ], batch_size=500)
+        return games, seed_fixtures(300)
+
+    def run_load(self, options):
+        set_journal_mode()  # kama wsgi.py
+        games, fixtures = self.seed()
+        with connection.cursor() as cursor:
+            cursor.execute('PRAGMA journal_mode')
+            journal_mode = cursor.fetchone()[0]
+        connection.close()
+
+        app = WSGIHandler()
+        read_paths = ['/api/bets/?limit=20', f'/api/bets/{games[0].id}/', '/api/fixtures/']
+        stop = threading.Event()
+        lock = threading.Lock()
+        stats = {'reads': [], 'writes': [], 'errors': 0}
+
+        def request(kind, path, method='GET', body=b''):
+            statuses = []
+            started = time.perf_counter()
+            response = app(wsgi_environ(path, method, body), lambda status, headers: statuses.append(status))
+            b''.join(response)
+            response.close()
+            elapsed = time.perf_counter() - started
+            with lock:
+                if statuses[0][0] in '23':
+                    stats[kind].append(elapsed)
+                else:
+                    stats['errors'] += 1
+
+        def reader(n):
+            i = n
+            while not stop.is_set():
+                request('reads', read_paths[i % len(read_paths)])
+                i += 1
+
+        def writer(n):
+            i = n
+            while not stop.is_set():
+                if i % 2:
+                    request('writes', '/api/bets/', 'POST', bet_body(i))
+                else:
+                    # Odds refresh ya fixtures 20 (UPDATE ya rows zilizobadilika tu)
+                    batch = fixtures[(i * 20) % 280:(i * 20) % 280 + 20]
+                    body = json.dumps([
+                        fixture_payload(f, homeOdds={'value': f'{1.5 + i % 50 / 100:.2f}', 'hasFireIcon': False})
+                        for f in batch
+                    ]).encode()
+                    request('writes', '/api/fixtures/bulk/update/', 'PUT', body)
+                i += 1
+
+        threads = [threading.Thread(target=reader, args=(n,)) for n in range(options['readers'])]
+        threads += [threading.Thread(target=writer, args=(n,)) for n in range(options['writers'])]
+        for thread in threads:
+            thread.start()
+        time.sleep(options['seconds'])
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+        self.stdout.write(json.dumps({
+            'tuning': settings.SQLITE_TUNING,
+            'journal_mode': journal_mode,
+            'seconds': options['seconds'],
+            'reads': len(stats['reads']),
+            'writes': len(stats['writes']),
+            'errors': stats['errors'],
+            'read_p99': percentile(stats['reads'], 0.99) * 1000,
+            'write_p99': percentile(stats['writes'], 0.99) * 1000,
+        }))
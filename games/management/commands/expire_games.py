@@ -0,0 +1,69 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from games.bulk import expire_games_batch, expired_games
+
+
+class Command(BaseCommand):
+    help = (
+        'Sweeper ya muda mrefu: OPEN games zilizopita active_until zinahamishwa EXPIRED '
+        'kwa batches ndogo (game_summary_idx), kila sweep ikiripoti throughput na backlog'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int,
+            default=getattr(settings, 'EXPIRY_SWEEP_BATCH_SIZE', 500),
+            help='Games kwa kila UPDATE'
+        )
+        parser.add_argument(
+            '--interval', type=float,
+            default=getattr(settings, 'EXPIRY_SWEEP_INTERVAL', 60),
+            help='Sekunde za kusubiri kati ya sweeps'
+        )
+        parser.add_argument(
+            '--max-batches', type=int, default=0,
+            help='Batches za juu kwa sweep moja (0 = mpaka backlog iishe)'
+        )
+        parser.add_argument(
+            '--pause', type=float, default=0,
+            help='Sekunde kati ya batches ili writers wengine wapate lock'
+        )
+        parser.add_argument('--once', action='store_true', help='Sweep moja kisha toka')
+
+    def handle(self, *args, **options):
+        try:
+            while True:
+                self.sweep(options)
+                if options['once']:
+                    break
+                time.sleep(options['interval'])
+        except KeyboardInterrupt:
+            self.stdout.write('Sweeper stopped')
+
+    def sweep(self, options):
+        # now moja kwa sweep nzima - games zinazo-expire wakati wa sweep zinasubiri inayofuata
+        now = timezone.now()
+        started = time.perf_counter()
+        expired = batches = 0
+
+        while not options['max_batches'] or batches < options['max_batches']:
+            count = expire_games_batch(now, options['batch_size'])
+            expired += count
+            batches += 1
+            if count < options['batch_size']:
+                break
+            if options['pause']:
+                time.sleep(options['pause'])
+
+        elapsed = time.perf_counter() - started
+        backlog = expired_games(timezone.now()).count()
+        rate = expired / elapsed if elapsed else 0
+        self.stdout.write(
+            f'[{now:%Y-%m-%d %H:%M:%S}] expired {expired} games in {batches} batches '
+            f'({elapsed:.2f}s, {rate:.0f} games/s), backlog {backlog}'
+        )
+        return expired, backlog
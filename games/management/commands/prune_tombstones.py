@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from games.models import FixtureTombstone
+from games.sync import tombstone_retention
+
+
+class Command(BaseCommand):
+    help = (
+        'Futa FixtureTombstones za zamani kuliko FIXTURE_TOMBSTONE_DAYS '
+        '(tokens za zamani hivyo zinapata 410 na kusoma list nzima)'
+    )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - tombstone_retention()
+        deleted, _ = FixtureTombstone.objects.filter(deleted_at__lt=cutoff).delete()
+        self.stdout.write(self.style.SUCCESS(f'Deleted {deleted} tombstones older than {cutoff:%Y-%m-%d %H:%M}'))
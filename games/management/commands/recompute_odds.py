@@ -0,0 +1,62 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from games.bulk import BULK_BATCH_SIZE
+from games.cache import invalidate_bet_summary
+from games.models import Game
+from games.odds import game_odds
+
+
+class Command(BaseCommand):
+    help = (
+        'Hakiki Game.total_odds/odds za OPEN games dhidi ya product ya matches zake '
+        'na urekebishe tofauti (mf. odds zilizoandikwa na updates za O(1) za zamani, au '
+        'games zisizo na legs ambazo hazina odds 0)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=BULK_BATCH_SIZE)
+        parser.add_argument('--dry-run', action='store_true', help='Onyesha tu, usiandike')
+
+    def handle(self, *args, **options):
+        chunk_size, dry_run = options['chunk_size'], options['dry_run']
+        started = time.perf_counter()
+        checked = repaired = 0
+        pending = []
+
+        # iterator() + prefetch: games na matches zinasomwa kwa chunks (queries 2 kwa chunk)
+        games = (
+            Game.objects.filter(status='OPEN')
+            .only('id', 'odds', 'total_odds')
+            .prefetch_related('matches')
+            .order_by('pk')
+            .iterator(chunk_size=chunk_size)
+        )
+        for game in games:
+            checked += 1
+            expected = game_odds(match.odds for match in game.matches.all())
+            if game.total_odds != expected or game.odds != expected:
+                game.total_odds = game.odds = expected
+                pending.append(game)
+            if len(pending) >= chunk_size:
+                repaired += self.flush(pending, dry_run)
+
+        repaired += self.flush(pending, dry_run)
+        if repaired and not dry_run:
+            invalidate_bet_summary()
+
+        elapsed = time.perf_counter() - started
+        verb = 'would repair' if dry_run else 'repaired'
+        self.stdout.write(self.style.SUCCESS(
+            f'Checked {checked} open games, {verb} {repaired} in {elapsed:.2f}s'
+        ))
+
+    def flush(self, pending, dry_run):
+        count = len(pending)
+        if count and not dry_run:
+            with transaction.atomic():
+                Game.objects.bulk_update(pending, ['total_odds', 'odds'], batch_size=BULK_BATCH_SIZE)
+        pending.clear()
+        return count
@@ -0,0 +1,37 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from games.db import copy_database, replica_alias
+
+
+class Command(BaseCommand):
+    help = (
+        'Replica ya local testing: nakili db.sqlite3 (primary) kwenda SQLITE_REPLICA_PATH '
+        'kila --interval sekunde. Lag ya replica ni hadi interval + muda wa nakala'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--interval', type=float, default=getattr(settings, 'REPLICA_SYNC_INTERVAL', 1)
+        )
+        parser.add_argument('--once', action='store_true', help='Nakala moja kisha toka')
+
+    def handle(self, *args, **options):
+        replica = replica_alias()
+        if not replica:
+            raise CommandError('No replica configured - set SQLITE_REPLICA_PATH')
+        source = settings.DATABASES['default']['NAME']
+        target = settings.DATABASES[replica]['NAME']
+
+        try:
+            while True:
+                started = time.perf_counter()
+                copy_database(source, target)
+                self.stdout.write(f'Copied {source} -> {target} in {(time.perf_counter() - started) * 1000:.0f}ms')
+                if options['once']:
+                    break
+                time.sleep(options['interval'])
+        except KeyboardInterrupt:
+            self.stdout.write('Replica sync stopped')
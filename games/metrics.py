@@ -0,0 +1,249 @@
+# games/metrics.py
+"""
+Metrics za requests kwa kila view (resolved URL name): latency histogram, idadi
+ya SQL queries, muda wa SQL na ukubwa wa response. Zinasomwa kama Prometheus
+text kwenye GET /api/metrics/.
+
+Gunicorn workers: kila process inaweka counters zake kwenye memory na thread ya
+background inaziandika kwenye METRICS_DIR (file moja kwa process, JSON) kila
+METRICS_FLUSH_INTERVAL sekunde. /api/metrics/ inajumlisha files zote, hivyo
+worker yeyote anajibu kwa jumla ya workers wote (data ya workers wengine
+inaweza kuchelewa hadi interval moja). Futa METRICS_DIR kabla ya kuanzisha server (kama prometheus_client
+multiprocess mode). Bila METRICS_DIR metrics ni za process hii tu.
+
+Kazi ya kila request ni perf_counter mbili, ContextVar moja na dict update chini
+ya lock - angalia `manage.py bench_metrics_overhead`.
+"""
+import atexit
+import json
+import os
+import threading
+import time
+import uuid
+from bisect import bisect_left
+from contextvars import ContextVar
+from pathlib import Path
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+# Prometheus default buckets (sekunde)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Index za values kwenye list ya stats ya view moja (baada ya bucket counts)
+COUNT, SECONDS, QUERIES, SQL_SECONDS, BYTES = range(len(LATENCY_BUCKETS) + 1, len(LATENCY_BUCKETS) + 6)
+STATS_SIZE = BYTES + 1
+
+# [queries, sql nanoseconds] za request inayoendelea
+_request_sql = ContextVar('request_sql', default=None)
+
+
+def metrics_dir():
+    return getattr(settings, 'METRICS_DIR', None)
+
+
+def flush_interval():
+    return getattr(settings, 'METRICS_FLUSH_INTERVAL', 1)
+
+
+@receiver(connection_created)
+def install_query_metrics(sender, connection, **kwargs):
+    # Wrapper moja ya kudumu kwa connection - si execute_wrapper() kwa kila request
+    if count_query not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, count_query)
+
+
+def count_query(execute, sql, params, many, context):
+    totals = _request_sql.get()
+    if totals is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter_ns()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        totals[0] += 1
+        totals[1] += time.perf_counter_ns() - started
+
+
+class MetricsRegistry:
+    """Counters za process moja, kwa (view, method)"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.stats = {}
+        self.pid = os.getpid()
+        self.path = None
+        self.dirty = False
+        self.flusher = None
+
+    def observe(self, view, method, seconds, queries, sql_seconds, size):
+        bucket = bisect_left(LATENCY_BUCKETS, seconds)
+        with self.lock:
+            if self.pid != os.getpid():
+                # Process mpya baada ya fork (gunicorn --preload) - usirithi counters
+                self.reset()
+            stats = self.stats.get((view, method))
+            if stats is None:
+                stats = self.stats[(view, method)] = [0] * STATS_SIZE
+                if self.flusher is None and metrics_dir():
+                    self.start_flusher()
+            stats[bucket] += 1
+            stats[COUNT] += 1
+            stats[SECONDS] += seconds
+            stats[QUERIES] += queries
+            stats[SQL_SECONDS] += sql_seconds
+            stats[BYTES] += size
+            self.dirty = True
+
+    def start_flusher(self):
+        """Thread ya background inaandika file - request haisubiri disk"""
+        def run():
+            while True:
+                time.sleep(flush_interval())
+                if self.dirty:
+                    self.flush()
+
+        self.flusher = threading.Thread(target=run, name='metrics-flusher', daemon=True)
+        self.flusher.start()
+        atexit.register(self.flush)
+
+    def snapshot(self):
+        with self.lock:
+            return {f'{view}\t{method}': list(stats) for (view, method), stats in self.stats.items()}
+
+    def flush(self):
+        """Andika counters za process hii kwenye METRICS_DIR (atomic replace)"""
+        directory = metrics_dir()
+        if not directory or self.pid != os.getpid():
+            return
+        self.dirty = False
+        if self.path is None:
+            # pid inaweza kutumiwa tena na worker mpya - file lisiandikwe juu ya la zamani
+            self.path = Path(directory) / f'worker-{os.getpid()}-{uuid.uuid4().hex[:8]}.json'
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.path.with_suffix('.tmp')
+        temporary.write_text(json.dumps(self.snapshot()))
+        os.replace(temporary, self.path)
+
+    def collect(self):
+        """Jumla ya process hii (live) na files za workers wengine"""
+        totals = self.snapshot()
+        directory = metrics_dir()
+        if directory:
+            for path in Path(directory).glob('worker-*.json'):
+                if path == self.path:
+                    continue
+                try:
+                    snapshot = json.loads(path.read_text())
+                except (OSError, ValueError):
+                    continue  # worker anaandika / file limefutwa
+                for key, stats in snapshot.items():
+                    merged = totals.setdefault(key, [0] * STATS_SIZE)
+                    for index, value in enumerate(stats):
+                        merged[index] += value
+        return totals
+
+
+registry = MetricsRegistry()
+
+
+def escape(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def render_prometheus(totals):
+    """Prometheus text exposition format (version 0.0.4)"""
+    lines = []
+
+    def family(name, kind, help_text):
+        lines.append(f'# HELP {name} {help_text}')
+        lines.append(f'# TYPE {name} {kind}')
+
+    series = []
+    for key in sorted(totals):
+        view, method = key.split('\t')
+        series.append((f'view="{escape(view)}",method="{escape(method)}"', totals[key]))
+
+    family('http_request_duration_seconds', 'histogram', 'Request latency per view.')
+    for labels, stats in series:
+        cumulative = 0
+        for bound, count in zip(LATENCY_BUCKETS, stats):
+            cumulative += count
+            lines.append(f'http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+        lines.append(f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} {stats[COUNT]}')
+        lines.append(f'http_request_duration_seconds_sum{{{labels}}} {stats[SECONDS]}')
+        lines.append(f'http_request_duration_seconds_count{{{labels}}} {stats[COUNT]}')
+
+    for name, index, help_text in (
+        ('http_request_db_queries_total', QUERIES, 'SQL queries executed by requests per view.'),
+        ('http_request_db_seconds_total', SQL_SECONDS, 'Time spent in SQL by requests per view.'),
+        ('http_response_size_bytes_total', BYTES, 'Response body bytes per view (streaming bodies excluded).'),
+    ):
+        family(name, 'counter', help_text)
+        for labels, stats in series:
+            lines.append(f'{name}{{{labels}}} {stats[index]}')
+    return '\n'.join(lines) + '\n'
+
+
+class RequestMetricsMiddleware:
+    """
+    Inapima kila request (iwe ya kwanza kwenye MIDDLEWARE ili ipime stack nzima).
+    Queries za body ya StreamingHttpResponse zinasomwa baada ya middleware - hazihesabiwi.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        # Mara moja hapa - iscoroutinefunction() kwa kila request ni ~1us
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        totals = [0, 0]
+        token = _request_sql.set(totals)
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _request_sql.reset(token)
+        self.record(request, response, time.perf_counter() - started, totals)
+        return response
+
+    async def __acall__(self, request):
+        totals = [0, 0]
+        token = _request_sql.set(totals)
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _request_sql.reset(token)
+        self.record(request, response, time.perf_counter() - started, totals)
+        return response
+
+    def record(self, request, response, seconds, totals):
+        match = request.resolver_match
+        registry.observe(
+            match.view_name if match is not None else 'unmatched',
+            request.method,
+            seconds,
+            totals[0],
+            totals[1] / 1e9,
+            response_size(response),
+        )
+
+
+def response_size(response):
+    if response.streaming:
+        return 0
+    # CommonMiddleware imeshaweka Content-Length - usinakili body tena
+    length = response.get('Content-Length')
+    return int(length) if length is not None else len(response.content)
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.11 on 2026-10-17 02:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('games', '0006_game_summary_index'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='game',
+            name='game_status_created_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='game',
+            name='game_created_idx',
+        ),
+        migrations.AddIndex(
+            model_name='game',
+            index=models.Index(fields=['status', '-created_at', '-id'], name='game_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='game',
+            index=models.Index(fields=['-created_at', '-id'], name='game_created_idx'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.11 on 2026-10-17 02:11
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('games', '0007_game_cursor_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='balance',
+            name='snapshot_entry_id',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.CreateModel(
+            name='BalanceEntry',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('delta', models.DecimalField(decimal_places=2, max_digits=12)),
+                ('reason', models.CharField(blank=True, default='', max_length=50)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('balance', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='entries', to='games.balance')),
+            ],
+            options={
+                'verbose_name': 'Balance entry',
+                'verbose_name_plural': 'Balance entries',
+                'indexes': [models.Index(fields=['balance', 'id'], name='balanceentry_recent_idx')],
+            },
+        ),
+    ]
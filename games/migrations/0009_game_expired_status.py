@@ -0,0 +1,18 @@
+# Generated by Django 5.2.11 on 2026-10-17 02:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('games', '0008_balance_ledger'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='game',
+            name='status',
+            field=models.CharField(choices=[('OPEN', 'Open'), ('SETTLED', 'Settled'), ('EXPIRED', 'Expired')], default='OPEN', max_length=10),
+        ),
+    ]
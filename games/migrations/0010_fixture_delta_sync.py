@@ -0,0 +1,31 @@
+# Generated by Django 5.2.11 on 2026-10-17 02:22
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('games', '0009_game_expired_status'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FixtureTombstone',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('fixture_model', models.CharField(max_length=50)),
+                ('fixture_id', models.BigIntegerField()),
+                ('deleted_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='matchfixture',
+            index=models.Index(fields=['updated_at', 'id'], name='matchfixture_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='fixturetombstone',
+            index=models.Index(fields=['fixture_model', 'deleted_at'], name='tombstone_since_idx'),
+        ),
+    ]
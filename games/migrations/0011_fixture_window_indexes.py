@@ -0,0 +1,21 @@
+# Generated by Django 5.2.11 on 2026-10-17 02:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('games', '0010_fixture_delta_sync'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='matchfixture',
+            index=models.Index(fields=['date', 'time'], name='matchfixture_kickoff_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='matchfixture',
+            index=models.Index(fields=['league', 'date'], name='matchfixture_league_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.11 on 2026-10-17 03:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('games', '0011_fixture_window_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='balanceentry',
+            name='delta',
+            field=models.DecimalField(decimal_places=2, max_digits=10),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.11 on 2026-10-17 03:19
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('games', '0012_balanceentry_delta_digits'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='game',
+            name='game_result_idx',
+        ),
+    ]
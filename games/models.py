@@ -11,6 +11,7 @@ class Game(models.Model):
     GAME_STATUS = (
         ('OPEN', 'Open'),
         ('SETTLED', 'Settled'),
+        ('EXPIRED', 'Expired'),  # OPEN iliyopita active_until bila ku-settle (expire_games)
     )
     
     RESULT_CHOICES = (
@@ -34,6 +35,16 @@ class Game(models.Model):
     bet_type = models.CharField(max_length=20, default='Accumulator')
     total_odds = models.DecimalField(max_digits=10, decimal_places=2)
     
+    class Meta:
+        indexes = [
+            # Bet lists: filter by status, newest first. 'id' ni tie-breaker ya cursor
+            models.Index(fields=['status', '-created_at', '-id'], name='game_status_created_idx'),
+            models.Index(fields=['-created_at', '-id'], name='game_created_idx'),
+            # Active bets: status='OPEN' AND active_until >= now. Pia ina 'result' ili
+            # summary counts zisome index hii tu (covering) badala ya table nzima
+            models.Index(fields=['status', 'active_until', 'result'], name='game_summary_idx'),
+        ]
+    
     def __str__(self):
         return f"Game {self.id} - {self.status}"
     
@@ -68,11 +79,15 @@ class Match(models.Model):
 
 class Balance(models.Model):
     """
-    Model to store account balance
+    Model to store account balance.
+    
+    `amount` ni snapshot: balance hadi BalanceEntry yenye id = snapshot_entry_id.
+    Balance halisi = amount + jumla ya entries mpya zaidi (angalia games/ledger.py)
     """
     id = models.AutoField(primary_key=True)
     amount = models.DecimalField(max_digits=10, decimal_places=2, default=0.00)
     currency = models.CharField(max_length=10, default='TSh')
+    snapshot_entry_id = models.BigIntegerField(default=0)
     updated_at = models.DateTimeField(auto_now=True)
     created_at = models.DateTimeField(auto_now_add=True)
     
@@ -84,10 +99,36 @@ class Balance(models.Model):
         return f"{self.amount} {self.currency}"
 
 
+class BalanceEntry(models.Model):
+    """
+    Append-only ledger ya mabadiliko ya balance (credit > 0, debit < 0).
+    Rows hazibadilishwi wala kufutwa - snapshot tu ndio inasogea
+    """
+    id = models.BigAutoField(primary_key=True)
+    balance = models.ForeignKey(Balance, on_delete=models.CASCADE, related_name='entries')
+    # Sawa na Balance.amount - entry moja isizidi kile snapshot inaweza kuhifadhi
+    delta = models.DecimalField(max_digits=10, decimal_places=2)
+    reason = models.CharField(max_length=50, blank=True, default='')
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        verbose_name = "Balance entry"
+        verbose_name_plural = "Balance entries"
+        indexes = [
+            # Entries baada ya snapshot: balance_id = ? AND id > ?
+            models.Index(fields=['balance', 'id'], name='balanceentry_recent_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.delta:+} ({self.reason})"
 
-class MatchFixture(models.Model):
+
+
+class Fixture(models.Model):
     """
-    Model for match fixtures (different from bet matches)
+    Storage ya fixture ya sport yoyote (MatchFixture, effootball.Efootbal).
+    Engine ya fixtures (games.bulk, games.serializers, views za Fixture*View,
+    cache, live, sync) inafanya kazi kwa subclass yoyote ya model hii
     """
     eventId = models.IntegerField(unique=True)
     time = models.TimeField()
@@ -108,12 +149,46 @@ class MatchFixture(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     
     class Meta:
+        abstract = True
         ordering = ['date', 'time']
+        indexes = [
+            # Delta sync (?since=): rows zilizobadilika baada ya token
+            models.Index(fields=['updated_at', 'id'], name='%(class)s_updated_idx'),
+            # List ya mechi zijazo / dirisha la tarehe, kwa order ya list
+            models.Index(fields=['date', 'time'], name='%(class)s_kickoff_idx'),
+            # ?league= pamoja na dirisha la tarehe
+            models.Index(fields=['league', 'date'], name='%(class)s_league_idx'),
+        ]
     
     def __str__(self):
         return f"{self.homeTeam} vs {self.awayTeam} - {self.league}"
 
 
+class MatchFixture(Fixture):
+    """
+    Model for match fixtures (different from bet matches)
+    """
+
+
+class FixtureTombstone(models.Model):
+    """
+    Kumbukumbu ya fixture iliyofutwa (MatchFixture au Efootbal) ili delta sync
+    (?since=) iwaambie clients waifute. Zinafutwa na `manage.py prune_tombstones`
+    """
+    id = models.BigAutoField(primary_key=True)
+    fixture_model = models.CharField(max_length=50)  # model._meta.label_lower
+    fixture_id = models.BigIntegerField()
+    deleted_at = models.DateTimeField(default=timezone.now)
+    
+    class Meta:
+        indexes = [
+            models.Index(fields=['fixture_model', 'deleted_at'], name='tombstone_since_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.fixture_model} {self.fixture_id} deleted {self.deleted_at}"
+
+
 
 
 
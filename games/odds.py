@@ -0,0 +1,27 @@
+# games/odds.py
+from decimal import ROUND_HALF_UP, Decimal
+
+ODDS_PLACES = Decimal('0.01')
+
+
+def quantize_odds(value):
+    """Odds kwa decimal places 2 za DB (Game.total_odds / Game.odds)"""
+    return Decimal(value).quantize(ODDS_PLACES, rounding=ROUND_HALF_UP)
+
+
+def combined_odds(leg_odds):
+    """
+    Odds za accumulator: product ya odds za kila leg kwa Decimal (si float).
+    Product inahesabiwa kamili kutoka legs na kuzungushwa mara moja tu mwishoni -
+    payout ni stake * odds, hivyo odds zisihesabiwe kutoka total iliyozungushwa.
+    """
+    total = Decimal(1)
+    for odds in leg_odds:
+        total *= Decimal(odds)
+    return quantize_odds(total)
+
+
+def game_odds(leg_odds):
+    """Odds za Game: combined_odds() za legs, au 0 kwa game isiyo na legs"""
+    leg_odds = list(leg_odds)
+    return combined_odds(leg_odds) if leg_odds else quantize_odds(0)
@@ -0,0 +1,59 @@
+# games/pagination.py
+import base64
+import json
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(game):
+    """Opaque cursor ya (created_at, id) ya game ya mwisho kwenye page"""
+    raw = json.dumps([game.created_at.isoformat(), game.id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        created_at, game_id = json.loads(raw)
+        created_at = parse_datetime(created_at)
+    except (ValueError, TypeError):
+        raise InvalidCursor(cursor)
+    if created_at is None or not isinstance(game_id, str):
+        raise InvalidCursor(cursor)
+    return created_at, game_id
+
+
+def keyset_queryset(queryset, cursor, page_size):
+    """
+    Query ya page moja ya games kwa (created_at, id) DESC (+1 row kujua kama kuna
+    page inayofuata). Cost ni sawa kwa page 1 au page 10,000 - index seek badala ya OFFSET.
+    """
+    queryset = queryset.order_by('-created_at', '-id')
+    if cursor:
+        created_at, game_id = decode_cursor(cursor)
+        # created_at <= c inatoa index range; OR inashughulikia ties tu
+        queryset = queryset.filter(
+            Q(created_at__lte=created_at),
+            Q(created_at__lt=created_at) | Q(id__lt=game_id),
+        )
+
+    return queryset[:page_size + 1]
+
+
+def keyset_result(games, page_size):
+    """(games, next_cursor) kutoka rows za keyset_queryset()"""
+    if len(games) > page_size:
+        games = games[:page_size]
+        return games, encode_cursor(games[-1])
+    return games, None
+
+
+def keyset_page(queryset, cursor, page_size):
+    """Returns (games, next_cursor)"""
+    return keyset_result(list(keyset_queryset(queryset, cursor, page_size)), page_size)
+
@@ -0,0 +1,22 @@
+# games/renderers.py
+from rest_framework.renderers import JSONRenderer
+
+COLUMNAR_MEDIA_TYPE = 'application/vnd.vbclone.columnar+json'
+
+
+class ColumnarJSONRenderer(JSONRenderer):
+    """
+    Format ya columnar ya fixture lists (games.serializers.build_columnar_rows).
+    Inachaguliwa kwa `Accept: application/vnd.vbclone.columnar+json` au
+    ?format=columnar; view ndiyo inajenga data ya columnar - renderer ni JSON tu.
+    """
+    media_type = COLUMNAR_MEDIA_TYPE
+    format = 'columnar'
+
+
+def wants_columnar(request):
+    """Kama content negotiation ya DRF, kwa async views (HttpRequest)"""
+    requested = request.GET.get('format')
+    if requested is not None:
+        return requested == ColumnarJSONRenderer.format
+    return COLUMNAR_MEDIA_TYPE in request.headers.get('Accept', '')
@@ -1,8 +1,12 @@
 # games/serializers.py
+from django.conf import settings
+from django.db import transaction
 from django.utils import timezone 
 from rest_framework import serializers
-from .models import Game, Match,Balance, MatchFixture
-from datetime import datetime
+from .models import Game, Match,Balance, BalanceEntry, MatchFixture
+from .odds import game_odds
+from datetime import datetime, timedelta
+from operator import attrgetter
 
 class MatchSerializer(serializers.ModelSerializer):
     # Tumia match_ref badala ya id
@@ -30,6 +34,18 @@ class BalanceSerializer(serializers.ModelSerializer):
         if value not in allowed_currencies:
             raise serializers.ValidationError(f"Currency must be one of {allowed_currencies}")
         return value
+
+
+class BalanceEntrySerializer(serializers.ModelSerializer):
+    class Meta:
+        model = BalanceEntry
+        fields = ['id', 'delta', 'reason', 'created_at']
+        read_only_fields = ['id', 'created_at']
+    
+    def validate_delta(self, value):
+        if value == 0:
+            raise serializers.ValidationError("Delta cannot be zero")
+        return value
         
 class GameResponseSerializer(serializers.ModelSerializer):
     time = serializers.SerializerMethodField()
@@ -57,12 +73,19 @@ class GameResponseSerializer(serializers.ModelSerializer):
         return 0
     
     def get_details(self, obj):
+        # Views za list hufanya prefetch_related('matches'), hivyo .all() inasoma
+        # cache bila query mpya. Usiongeze filter/order_by hapa - itavunja prefetch
         matches = obj.matches.all()
         return {
             'matches': MatchSerializer(matches, many=True).data,
             'betType': obj.bet_type,
             'totalOdds': float(obj.total_odds)
         }
+def serialize_games(games):
+    """GameResponseSerializer(games, many=True).data - kwa chunks za streaming"""
+    return GameResponseSerializer(games, many=True).data
+
+
 class MatchNestedSerializer(serializers.ModelSerializer):
     class Meta:
         model = Match
@@ -73,26 +96,35 @@ class CreateBetSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Game
-        fields = ['id', 'stake', 'currency', 'total_odds', 'odds', 'bet_type', 'status', 'result', 'matches']
-        read_only_fields = ['id', 'total_odds', 'odds', 'status', 'result']
+        fields = ['id', 'stake', 'currency', 'total_odds', 'odds', 'bet_type', 'status', 'result', 'active_until', 'matches']
+        # active_until inawekwa na server (sasa + BET_ACTIVE_HOURS) - client hawezi
+        # kuweka bet iliyokwisha muda wala isiyoisha
+        read_only_fields = ['id', 'total_odds', 'odds', 'status', 'result', 'active_until']
+
+    def validate_matches(self, value):
+        refs = [match['match_ref'] for match in value]
+        if len(refs) != len(set(refs)):
+            raise serializers.ValidationError("match_ref must be unique within a bet")
+        return value
 
     def create(self, validated_data):
         matches_data = validated_data.pop('matches', [])
-        # Hesabu total odds
-        total_odds = 1
-        for match in matches_data:
-            total_odds *= float(match['odds'])
-
-        game = Game.objects.create(
-            **validated_data,
-            total_odds=round(total_odds, 2),
-            odds=round(total_odds, 2),
-            status='OPEN',
-            result='PENDING'
-        )
-
-        for match_data in matches_data:
-            Match.objects.create(game=game, **match_data)
+        validated_data['active_until'] = timezone.now() + timedelta(hours=getattr(settings, 'BET_ACTIVE_HOURS', 24))
+        # Hesabu total odds kwa Decimal (exact, hakuna float rounding)
+        total_odds = game_odds(match['odds'] for match in matches_data)
+
+        # Bet nzima au hakuna kitu: Game + legs zote kwa transaction moja
+        with transaction.atomic():
+            game = Game.objects.create(
+                **validated_data,
+                total_odds=total_odds,
+                odds=total_odds,
+                status='OPEN',
+                result='PENDING'
+            )
+            Match.objects.bulk_create([
+                Match(game=game, **match_data) for match_data in matches_data
+            ])
 
         return game
 
@@ -103,7 +135,11 @@ class CreateBetSerializer(serializers.ModelSerializer):
         instance.save()
         return instance
 
-class MatchFixtureSerializer(serializers.ModelSerializer):
+class FixtureSerializer(serializers.ModelSerializer):
+    """
+    Serializer ya fixture kwa subclass yoyote ya models.Fixture - subclass
+    inaweka Meta.model tu (class Meta(FixtureSerializer.Meta))
+    """
     # These fields handle the actual DB values
     # We make them 'write_only' so they don't interfere with our custom output
     homeOdds_val = serializers.DecimalField(source='homeOdds', max_digits=10, decimal_places=2, write_only=True)
@@ -116,7 +152,6 @@ class MatchFixtureSerializer(serializers.ModelSerializer):
     awayOdds = serializers.SerializerMethodField(read_only=True)
 
     class Meta:
-        model = MatchFixture
         fields = [
             'id', 'eventId', 'time', 'date', 'homeTeam', 'awayTeam',
             'league', 'homeOdds', 'drawOdds', 'awayOdds', 
@@ -154,14 +189,96 @@ class MatchFixtureSerializer(serializers.ModelSerializer):
                 mutable_data[f'{field}_val'] = val
 
         return super().to_internal_value(mutable_data)
-    
 
 
+class MatchFixtureSerializer(FixtureSerializer):
+    class Meta(FixtureSerializer.Meta):
+        model = MatchFixture
+
+
+# ============================================
+# FAST READ PATH - fixture lists
+# ============================================
+# Columns kwa order ambayo fixture_rows() inazi-unpack
+FIXTURE_LIST_COLUMNS = (
+    'id', 'eventId', 'time', 'date', 'homeTeam', 'awayTeam', 'league',
+    'homeOdds', 'homeOddsFire', 'drawOdds', 'drawOddsFire', 'awayOdds', 'awayOddsFire',
+    'betCount', 'hasBoostedOdds', 'hasTwoUp',
+)
+_fixture_columns = attrgetter(*FIXTURE_LIST_COLUMNS)
+
 
+def build_fixture_rows(rows):
+    """
+    Read-only version ya FixtureSerializer(..., many=True).data.
 
+    Inajenga dicts moja kwa moja kutoka tuples za FIXTURE_LIST_COLUMNS - hakuna
+    field-by-field dispatch ya DRF. JSON inayotoka ni sawa byte kwa byte na ya
+    serializer. Inafanya kazi kwa subclass yoyote ya models.Fixture.
+    """
+    return [
+        {
+            'id': pk,
+            'eventId': event_id,
+            'time': time.isoformat(),
+            'date': date.isoformat(),
+            'homeTeam': home_team,
+            'awayTeam': away_team,
+            'league': league,
+            'homeOdds': {'value': str(home_odds), 'hasFireIcon': home_fire or boosted},
+            'drawOdds': {'value': str(draw_odds), 'hasFireIcon': draw_fire},
+            'awayOdds': {'value': str(away_odds), 'hasFireIcon': away_fire},
+            'betCount': bet_count,
+            'hasBoostedOdds': boosted,
+            'hasTwoUp': two_up,
+        }
+        for (
+            pk, event_id, time, date, home_team, away_team, league,
+            home_odds, home_fire, draw_odds, draw_fire, away_odds, away_fire,
+            bet_count, boosted, two_up,
+        ) in rows
+    ]
+
+
+def fixture_rows(queryset):
+    """Fixture list kutoka values_list() - hakuna model instances"""
+    return build_fixture_rows(queryset.values_list(*FIXTURE_LIST_COLUMNS))
 
 
+def fixture_rows_from_objects(fixtures):
+    """Fixture list kutoka instances zilizopo kwenye memory (mf. baada ya bulk_create)"""
+    return build_fixture_rows(map(_fixture_columns, fixtures))
 
 
+# ============================================
+# COLUMNAR FORMAT - fixture lists (?format=columnar)
+# ============================================
+# Row ya kwanza ni majina ya fields, kisha kila fixture ni array ya values kwa
+# order hiyo. Odds ni strings kama format ya kawaida; fire icons na flags
+# nyingine za boolean ziko kwenye `flags` (bitmask).
+FIXTURE_COLUMNAR_FIELDS = (
+    'id', 'eventId', 'time', 'date', 'homeTeam', 'awayTeam', 'league',
+    'homeOdds', 'drawOdds', 'awayOdds', 'betCount', 'flags',
+)
+HOME_FIRE = 1  # homeOdds.hasFireIcon (homeOddsFire au hasBoostedOdds)
+DRAW_FIRE = 2  # drawOdds.hasFireIcon
+AWAY_FIRE = 4  # awayOdds.hasFireIcon
+BOOSTED_ODDS = 8  # hasBoostedOdds
+TWO_UP = 16  # hasTwoUp
 
- 
\ No newline at end of file
+
+def build_columnar_rows(rows):
+    """Values za fixtures (bila header) kutoka tuples za FIXTURE_LIST_COLUMNS"""
+    return [
+        [
+            pk, event_id, time.isoformat(), date.isoformat(), home_team, away_team, league,
+            str(home_odds), str(draw_odds), str(away_odds), bet_count,
+            (HOME_FIRE if home_fire or boosted else 0) | (DRAW_FIRE if draw_fire else 0)
+            | (AWAY_FIRE if away_fire else 0) | (BOOSTED_ODDS if boosted else 0) | (TWO_UP if two_up else 0),
+        ]
+        for (
+            pk, event_id, time, date, home_team, away_team, league,
+            home_odds, home_fire, draw_odds, draw_fire, away_odds, away_fire,
+            bet_count, boosted, two_up,
+        ) in rows
+    ]
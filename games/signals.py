@@ -0,0 +1,21 @@
+# games/signals.py
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import invalidate_bet_summary
+from .live import publish_fixture_changes
+from .models import Game, Match, MatchFixture
+
+
+@receiver([post_save, post_delete], sender=Game)
+@receiver([post_save, post_delete], sender=Match)
+def game_changed(sender, **kwargs):
+    invalidate_bet_summary()
+
+
+@receiver(post_save, sender=MatchFixture)
+def fixture_saved(sender, instance, **kwargs):
+    # Bulk writes (games.bulk) na deletes (views) zina-publish zenyewe - hazitumi
+    # signals, na post_delete receiver ingezima fast delete ya bulk delete
+    publish_fixture_changes(sender, fixtures=[instance])
+
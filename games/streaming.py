@@ -0,0 +1,113 @@
+# games/streaming.py
+"""
+Streaming JSON kwa list endpoints kubwa (bets, fixtures, eFootball).
+
+Badala ya kujenga list nzima na string moja kubwa ya JSON, queryset inasomwa kwa
+iterator(chunk_size=...) na kila chunk ina-render kuwa kipande cha JSON array
+kinachotumwa mara moja kwa StreamingHttpResponse. Memory ya worker inategemea
+chunk_size, si ukubwa wa table. Bytes zinazotoka ni sawa na za Response ya
+kawaida (JSONRenderer ni compact, hivyo '[' + chunks.join(',') + ']' ni sawa).
+
+Chagua kwa ?stream=true, au STREAM_LIST_RESPONSES = True kwa list zote.
+"""
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from rest_framework.renderers import JSONRenderer
+
+FALSE_VALUES = ('0', 'false', 'no')
+TRUE_VALUES = ('1', 'true', 'yes')
+
+
+def stream_chunk_size():
+    return getattr(settings, 'STREAM_CHUNK_SIZE', 500)
+
+
+def wants_stream(params):
+    value = params.get('stream', '').lower()
+    if value in TRUE_VALUES:
+        return True
+    if value in FALSE_VALUES:
+        return False
+    return getattr(settings, 'STREAM_LIST_RESPONSES', False)
+
+
+def pinned(queryset):
+    """
+    Body ya stream inasomwa baada ya view kurudi (na baada ya middleware ya
+    replica ku-reset routing) - chagua database sasa, si wakati wa kusoma
+    """
+    return queryset.using(queryset.db)
+
+
+def render_chunk(renderer, items):
+    """JSON array ya items bila '[' na ']'"""
+    return renderer.render(items)[1:-1]
+
+
+def json_array_chunks(batches, build, head=()):
+    """
+    Generator ya bytes za JSON array moja; `build(batch)` -> list ya items.
+    `head` ni items zinazotangulia (mf. header row ya format ya columnar)
+    """
+    renderer = JSONRenderer()
+    yield b'['
+    first = not head
+    if head:
+        yield render_chunk(renderer, list(head))
+    for batch in batches:
+        if not batch:
+            continue
+        chunk = render_chunk(renderer, build(batch))
+        yield chunk if first else b',' + chunk
+        first = False
+    yield b']'
+
+
+async def ajson_array_chunks(batches, build, head=()):
+    """json_array_chunks() kwa async iterator ya batches"""
+    renderer = JSONRenderer()
+    yield b'['
+    first = not head
+    if head:
+        yield render_chunk(renderer, list(head))
+    async for batch in batches:
+        if not batch:
+            continue
+        chunk = render_chunk(renderer, build(batch))
+        yield chunk if first else b',' + chunk
+        first = False
+    yield b']'
+
+
+def batched(iterator, size):
+    iterator = iter(iterator)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+async def athreaded(iterator):
+    """Kila next() ya sync iterator (ORM) inaendeshwa kwenye thread ya DB"""
+    while (item := await sync_to_async(next)(iterator, None)) is not None:
+        yield item
+
+
+def stream_queryset(queryset, build, chunk_size=None, head=()):
+    """Bytes za JSON array ya queryset, chunk moja ya rows kwa wakati"""
+    chunk_size = chunk_size or stream_chunk_size()
+    rows = pinned(queryset).iterator(chunk_size=chunk_size)
+    return json_array_chunks(batched(rows, chunk_size), build, head)
+
+
+def astream_queryset(queryset, build, chunk_size=None, head=()):
+    """stream_queryset() kwa async views"""
+    # Si aiterator(): values_list() yake inaendesha SQL ndani ya event loop
+    chunk_size = chunk_size or stream_chunk_size()
+    rows = pinned(queryset).iterator(chunk_size=chunk_size)
+    return ajson_array_chunks(athreaded(batched(rows, chunk_size)), build, head)
+
+
+def streaming_json_response(chunks, status=200, headers=None, content_type='application/json'):
+    return StreamingHttpResponse(chunks, status=status, content_type=content_type, headers=headers)
@@ -1,3 +1,1654 @@
-from django.test import TestCase
+import asyncio
+import json
+import logging
+import sqlite3
+import tempfile
+import threading
+import tracemalloc
+from datetime import date, time, timedelta
+from decimal import Decimal
+from io import StringIO
+from pathlib import Path
+from unittest import mock
 
-# Create your tests here.
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection, connections, router
+from django.db.utils import ConnectionHandler
+from django.http import HttpResponse
+from django.test import (
+    AsyncClient, AsyncRequestFactory, RequestFactory, SimpleTestCase, TestCase, override_settings, tag,
+)
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from . import async_views
+from .bulk import expire_games_batch
+from .db import REPLICA_PIN_COOKIE, ReplicaRoutingMiddleware, copy_database, set_journal_mode
+from .ledger import take_snapshot
+from .live import RESYNC, fixture_channel, get_hub, sse_message
+from .log import QueueLogHandler
+from .metrics import registry, render_prometheus
+from .models import Balance, BalanceEntry, FixtureTombstone, Game, Match, MatchFixture
+from .serializers import FIXTURE_COLUMNAR_FIELDS, MatchFixtureSerializer, fixture_rows
+from .sync import encode_sync_token
+from .views import BalanceEntryView, BetCRUDView, BetFilterView
+
+
+def make_game(**kwargs):
+    defaults = {
+        'stake': Decimal('1000.00'),
+        'odds': Decimal('2.50'),
+        'total_odds': Decimal('2.50'),
+        'active_until': timezone.now() + timedelta(days=1),
+    }
+    defaults.update(kwargs)
+    game = Game.objects.create(**defaults)
+    Match.objects.create(
+        game=game, match_ref='M001', teams='Simba vs Yanga',
+        market='1X2', selection='Simba', odds=Decimal('2.50'),
+    )
+    return game
+
+
+def make_fixture(model=MatchFixture, event_id=1, **kwargs):
+    defaults = {
+        'eventId': event_id,
+        'time': time(18, 30),
+        'date': timezone.localdate() + timedelta(days=event_id % 30 + 1),
+        'homeTeam': f'Home {event_id}',
+        'awayTeam': f'Away {event_id}',
+        'league': 'NBC Premier League',
+        'homeOdds': Decimal('1.50'),
+        'drawOdds': Decimal('3.20'),
+        'awayOdds': Decimal('5.75'),
+    }
+    defaults.update(kwargs)
+    return model.objects.create(**defaults)
+
+
+class QueryPlanMixin:
+    """
+    Helpers za kusoma SQLite EXPLAIN QUERY PLAN ya queries za view
+    """
+
+    def capture_selects(self, url, method='get', data=None):
+        """Run the view and keep every SELECT exactly as sent (sql + params)"""
+        captured = []
+
+        def wrapper(execute, sql, params, many, context):
+            if sql.startswith('SELECT'):
+                captured.append((sql, params))
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(wrapper):
+            response = getattr(self.client, method)(url, data, content_type='application/json')
+        self.assertLess(response.status_code, 500)
+        return captured
+
+    def explain(self, sql, params):
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+            return [row[-1] for row in cursor.fetchall()]
+
+    def assert_view_queries_use_indexes(self, url, method='get', data=None, index_sort=False):
+        selects = self.capture_selects(url, method, data)
+        self.assertTrue(selects)
+        for sql, params in selects:
+            for step in self.explain(sql, params):
+                if step.startswith(('SCAN', 'SEARCH')) and 'games_game' in step:
+                    self.assertIn('INDEX', step, f'{url}: {step}\n{sql}')
+                if index_sort:
+                    self.assertNotIn('TEMP B-TREE FOR ORDER BY', step, f'{url}: {step}\n{sql}')
+
+
+class GameIndexQueryPlanTests(QueryPlanMixin, TestCase):
+    """
+    Hakikisha kila query ya bets views inatumia index
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cache.clear()
+        cls.open_game = make_game()
+        cls.settled_game = make_game(status='SETTLED', result='WON')
+
+    def test_bet_list_uses_index(self):
+        self.assert_view_queries_use_indexes('/api/bets/', index_sort=True)
+        self.assert_view_queries_use_indexes('/api/bets/?status=open&limit=10', index_sort=True)
+        self.assert_view_queries_use_indexes('/api/bets/?status=settled', index_sort=True)
+
+    def test_bet_summary_uses_index(self):
+        self.assert_view_queries_use_indexes('/api/bets/filter/summary/')
+
+    def test_bet_approve_uses_index(self):
+        self.assert_view_queries_use_indexes(
+            f'/api/bets/{self.open_game.id}/approve/', method='post', data={'result': 'WON'}
+        )
+
+    def test_expired_open_games_use_index(self):
+        qs = Game.objects.filter(status='OPEN', active_until__lt=timezone.now())
+        plan = ' '.join(self.explain(*qs.query.sql_with_params()))
+        self.assertIn('game_summary_idx', plan)
+
+
+class BetFilterViewTests(TestCase):
+    url = '/api/bets/filter/summary/'
+
+    def setUp(self):
+        cache.clear()
+
+    def test_counts_use_single_query(self):
+        for _ in range(3):
+            make_game()
+        make_game(status='SETTLED', result='WON')
+        make_game(status='SETTLED', result='LOST')
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(self.url)
+        count_queries = [q for q in ctx.captured_queries if 'COUNT(' in q['sql']]
+        self.assertEqual(len(count_queries), 1)
+        self.assertEqual(response.data['counts'], {
+            'total': 5, 'active': 3, 'settled': 2, 'pending': 3, 'won': 1, 'lost': 1,
+        })
+
+    def test_active_and_settled_are_paginated(self):
+        for _ in range(5):
+            make_game()
+
+        response = self.client.get(self.url, {'page_size': 2, 'active_page': 3})
+        self.assertEqual(len(response.data['active']), 1)
+        self.assertEqual(response.data['pagination']['active'], {
+            'page': 3, 'page_size': 2, 'total_pages': 3, 'has_next': False,
+        })
+
+        response = self.client.get(self.url, {'page_size': 1000})
+        self.assertEqual(response.data['pagination']['active']['page_size'], BetFilterView.MAX_PAGE_SIZE)
+
+    def test_page_beyond_last_is_clamped(self):
+        for _ in range(5):
+            make_game()
+
+        response = self.client.get(self.url, {
+            'page_size': 2, 'active_page': '99999999999999999999', 'settled_page': 7,
+        })
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['active']), 1)
+        self.assertEqual(response.data['pagination']['active']['page'], 3)
+        self.assertEqual(response.data['pagination']['settled'], {
+            'page': 1, 'page_size': 2, 'total_pages': 0, 'has_next': False,
+        })
+
+        response = self.client.get(self.url, {'page_size': '²', 'active_page': '²'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['pagination']['active']['page'], 1)
+
+    def test_summary_is_cached_until_game_changes(self):
+        game = make_game()
+        self.client.get(self.url)
+
+        with self.assertNumQueries(0):
+            self.client.get(self.url)
+
+        game.status = 'SETTLED'
+        game.save()
+        response = self.client.get(self.url)
+        self.assertEqual(response.data['counts']['settled'], 1)
+
+
+class BetQueryCountTests(TestCase):
+    """
+    Idadi ya queries haitegemei idadi ya bets (hakuna N+1 kwenye details)
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.games = [make_game() for _ in range(15)]
+        for game in cls.games[:5]:
+            game.status = 'SETTLED'
+            game.result = 'WON'
+            game.save()
+
+    def setUp(self):
+        cache.clear()
+
+    def test_bet_list_query_count(self):
+        # games + matches
+        with self.assertNumQueries(2):
+            response = self.client.get('/api/bets/')
+        self.assertEqual(len(response.data), 15)
+        self.assertEqual(len(response.data[0]['details']['matches']), 1)
+
+        with self.assertNumQueries(2):
+            self.client.get('/api/bets/', {'status': 'settled', 'limit': 3})
+
+    def test_bet_detail_query_count(self):
+        with self.assertNumQueries(2):
+            self.client.get(f'/api/bets/{self.games[0].id}/')
+
+    def test_bet_summary_query_count(self):
+        # counts + (games + matches) kwa active, settled na recent
+        with self.assertNumQueries(7):
+            response = self.client.get('/api/bets/filter/summary/')
+        self.assertEqual(response.data['counts']['total'], 15)
+
+
+class BetCursorPaginationTests(QueryPlanMixin, TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.games = [make_game() for _ in range(7)]
+        cls.games[3].status = 'SETTLED'
+        cls.games[3].save()
+        # Ties kwenye created_at - id ndio inaamua order
+        Game.objects.filter(pk__in=[g.pk for g in cls.games[:4]]).update(
+            created_at=cls.games[0].created_at
+        )
+
+    def collect(self, **params):
+        ids, cursor = [], None
+        while True:
+            query = dict(params, page_size=3)
+            if cursor:
+                query['cursor'] = cursor
+            response = self.client.get('/api/bets/', query)
+            self.assertEqual(response.status_code, 200)
+            self.assertLessEqual(len(response.data['results']), 3)
+            ids += [game['id'] for game in response.data['results']]
+            cursor = response.data['next']
+            if not cursor:
+                return ids
+
+    def test_pages_cover_every_bet_once_in_order(self):
+        expected = list(
+            Game.objects.order_by('-created_at', '-id').values_list('id', flat=True)
+        )
+        self.assertEqual(self.collect(), expected)
+
+    def test_status_filter_with_cursor(self):
+        expected = list(
+            Game.objects.filter(status='OPEN').order_by('-created_at', '-id').values_list('id', flat=True)
+        )
+        self.assertEqual(self.collect(status='open'), expected)
+
+    def test_invalid_cursor(self):
+        response = self.client.get('/api/bets/', {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_legacy_list_response_unchanged(self):
+        response = self.client.get('/api/bets/', {'limit': 2})
+        self.assertIsInstance(response.data, list)
+        self.assertEqual(len(response.data), 2)
+
+    def test_malformed_limit_and_page_size(self):
+        everything = self.client.get('/api/bets/').data
+        for limit in ('²', '99999999999999999999', '-1'):
+            self.assertEqual(self.client.get('/api/bets/', {'limit': limit}).data, everything, limit)
+        response = self.client.get('/api/bets/', {'page_size': '²'})
+        self.assertEqual(len(response.data['results']), min(len(everything), BetCRUDView.DEFAULT_PAGE_SIZE))
+
+    def test_deep_page_uses_index_seek(self):
+        cursor = self.client.get('/api/bets/', {'page_size': 2}).data['next']
+        with self.assertNumQueries(2):
+            self.client.get('/api/bets/', {'page_size': 2, 'cursor': cursor})
+
+        self.assert_view_queries_use_indexes(
+            f'/api/bets/?page_size=2&cursor={cursor}', index_sort=True
+        )
+        self.assert_view_queries_use_indexes(
+            f'/api/bets/?status=open&page_size=2&cursor={cursor}', index_sort=True
+        )
+
+
+class FixtureRowsTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        make_fixture(event_id=1)
+        make_fixture(event_id=2, homeOddsFire=True, awayOddsFire=True, betCount=42)
+        make_fixture(event_id=3, hasBoostedOdds=True, hasTwoUp=True, time=time(9, 5, 7, 120))
+        make_fixture(event_id=4, drawOddsFire=True, homeOdds=Decimal('10'), awayTeam='Azam FC "B"')
+
+    def test_output_is_byte_identical_to_serializer(self):
+        fixtures = MatchFixture.objects.order_by('date', 'time')
+        renderer = JSONRenderer()
+        self.assertEqual(
+            renderer.render(fixture_rows(fixtures)),
+            renderer.render(MatchFixtureSerializer(fixtures, many=True).data),
+        )
+
+    def test_list_view_uses_fast_path(self):
+        # ETag fingerprint + list
+        with self.assertNumQueries(2):
+            response = self.client.get('/api/fixtures/')
+        fixtures = MatchFixture.objects.order_by('date', 'time')
+        self.assertEqual(
+            response.content,
+            JSONRenderer().render(MatchFixtureSerializer(fixtures, many=True).data),
+        )
+
+
+class FixtureConditionalGetTests(TestCase):
+    url = '/api/fixtures/'
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.fixture = make_fixture(event_id=1)
+        make_fixture(event_id=2)
+
+    def test_if_none_match_returns_304_without_serializing(self):
+        etag = self.client.get(self.url)['ETag']
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+        self.assertEqual(response.content, b'')
+
+        response = self.client.get(self.url, headers={'If-None-Match': f'W/{etag}'})
+        self.assertEqual(response.status_code, 304)
+
+    def test_etag_changes_on_update_and_delete(self):
+        etag = self.client.get(self.url)['ETag']
+
+        self.fixture.homeOdds = Decimal('1.65')
+        self.fixture.save()
+        response = self.client.get(self.url, headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+        etag = response['ETag']
+        MatchFixture.objects.filter(eventId=2).delete()
+        response = self.client.get(self.url, headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data), 1)
+
+
+def fixture_payload(event_id, **kwargs):
+    payload = {
+        'eventId': event_id,
+        'time': '18:30:00',
+        'date': (timezone.localdate() + timedelta(days=1)).isoformat(),
+        'homeTeam': f'Home {event_id}',
+        'awayTeam': f'Away {event_id}',
+        'league': 'NBC Premier League',
+        'homeOdds': {'value': '1.50', 'hasFireIcon': False},
+        'drawOdds': {'value': '3.20', 'hasFireIcon': False},
+        'awayOdds': {'value': '5.75', 'hasFireIcon': False},
+    }
+    payload.update(kwargs)
+    return payload
+
+
+class FixtureBulkCreateTests(TestCase):
+    url = '/api/fixtures/bulk/'
+
+    def post(self, payload, url=None):
+        return self.client.post(url or self.url, payload, content_type='application/json')
+
+    def test_bulk_create_uses_constant_queries(self):
+        payload = [fixture_payload(i) for i in range(1, 201)]
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.post(payload)
+        sql = [q['sql'].split()[0] for q in ctx.captured_queries]
+        # eventId lookup moja, INSERT chache za batch (si moja kwa kila row), transaction moja
+        self.assertEqual(sql.count('SELECT'), 1)
+        self.assertLess(sql.count('INSERT'), 10)
+        self.assertEqual(sql.count('SAVEPOINT'), 1)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['total_created'], 200)
+        self.assertEqual(MatchFixture.objects.count(), 200)
+
+        fixtures = MatchFixture.objects.order_by('pk')
+        self.assertEqual(
+            JSONRenderer().render(response.data['created']),
+            JSONRenderer().render(MatchFixtureSerializer(fixtures, many=True).data),
+        )
+
+    def test_errors_are_reported_per_index(self):
+        make_fixture(event_id=1)
+        response = self.post([
+            fixture_payload(1),
+            fixture_payload(2),
+            fixture_payload(3, homeTeam=''),
+            fixture_payload(2),
+            'not-a-fixture',
+        ])
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['total_created'], 1)
+        self.assertEqual([e['index'] for e in response.data['errors']], [0, 2, 3, 4])
+
+        # Ujumbe sawa na wa serializer ya kawaida
+        serializer = MatchFixtureSerializer(data=fixture_payload(1))
+        serializer.is_valid()
+        self.assertEqual(response.data['errors'][0]['errors'], serializer.errors)
+
+    def test_upsert_updates_existing_event_ids(self):
+        fixture = make_fixture(event_id=1, betCount=9)
+        response = self.post(
+            [fixture_payload(1, homeOdds={'value': '1.80'}), fixture_payload(2)],
+            url=f'{self.url}?upsert=true',
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['total_created'], 1)
+        self.assertEqual(response.data['total_updated'], 1)
+        self.assertEqual(response.data['errors'], [])
+
+        fixture.refresh_from_db()
+        self.assertEqual(fixture.homeOdds, Decimal('1.80'))
+        # Field ambayo haikutumwa haibadilishwi
+        self.assertEqual(fixture.betCount, 9)
+        self.assertEqual(response.data['updated'][0]['homeOdds']['value'], '1.80')
+        self.assertEqual(response.data['updated'][0]['betCount'], 9)
+
+        # Re-send ni idempotent
+        response = self.post(
+            [fixture_payload(1, homeOdds={'value': '1.80'}), fixture_payload(2)],
+            url=f'{self.url}?upsert=true',
+        )
+        self.assertEqual(response.data['total_updated'], 2)
+        self.assertEqual(MatchFixture.objects.count(), 2)
+
+
+class FixtureBulkUpdateTests(TestCase):
+    url = '/api/fixtures/bulk/update/'
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.fixtures = [make_fixture(event_id=i, betCount=i) for i in range(1, 51)]
+
+    def put(self, payload):
+        return self.client.put(self.url, payload, content_type='application/json')
+
+    def test_bulk_update_is_set_based(self):
+        payload = [
+            dict(fixture_payload(f.eventId, homeOdds={'value': '2.05'}), id=f.pk)
+            for f in self.fixtures
+        ]
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.put(payload)
+        sql = [q['sql'].split()[0] for q in ctx.captured_queries]
+        # in_bulk + eventId owners, UPDATE chache, transaction moja
+        self.assertEqual(sql.count('SELECT'), 2)
+        self.assertLess(sql.count('UPDATE'), 5)
+        self.assertEqual(sql.count('SAVEPOINT'), 1)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['total_updated'], 50)
+        self.assertEqual(
+            set(MatchFixture.objects.values_list('homeOdds', flat=True)), {Decimal('2.05')}
+        )
+        # betCount haikutumwa - haibadiliki
+        self.assertEqual(MatchFixture.objects.get(pk=self.fixtures[4].pk).betCount, 5)
+        self.assertEqual(
+            JSONRenderer().render(response.data['updated']),
+            JSONRenderer().render(
+                MatchFixtureSerializer(MatchFixture.objects.order_by('pk'), many=True).data
+            ),
+        )
+
+    def test_unchanged_rows_are_not_written(self):
+        fixture = self.fixtures[0]
+        payload = [dict(
+            fixture_payload(fixture.eventId, date=fixture.date.isoformat(), betCount=fixture.betCount),
+            id=fixture.pk,
+        )]
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.put(payload)
+        self.assertEqual(response.data['total_updated'], 1)
+        self.assertFalse([q for q in ctx.captured_queries if q['sql'].startswith('UPDATE')])
+
+    def test_errors_are_reported_per_index(self):
+        first, second = self.fixtures[:2]
+        response = self.put([
+            fixture_payload(1),
+            dict(fixture_payload(1), id=999999),
+            dict(fixture_payload(1, homeTeam=''), id=first.pk),
+            dict(fixture_payload(second.eventId), id=first.pk),
+            dict(fixture_payload(second.eventId, awayTeam='Namungo'), id=second.pk),
+        ])
+        self.assertEqual(response.status_code, 200)
+        errors = response.data['errors']
+        self.assertEqual([e['index'] for e in errors], [0, 1, 2, 3])
+        self.assertEqual(errors[0]['errors'], {'id': 'This field is required for updates'})
+        self.assertEqual(errors[1]['errors'], {'id': 'Fixture with id 999999 not found'})
+        self.assertIn('homeTeam', errors[2]['errors'])
+        self.assertIn('eventId', errors[3]['errors'])
+        self.assertEqual(response.data['total_updated'], 1)
+        self.assertEqual(MatchFixture.objects.get(pk=second.pk).awayTeam, 'Namungo')
+
+    def test_non_numeric_ids_are_not_found(self):
+        fixture = self.fixtures[0]
+        response = self.put([
+            *(dict(fixture_payload(2), id=fixture_id) for fixture_id in ('²', 'abc', '-1')),
+            dict(fixture_payload(fixture.eventId), id=fixture.pk),
+        ])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['total_updated'], 1)
+        self.assertEqual(
+            [e['errors'] for e in response.data['errors']],
+            [{'id': f'Fixture with id {fixture_id} not found'} for fixture_id in ('²', 'abc', '-1')],
+        )
+
+
+class FixtureBulkDeleteTests(TestCase):
+    url = '/api/fixtures/bulk/delete/'
+
+    def delete(self, ids):
+        return self.client.delete(self.url, {'ids': ids}, content_type='application/json')
+
+    def test_single_select_and_delete(self):
+        fixtures = [make_fixture(event_id=i) for i in range(1, 21)]
+        ids = [f.pk for f in fixtures[:10]] + [999999, 'abc']
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.delete(ids)
+        sql = [q['sql'].split()[0] for q in ctx.captured_queries]
+        self.assertEqual(sql.count('SELECT'), 1)
+        self.assertEqual(sql.count('DELETE'), 1)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['total_deleted'], 10)
+        self.assertEqual(response.data['not_found'], [999999, 'abc'])
+        self.assertEqual(response.data['deleted'][0], {
+            'id': fixtures[0].pk, 'eventId': 1, 'homeTeam': 'Home 1', 'awayTeam': 'Away 1',
+        })
+        self.assertEqual(MatchFixture.objects.count(), 10)
+
+    def test_large_id_lists_are_chunked(self):
+        MatchFixture.objects.bulk_create([
+            MatchFixture(
+                eventId=i, time=time(12, 0), date=date(2026, 3, 1), homeTeam='A', awayTeam='B',
+                league='L', homeOdds=Decimal('1.10'), drawOdds=Decimal('2.20'), awayOdds=Decimal('3.30'),
+            )
+            for i in range(1, 1201)
+        ])
+        ids = list(MatchFixture.objects.values_list('pk', flat=True))
+        response = self.delete(ids + [ids[0]])
+        self.assertEqual(response.data['total_deleted'], 1200)
+        # id iliyorudiwa imeshafutwa
+        self.assertEqual(response.data['not_found'], [ids[0]])
+        self.assertFalse(MatchFixture.objects.exists())
+
+    def test_nothing_found(self):
+        response = self.delete([123])
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.data['not_found'], [123])
+
+    def test_non_numeric_ids_are_not_found(self):
+        fixture = make_fixture(event_id=1)
+        response = self.delete(['²', '-1', fixture.pk])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['not_found'], ['²', '-1'])
+        self.assertEqual(response.data['total_deleted'], 1)
+
+    def test_ids_must_be_a_list(self):
+        for body in ([1, 2], {'ids': 1}, {'ids': '²'}, {'ids': {'id': 1}}, {}, '"ids"'):
+            response = self.client.delete(self.url, body, content_type='application/json')
+            self.assertEqual(response.status_code, 400, body)
+            self.assertEqual(response.data, {'error': 'Expected a list of fixture ids'})
+
+
+class BetBulkApproveTests(TestCase):
+    url = '/api/bets/bulk/approve/'
+
+    def post(self, payload):
+        return self.client.post(self.url, payload, content_type='application/json')
+
+    def test_settles_batch_in_one_transaction(self):
+        games = [make_game() for _ in range(30)]
+        payload = [
+            {'game_id': game.id, 'result': 'WON' if i % 2 else 'LOST'}
+            for i, game in enumerate(games)
+        ]
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.post(payload)
+        sql = [q['sql'].split()[0] for q in ctx.captured_queries]
+        self.assertEqual(sql.count('SELECT'), 1)
+        self.assertEqual(sql.count('UPDATE'), 1)
+        self.assertEqual(sql.count('SAVEPOINT'), 1)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['total_settled'], 30)
+        self.assertEqual(response.data['settled'][1]['payout'], '2500.00')
+        self.assertEqual(response.data['settled'][0]['payout'], '0.00')
+
+        game = Game.objects.get(pk=games[1].pk)
+        self.assertEqual((game.status, game.result, game.payout), ('SETTLED', 'WON', Decimal('2500.00')))
+        self.assertIsNotNone(game.settled_at)
+
+    def test_per_game_errors(self):
+        open_game = make_game()
+        settled_game = make_game(status='SETTLED', result='LOST')
+        expired_game = make_game(active_until=timezone.now() - timedelta(minutes=1))
+
+        response = self.post([
+            {'game_id': open_game.id, 'result': 'WON'},
+            {'game_id': 'missing'},
+            {'game_id': settled_game.id},
+            {'game_id': expired_game.id},
+            {'game_id': open_game.id},
+            {'game_id': open_game.id, 'result': 'PENDING'},
+            {'result': 'WON'},
+        ])
+        self.assertEqual(response.data['total_settled'], 1)
+        self.assertEqual(
+            [(e['index'], e['error']) for e in response.data['errors']],
+            [
+                (1, 'Game not found'),
+                (2, 'Game cannot be settled. Current status: SETTLED'),
+                (3, 'Game has expired. Cannot settle.'),
+                (4, 'Duplicate game_id in batch'),
+                (5, "result must be one of ['WON', 'LOST']"),
+                (6, 'game_id is required'),
+            ],
+        )
+
+    def test_invalidates_bet_summary(self):
+        cache.clear()
+        game = make_game()
+        self.assertEqual(self.client.get('/api/bets/filter/summary/').data['counts']['settled'], 0)
+        self.post([{'game_id': game.id, 'result': 'WON'}])
+        self.assertEqual(self.client.get('/api/bets/filter/summary/').data['counts']['settled'], 1)
+
+
+class BalanceLedgerTests(TestCase):
+    url = '/api/balance/'
+
+    def setUp(self):
+        self.balance = Balance.objects.create(amount=Decimal('1000.00'))
+
+    def entry(self, delta, reason=''):
+        return self.client.post(
+            '/api/balance/entries/', {'delta': delta, 'reason': reason}, content_type='application/json'
+        )
+
+    def test_credit_and_debit_are_inserts_only(self):
+        with CaptureQueriesContext(connection) as ctx:
+            self.entry('250.00', 'deposit')
+        # Hakuna UPDATE ya row ya Balance kwenye credit/debit
+        self.assertFalse([q for q in ctx.captured_queries if q['sql'].startswith('UPDATE')])
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.entry('-100.50', 'bet stake')
+        # Debit ni INSERT ... SELECT moja - hakuna SELECT ... FOR UPDATE wala UPDATE
+        writes = [q['sql'] for q in ctx.captured_queries if not q['sql'].lstrip().startswith('SELECT')]
+        self.assertEqual(len(writes), 1)
+        self.assertTrue(writes[0].lstrip().startswith('INSERT'))
+        self.assertEqual(response.data['entry']['reason'], 'bet stake')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['data']['amount'], '1149.50')
+        self.assertEqual(self.client.get(self.url).data['amount'], '1149.50')
+        # Snapshot haijaguswa
+        self.assertEqual(Balance.objects.get().amount, Decimal('1000.00'))
+
+    def test_read_is_snapshot_plus_recent_entries(self):
+        for _ in range(20):
+            self.entry('1.00')
+        # Balance row + aggregate moja ya entries mpya
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
+        self.assertEqual(response.data['amount'], '1020.00')
+
+    @override_settings(BALANCE_SNAPSHOT_EVERY=5)
+    def test_snapshot_folds_entries(self):
+        for _ in range(7):
+            self.entry('10.00')
+        balance = Balance.objects.get()
+        self.assertEqual(balance.amount, Decimal('1050.00'))
+        self.assertEqual(balance.snapshot_entry_id, BalanceEntry.objects.order_by('id')[4].id)
+        self.assertEqual(self.client.get(self.url).data['amount'], '1070.00')
+
+        # Snapshot ya pili haihesabu entries zile zile tena
+        take_snapshot(balance.pk)
+        take_snapshot(balance.pk)
+        self.assertEqual(Balance.objects.get().amount, Decimal('1070.00'))
+        self.assertEqual(self.client.get(self.url).data['amount'], '1070.00')
+
+    def test_put_sets_absolute_amount_through_ledger(self):
+        self.entry('500.00')
+        response = self.client.put(
+            self.url, {'amount': '300.00', 'currency': 'USD'}, content_type='application/json'
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['data']['amount'], '300.00')
+        self.assertEqual(response.data['data']['currency'], 'USD')
+        self.assertEqual(BalanceEntry.objects.order_by('-id').first().delta, Decimal('-1200.00'))
+
+        response = self.client.patch(self.url, {'amount': '-1'}, content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+
+    def test_zero_delta_rejected(self):
+        self.assertEqual(self.entry('0').status_code, 400)
+
+    def test_debit_cannot_make_balance_negative(self):
+        self.entry('200.00')
+        response = self.entry('-999999')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data, {'error': 'Balance cannot be negative'})
+        self.assertEqual(BalanceEntry.objects.count(), 1)
+
+        # Debit ya balance yote inaruhusiwa
+        self.assertEqual(self.entry('-1200.00').status_code, 201)
+        self.assertEqual(self.client.get(self.url).data['amount'], '0.00')
+        self.assertEqual(self.entry('-0.01').status_code, 400)
+
+    @override_settings(BALANCE_SNAPSHOT_EVERY=3)
+    def test_debit_counts_snapshot_and_recent_entries(self):
+        for _ in range(4):
+            self.entry('0.10')
+        # Snapshot 1000.30 + entry moja mpya 0.10
+        self.assertEqual(self.entry('-1000.41').status_code, 400)
+        self.assertEqual(self.entry('-1000.40').status_code, 201)
+        self.assertEqual(self.client.get(self.url).data['amount'], '0.00')
+
+    def test_entries_limit_is_capped(self):
+        for _ in range(3):
+            self.entry('1.00')
+        with mock.patch.object(BalanceEntryView, 'MAX_LIMIT', 2):
+            self.assertEqual(len(self.client.get('/api/balance/entries/', {'limit': 10 ** 20}).data), 2)
+        self.assertEqual(len(self.client.get('/api/balance/entries/', {'limit': 0}).data), 3)
+        self.assertEqual(len(self.client.get('/api/balance/entries/', {'limit': '²'}).data), 3)
+
+    def test_delta_fits_balance_snapshot(self):
+        # Balance.amount ni max_digits=10 - entry moja haiwezi kuzidi hapo
+        self.assertEqual(self.entry('123456789012').status_code, 400)
+        self.assertEqual(self.entry('98999999.99').status_code, 201)
+        self.assertEqual(self.client.get(self.url).data['amount'], '99000999.99')
+
+
+def bet_payload(*leg_odds):
+    return {
+        'stake': '1000.00',
+        'matches': [
+            {'match_ref': f'M{i:03}', 'teams': f'Team {i} vs Team {i + 1}', 'market': '1X2',
+             'selection': 'Home', 'odds': odds}
+            for i, odds in enumerate(leg_odds, start=1)
+        ],
+    }
+
+
+class BetPlacementTests(TestCase):
+    url = '/api/bets/'
+
+    def post(self, payload):
+        return self.client.post(self.url, payload, content_type='application/json')
+
+    def test_all_legs_inserted_with_one_statement(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.post(bet_payload(*['1.10'] * 20))
+        self.assertEqual(response.status_code, 201)
+        inserts = [q['sql'] for q in ctx.captured_queries if q['sql'].startswith('INSERT')]
+        self.assertEqual(len(inserts), 2)
+        self.assertEqual(Match.objects.filter(game_id=response.data['id']).count(), 20)
+
+    def test_combined_odds_use_exact_decimal(self):
+        # float: round(1.03 * 1.50, 2) = 1.54; Decimal 1.5450 -> 1.55
+        response = self.post(bet_payload('1.03', '1.50'))
+        game = Game.objects.get(pk=response.data['id'])
+        self.assertEqual(game.total_odds, Decimal('1.55'))
+        self.assertEqual(game.odds, Decimal('1.55'))
+        self.assertGreater(game.active_until, timezone.now())
+
+    @override_settings(BET_ACTIVE_HOURS=24)
+    def test_active_until_is_set_by_server(self):
+        for sent in ('2000-01-01T00:00:00Z', '9999-01-01T00:00:00Z'):
+            payload = bet_payload('1.50')
+            payload['active_until'] = sent
+            before = timezone.now()
+            response = self.post(payload)
+            self.assertEqual(response.status_code, 201)
+            active_until = Game.objects.get(pk=response.data['id']).active_until
+            self.assertGreaterEqual(active_until, before + timedelta(hours=24))
+            self.assertLessEqual(active_until, timezone.now() + timedelta(hours=24))
+
+    def test_failed_leg_insert_leaves_no_game(self):
+        with mock.patch.object(Match.objects, 'bulk_create', side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                self.post(bet_payload('1.50', '2.00'))
+        self.assertFalse(Game.objects.exists())
+
+    def test_duplicate_match_ref_rejected(self):
+        payload = bet_payload('1.50', '2.00')
+        payload['matches'][1]['match_ref'] = 'M001'
+        response = self.post(payload)
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('matches', response.data)
+
+
+class MatchOddsMaintenanceTests(TestCase):
+
+    def setUp(self):
+        response = self.client.post(
+            '/api/bets/', bet_payload('1.50', '2.00'), content_type='application/json'
+        )
+        self.game = Game.objects.get(pk=response.data['id'])
+
+    def leg(self, **kwargs):
+        data = {'teams': 'Azam vs Simba', 'market': '1X2', 'selection': 'Away', 'odds': '1.20'}
+        data.update(kwargs)
+        return data
+
+    def add_leg(self, game, **kwargs):
+        # match_ref haiko kwenye MatchSerializer - legs za API zinapata default yake
+        Match.objects.filter(game=game, match_ref='').update(match_ref=f'X{Match.objects.count()}')
+        return self.client.post(f'/api/bets/{game.id}/matches/', self.leg(**kwargs), content_type='application/json')
+
+    def test_add_update_delete_recompute_odds_from_legs(self):
+        self.assertEqual(self.game.total_odds, Decimal('3.00'))
+
+        response = self.add_leg(self.game)
+        self.assertEqual(response.status_code, 201)
+        self.game.refresh_from_db()
+        self.assertEqual(self.game.total_odds, Decimal('3.60'))
+
+        match = Match.objects.get(game=self.game, odds=Decimal('1.20'))
+        self.client.put(f'/api/matches/{match.id}/', self.leg(odds='2.50'), content_type='application/json')
+        self.game.refresh_from_db()
+        self.assertEqual((self.game.total_odds, self.game.odds), (Decimal('7.50'), Decimal('7.50')))
+
+        self.client.delete(f'/api/matches/{match.id}/')
+        self.game.refresh_from_db()
+        self.assertEqual(self.game.total_odds, Decimal('3.00'))
+
+        for match in self.game.matches.all():
+            self.client.delete(f'/api/matches/{match.id}/')
+        self.game.refresh_from_db()
+        self.assertEqual(self.game.total_odds, Decimal('0'))
+
+        self.add_leg(self.game)
+        self.game.refresh_from_db()
+        self.assertEqual(self.game.total_odds, Decimal('1.20'))
+
+    def test_leg_changes_do_not_compound_rounding(self):
+        # Product kamili, si total iliyozungushwa (1.10 * 50 = 55.00) - payout ni stake * odds
+        for legs, added, expected in ((['1.01'] * 10, '50.00', '55.23'), (['1.33'] * 3, '25.00', '58.82')):
+            game = Game.objects.get(pk=self.client.post(
+                '/api/bets/', bet_payload(*legs), content_type='application/json'
+            ).data['id'])
+            self.add_leg(game, odds=added)
+            game.refresh_from_db()
+            self.assertEqual((game.total_odds, game.odds), (Decimal(expected), Decimal(expected)))
+
+    def test_zero_odds_leg(self):
+        zero = Match.objects.create(
+            game=self.game, match_ref='M003', teams='Azam vs Simba', market='1X2', selection='Away', odds=0
+        )
+        self.add_leg(self.game)
+        self.game.refresh_from_db()
+        self.assertEqual(self.game.total_odds, Decimal('0'))
+
+        self.client.delete(f'/api/matches/{zero.id}/')
+        self.game.refresh_from_db()
+        self.assertEqual(self.game.total_odds, Decimal('3.60'))
+
+    def test_game_without_legs_has_zero_odds(self):
+        response = self.client.post('/api/bets/', {'stake': '1000.00'}, content_type='application/json')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Game.objects.get(pk=response.data['id']).total_odds, Decimal('0'))
+
+        # Game tupu ya zamani (odds 1.00) inarekebishwa
+        Game.objects.filter(pk=response.data['id']).update(total_odds=1, odds=1)
+        call_command('recompute_odds', stdout=StringIO())
+        self.assertEqual(Game.objects.get(pk=response.data['id']).odds, Decimal('0'))
+
+    def test_recompute_odds_repairs_drift(self):
+        Game.objects.filter(pk=self.game.pk).update(total_odds=Decimal('2.99'), odds=Decimal('2.99'))
+        make_game()  # 2.50 - tayari sahihi
+
+        out = StringIO()
+        call_command('recompute_odds', '--dry-run', stdout=out)
+        self.assertIn('Checked 2 open games, would repair 1', out.getvalue())
+        self.assertEqual(Game.objects.get(pk=self.game.pk).total_odds, Decimal('2.99'))
+
+        call_command('recompute_odds', '--chunk-size=1', stdout=out)
+        self.assertIn('repaired 1', out.getvalue())
+        self.game.refresh_from_db()
+        self.assertEqual((self.game.total_odds, self.game.odds), (Decimal('3.00'), Decimal('3.00')))
+
+
+class ExpireGamesTests(QueryPlanMixin, TestCase):
+
+    def setUp(self):
+        cache.clear()
+        past = timezone.now() - timedelta(hours=1)
+        self.expired = [make_game(active_until=past) for _ in range(5)]
+        self.live = make_game()
+        self.settled = make_game(status='SETTLED', result='WON', active_until=past)
+
+    def test_batch_expires_only_past_open_games(self):
+        now = timezone.now()
+        self.assertEqual(expire_games_batch(now, batch_size=3), 3)
+        self.assertEqual(expire_games_batch(now, batch_size=3), 2)
+        self.assertEqual(expire_games_batch(now, batch_size=3), 0)
+
+        statuses = dict(Game.objects.values_list('pk', 'status'))
+        self.assertEqual({statuses[g.pk] for g in self.expired}, {'EXPIRED'})
+        self.assertEqual(statuses[self.live.pk], 'OPEN')
+        self.assertEqual(statuses[self.settled.pk], 'SETTLED')
+        self.assertIsNotNone(Game.objects.get(pk=self.expired[0].pk).settled_at)
+
+    def test_batch_uses_index(self):
+        with CaptureQueriesContext(connection) as ctx:
+            expire_games_batch(timezone.now(), batch_size=2)
+        update = next(q['sql'] for q in ctx.captured_queries if q['sql'].startswith('UPDATE'))
+        plan = self.explain(update, ())
+        self.assertIn('game_summary_idx', ' '.join(plan))
+        for step in plan:
+            if step.startswith('SCAN'):
+                self.assertIn('INDEX', step)
+
+    def test_command_reports_throughput_and_backlog(self):
+        out = StringIO()
+        call_command('expire_games', '--once', '--batch-size=2', '--max-batches=2', stdout=out)
+        self.assertIn('expired 4 games in 2 batches', out.getvalue())
+        self.assertIn('backlog 1', out.getvalue())
+
+        call_command('expire_games', '--once', stdout=out)
+        self.assertIn('expired 1 games in 1 batches', out.getvalue())
+        self.assertIn('backlog 0', out.getvalue())
+
+    def test_expired_games_leave_active_set_and_cannot_be_settled(self):
+        self.client.get('/api/bets/filter/summary/')
+        call_command('expire_games', '--once', stdout=StringIO())
+
+        response = self.client.get('/api/bets/filter/summary/')
+        self.assertEqual(response.data['counts']['active'], 1)
+
+        response = self.client.get('/api/bets/', {'status': 'expired'})
+        self.assertEqual(len(response.data), 5)
+
+        response = self.client.post(f'/api/bets/{self.expired[0].id}/approve/', {'result': 'WON'})
+        self.assertEqual(response.status_code, 400)
+
+
+def parse_sse(message):
+    lines = dict(line.split(': ', 1) for line in message.decode().strip().split('\n'))
+    return lines['event'], json.loads(lines['data'])
+
+
+class FixturePushTests(TestCase):
+    """Writes za fixtures zina-publish rows zilizobadilika tu, baada ya commit"""
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.addCleanup(self.loop.close)
+        self.subscription = self.subscribe()
+        self.addCleanup(get_hub().unsubscribe, self.subscription)
+
+    def subscribe(self):
+        async def subscribe():
+            return get_hub().subscribe(fixture_channel(MatchFixture))
+        return self.loop.run_until_complete(subscribe())
+
+    def next_message(self):
+        return parse_sse(self.loop.run_until_complete(asyncio.wait_for(self.subscription.get(), 1)))
+
+    def test_save_publishes_row_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            fixture = make_fixture(event_id=7)
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(self.next_message(), ('fixtures', fixture_rows(MatchFixture.objects.filter(pk=fixture.pk))))
+
+    def test_bulk_writes_publish_changed_rows_only(self):
+        fixtures = [make_fixture(event_id=i) for i in range(1, 4)]
+        payload = [fixture_payload(f.eventId, id=f.pk, date=f.date.isoformat()) for f in fixtures]
+        payload[1]['homeOdds'] = {'value': '2.10', 'hasFireIcon': True}
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.put('/api/fixtures/bulk/update/', payload, content_type='application/json')
+        event, rows = self.next_message()
+        self.assertEqual(event, 'fixtures')
+        self.assertEqual([row['id'] for row in rows], [fixtures[1].pk])
+        self.assertEqual(rows, fixture_rows(MatchFixture.objects.filter(pk=fixtures[1].pk)))
+        self.assertEqual(rows[0]['homeOdds']['value'], '2.10')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(
+                '/api/fixtures/bulk/?upsert=true',
+                [fixture_payload(1, homeTeam='Simba'), fixture_payload(50)],
+                content_type='application/json'
+            )
+        event, rows = self.next_message()
+        self.assertEqual(sorted(row['eventId'] for row in rows), [1, 50])
+        self.assertEqual(next(row for row in rows if row['eventId'] == 1)['homeTeam'], 'Simba')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.delete(
+                '/api/fixtures/bulk/delete/', {'ids': [fixtures[2].pk]}, content_type='application/json'
+            )
+            self.client.delete(f'/api/fixtures/{fixtures[0].pk}/')
+        self.assertEqual(self.next_message(), ('deleted', [fixtures[2].pk]))
+        self.assertEqual(self.next_message(), ('deleted', [fixtures[0].pk]))
+
+    def test_no_subscribers_no_work(self):
+        get_hub().unsubscribe(self.subscription)
+        with self.captureOnCommitCallbacks() as callbacks:
+            make_fixture()
+        self.assertEqual(callbacks, [])
+
+    @override_settings(FIXTURE_PUSH_QUEUE_SIZE=2)
+    def test_slow_subscriber_gets_resync(self):
+        slow = self.subscribe()
+        self.addCleanup(get_hub().unsubscribe, slow)
+        for i in range(3):
+            get_hub().publish(fixture_channel(MatchFixture), sse_message('deleted', [i]))
+        self.loop.run_until_complete(asyncio.sleep(0))
+        self.assertIs(slow.queue.get_nowait(), RESYNC)
+        self.assertTrue(slow.queue.empty())
+
+
+class FixtureStreamViewTests(SimpleTestCase):
+    url = '/api/fixtures/stream/'
+
+    async def test_stream_pushes_published_messages(self):
+        response = await AsyncClient().get(self.url)
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        stream = aiter(response.streaming_content)
+        self.assertEqual(await anext(stream), b'retry: 3000\n\n')
+
+        hub = get_hub()
+        channel = fixture_channel(MatchFixture)
+        self.assertEqual(hub.subscriber_count(channel), 1)
+        hub.publish(channel, sse_message('deleted', [5]))
+        self.assertEqual(parse_sse(await asyncio.wait_for(anext(stream), 1)), ('deleted', [5]))
+
+        # Client akikata, Django ina-cancel task inayosoma stream
+        reader = asyncio.ensure_future(anext(stream))
+        await asyncio.sleep(0)
+        reader.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await reader
+        self.assertEqual(hub.subscriber_count(channel), 0)
+
+    def test_wsgi_is_rejected(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 501)
+
+
+class FixtureDeltaSyncTests(QueryPlanMixin, TestCase):
+    url = '/api/fixtures/'
+
+    def setUp(self):
+        self.fixtures = [make_fixture(event_id=i) for i in range(1, 6)]
+        self.token = self.client.get(self.url, {'since': '0'}).data['since']
+        # Muda wa overlap upite ili mabadiliko ya baadaye yawe baada ya token
+        MatchFixture.objects.update(updated_at=timezone.now() - timedelta(minutes=1))
+
+    def test_full_sync_with_zero_token(self):
+        response = self.client.get(self.url, {'since': '0'})
+        self.assertEqual(len(response.data['results']), 5)
+        self.assertEqual(response.data['deleted'], [])
+
+    def test_returns_changes_and_tombstones_since_token(self):
+        fixture = self.fixtures[0]
+        fixture.homeOdds = Decimal('1.95')
+        fixture.save()
+        self.client.delete(f'{self.url}{self.fixtures[1].pk}/')
+        self.client.delete(
+            '/api/fixtures/bulk/delete/', {'ids': [self.fixtures[2].pk]}, content_type='application/json'
+        )
+
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url, {'since': self.token})
+        self.assertEqual(response.data['results'], fixture_rows(MatchFixture.objects.filter(pk=fixture.pk)))
+        self.assertEqual(response.data['deleted'], [self.fixtures[1].pk, self.fixtures[2].pk])
+
+        response = self.client.get(self.url, {'since': response.data['since']})
+        # Overlap: mabadiliko ya sekunde chache zilizopita yanaweza kurudi - hakuna kipya
+        self.assertLessEqual(len(response.data['results']), 1)
+
+    def test_delta_queries_use_indexes(self):
+        for sql, params in self.capture_selects(f'{self.url}?since={self.token}'):
+            plan = ' '.join(self.explain(sql, params))
+            self.assertIn('INDEX', plan, sql)
+            self.assertNotIn('TEMP B-TREE', plan, sql)
+
+    def test_invalid_and_expired_tokens(self):
+        self.assertEqual(self.client.get(self.url, {'since': 'abc'}).status_code, 400)
+        old = encode_sync_token(timezone.now() - timedelta(days=30))
+        self.assertEqual(self.client.get(self.url, {'since': old}).status_code, 410)
+
+    def test_prune_tombstones(self):
+        self.client.delete(f'{self.url}{self.fixtures[0].pk}/')
+        FixtureTombstone.objects.create(
+            fixture_model='games.matchfixture', fixture_id=99,
+            deleted_at=timezone.now() - timedelta(days=30),
+        )
+        call_command('prune_tombstones', stdout=StringIO())
+        self.assertEqual(list(FixtureTombstone.objects.values_list('fixture_id', flat=True)), [self.fixtures[0].pk])
+
+
+class AsyncReadViewTests(TestCase):
+    """Async GET (ASGI) inarudisha JSON ile ile ya APIViews za sync"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.games = [make_game() for _ in range(3)]
+        make_game(status='SETTLED', result='WON')
+        for i in range(1, 4):
+            make_fixture(event_id=i)
+
+    def setUp(self):
+        cache.clear()
+        self.factory = AsyncRequestFactory()
+
+    async def assert_same_response(self, view, url, **kwargs):
+        expected = await sync_to_async(self.client.get)(url)
+        await sync_to_async(cache.clear)()
+        response = await view(self.factory.get(url), **kwargs)
+        self.assertEqual(response.status_code, expected.status_code)
+        self.assertEqual(response.content, expected.content)
+        return response
+
+    async def test_bets_match_sync_views(self):
+        await self.assert_same_response(async_views.bet_crud, '/api/bets/')
+        await self.assert_same_response(async_views.bet_crud, '/api/bets/?status=open&limit=2')
+        response = await self.assert_same_response(async_views.bet_crud, '/api/bets/?page_size=2')
+        cursor = json.loads(response.content)['next']
+        await self.assert_same_response(async_views.bet_crud, f'/api/bets/?page_size=2&cursor={cursor}')
+        await self.assert_same_response(async_views.bet_crud, '/api/bets/?cursor=bad')
+        await self.assert_same_response(async_views.bet_crud, '/api/bets/?limit=99999999999999999999')
+
+        game_id = self.games[0].id
+        await self.assert_same_response(async_views.bet_detail, f'/api/bets/{game_id}/', game_id=game_id)
+        await self.assert_same_response(async_views.bet_detail, '/api/bets/missing/', game_id='missing')
+
+        await self.assert_same_response(async_views.bet_summary, '/api/bets/filter/summary/?page_size=2')
+        await self.assert_same_response(
+            async_views.bet_summary, '/api/bets/filter/summary/?page_size=2&active_page=99999999999999999999'
+        )
+
+    async def test_fixtures_match_sync_view(self):
+        response = await self.assert_same_response(async_views.fixture_list, '/api/fixtures/')
+        await self.assert_same_response(async_views.fixture_list, '/api/fixtures/?since=abc')
+
+        request = self.factory.get('/api/fixtures/', headers={'If-None-Match': response['ETag']})
+        self.assertEqual((await async_views.fixture_list(request)).status_code, 304)
+
+    async def test_writes_go_to_sync_view(self):
+        request = self.factory.post('/api/bets/', bet_payload('1.50'), content_type='application/json')
+        response = await async_views.bet_crud(request)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(await Game.objects.acount(), 5)
+
+
+class SqlitePragmaTests(SimpleTestCase):
+    databases = {'default'}
+
+    def pragma(self, conn, name):
+        with conn.cursor() as cursor:
+            cursor.execute(f'PRAGMA {name}')
+            return cursor.fetchone()[0]
+
+    def new_connection(self):
+        conn = connections.create_connection('default')
+        self.addCleanup(conn.close)
+        return conn
+
+    @override_settings(SQLITE_PRAGMAS={'busy_timeout': 1234, 'synchronous': 'NORMAL', 'cache_size': -4321})
+    def test_pragmas_applied_to_new_connections(self):
+        conn = self.new_connection()
+        self.assertEqual(self.pragma(conn, 'busy_timeout'), 1234)
+        self.assertEqual(self.pragma(conn, 'synchronous'), 1)  # NORMAL
+        self.assertEqual(self.pragma(conn, 'cache_size'), -4321)
+
+    @override_settings(SQLITE_PRAGMAS={})
+    def test_no_pragmas_keeps_sqlite_defaults(self):
+        self.assertEqual(self.pragma(self.new_connection(), 'synchronous'), 2)  # FULL
+
+    def test_journal_mode_is_set_by_server_startup_only(self):
+        path = Path(tempfile.mkdtemp()) / 'journal.sqlite3'
+        sqlite3.connect(path).close()
+        databases = {'default': {**connections['default'].settings_dict, 'NAME': str(path)}}
+        with mock.patch('games.db.connections', ConnectionHandler(databases)) as handler:
+            conn = handler['default']
+            self.addCleanup(conn.close)
+            # Connection ya kawaida (management command, test) haibadilishi file
+            self.assertEqual(self.pragma(conn, 'journal_mode'), 'delete')
+            conn.close()
+            with override_settings(SQLITE_JOURNAL_MODE='WAL'):
+                set_journal_mode()
+            self.assertIsNone(conn.connection)
+        self.assertEqual(sqlite3.connect(path).execute('PRAGMA journal_mode').fetchone()[0], 'wal')
+
+
+@override_settings(REPLICA_DATABASE='replica', REPLICA_PIN_SECONDS=5)
+class ReplicaRoutingTests(SimpleTestCase):
+
+    def route(self, request, status_code=200):
+        """(alias ya reads ndani ya request, response)"""
+        seen = []
+
+        def get_response(request):
+            seen.append((router.db_for_read(Game), router.db_for_write(Game)))
+            return HttpResponse(status=status_code)
+
+        response = ReplicaRoutingMiddleware(get_response)(request)
+        return seen[0], response
+
+    def test_safe_requests_read_from_replica(self):
+        (read, write), response = self.route(RequestFactory().get('/api/fixtures/'))
+        self.assertEqual((read, write), ('replica', 'default'))
+        self.assertNotIn(REPLICA_PIN_COOKIE, response.cookies)
+        # Nje ya request (commands, shell) - primary
+        self.assertEqual(router.db_for_read(Game), 'default')
+
+    def test_write_reads_primary_and_pins_session(self):
+        (read, _), response = self.route(RequestFactory().post('/api/bets/'), status_code=201)
+        self.assertEqual(read, 'default')
+        self.assertEqual(response.cookies[REPLICA_PIN_COOKIE]['max-age'], 5)
+
+        request = RequestFactory().get('/api/bets/')
+        request.COOKIES[REPLICA_PIN_COOKIE] = '1'
+        self.assertEqual(self.route(request)[0][0], 'default')
+
+    def test_failed_write_does_not_pin(self):
+        _, response = self.route(RequestFactory().post('/api/bets/'), status_code=400)
+        self.assertNotIn(REPLICA_PIN_COOKIE, response.cookies)
+
+    async def test_async_requests(self):
+        async def get_response(request):
+            return HttpResponse(router.db_for_read(Game))
+
+        response = await ReplicaRoutingMiddleware(get_response)(AsyncRequestFactory().get('/api/bets/'))
+        self.assertEqual(response.content, b'replica')
+
+    @override_settings(REPLICA_DATABASE=None)
+    def test_no_replica_configured(self):
+        (read, _), response = self.route(RequestFactory().put('/api/balance/'))
+        self.assertEqual(read, 'default')
+        self.assertNotIn(REPLICA_PIN_COOKIE, response.cookies)
+
+    def test_copy_database(self):
+        directory = Path(tempfile.mkdtemp())
+        source, target = directory / 'primary.sqlite3', directory / 'replica.sqlite3'
+        with sqlite3.connect(source) as db:
+            db.execute('CREATE TABLE t (x)')
+            db.execute('INSERT INTO t VALUES (1)')
+        copy_database(source, target)
+        with sqlite3.connect(target) as db:
+            self.assertEqual(db.execute('SELECT x FROM t').fetchall(), [(1,)])
+
+
+class FixtureWindowFilterTests(QueryPlanMixin, TestCase):
+    url = '/api/fixtures/'
+
+    @classmethod
+    def setUpTestData(cls):
+        today = timezone.localdate()
+        cls.past = make_fixture(event_id=1, date=today - timedelta(days=3))
+        cls.later = make_fixture(event_id=2, date=today + timedelta(days=2), league='Serie A')
+        cls.next_week = make_fixture(event_id=3, date=today + timedelta(days=7))
+        cls.far = make_fixture(event_id=4, date=today + timedelta(days=40), league='Serie A')
+
+    def event_ids(self, params=None):
+        response = self.client.get(self.url, params or {})
+        self.assertEqual(response.status_code, 200)
+        return [row['eventId'] for row in response.data]
+
+    def test_defaults_to_upcoming_fixtures(self):
+        self.assertEqual(self.event_ids(), [2, 3, 4])
+        self.assertEqual(self.event_ids({'upcoming': 'false'}), [1, 2, 3, 4])
+
+    def test_kickoff_after_includes_later_kickoff_on_same_day(self):
+        day = self.later.date
+        self.assertEqual(self.event_ids({'kickoff_after': f'{day}T18:30'}), [2, 3, 4])
+        self.assertEqual(self.event_ids({'kickoff_after': f'{day}T18:31'}), [3, 4])
+        self.assertEqual(self.event_ids({'kickoff_after': f'{day}T18:31:00+03:00'}), [2, 3, 4])
+
+    def test_date_window_and_league(self):
+        self.assertEqual(self.event_ids({'date': self.past.date.isoformat()}), [1])
+        self.assertEqual(self.event_ids({
+            'date_from': self.past.date.isoformat(), 'date_to': self.next_week.date.isoformat(),
+        }), [1, 2, 3])
+        self.assertEqual(self.event_ids({'league': 'Serie A'}), [2, 4])
+        self.assertEqual(self.event_ids({'league': ['Serie A', 'NBC Premier League'],
+                                         'date_to': self.next_week.date.isoformat()}), [1, 2, 3])
+
+    def test_blank_league_is_not_a_filter(self):
+        self.assertEqual(self.event_ids({'league': ''}), [2, 3, 4])
+        self.assertEqual(self.event_ids({'league': ['', 'Serie A']}), [2, 4])
+        self.assertEqual(self.client.get(self.url, {'league': ''})['ETag'], self.client.get(self.url)['ETag'])
+
+    def test_invalid_filters(self):
+        for params in ({'date': '17/10/2026'}, {'date_from': 'x'}, {'kickoff_after': 'tomorrow'}):
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, 400)
+            self.assertIn('error', response.data)
+
+    def test_etag_depends_on_window(self):
+        etag = self.client.get(self.url)['ETag']
+        self.assertNotEqual(self.client.get(self.url, {'upcoming': 'false'})['ETag'], etag)
+        # Mabadiliko nje ya dirisha hayabatilishi ETag ya mechi zijazo
+        MatchFixture.objects.filter(pk=self.past.pk).delete()
+        response = self.client.get(self.url, headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 304)
+
+    def test_window_queries_use_range_indexes(self):
+        today = timezone.localdate()
+        urls = {
+            f'{self.url}': 'matchfixture_kickoff_idx',
+            f'{self.url}?date_from={today}&date_to={today + timedelta(days=7)}': 'matchfixture_kickoff_idx',
+            f'{self.url}?league=Serie+A': 'matchfixture_league_idx',
+        }
+        for url, index in urls.items():
+            for sql, params in self.capture_selects(url):
+                plan = ' '.join(self.explain(sql, params))
+                self.assertIn(f'SEARCH games_matchfixture USING INDEX {index}', plan, url)
+
+
+class StreamingListTests(TestCase):
+    """?stream=true: bytes sawa na response ya kawaida, memory haiongezeki na rows"""
+
+    @classmethod
+    def setUpTestData(cls):
+        for _ in range(5):
+            make_game()
+        make_game(status='SETTLED', result='WON')
+        for i in range(1, 6):
+            make_fixture(event_id=i, homeOddsFire=i % 2 == 0)
+
+    def streamed(self, url):
+        response = self.client.get(url + ('&' if '?' in url else '?') + 'stream=true')
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        return response, b''.join(response.streaming_content)
+
+    @override_settings(STREAM_CHUNK_SIZE=2)
+    def test_bets_stream_matches_regular_response(self):
+        for url in ('/api/bets/', '/api/bets/?status=open&limit=3', '/api/bets/?status=expired'):
+            _, body = self.streamed(url)
+            self.assertEqual(body, self.client.get(url).content, url)
+
+    @override_settings(STREAM_CHUNK_SIZE=2)
+    def test_bet_chunks_prefetch_matches(self):
+        response = self.client.get('/api/bets/', {'stream': 'true'})
+        # Cursor moja ya games (fetchmany) + query ya matches kwa kila chunk ya games 2
+        with self.assertNumQueries(4):
+            b''.join(response.streaming_content)
+
+    @override_settings(STREAM_CHUNK_SIZE=2)
+    def test_fixture_streams_match_regular_response(self):
+        for url in ('/api/fixtures/', '/api/efootball/', '/api/fixtures/?league=none'):
+            response, body = self.streamed(url)
+            regular = self.client.get(url)
+            self.assertEqual(body, regular.content, url)
+            self.assertEqual(response['ETag'], regular['ETag'])
+
+    @override_settings(STREAM_LIST_RESPONSES=True)
+    def test_setting_streams_by_default(self):
+        self.assertTrue(self.client.get('/api/fixtures/').streaming)
+        self.assertFalse(self.client.get('/api/fixtures/', {'stream': 'false'}).streaming)
+
+    def test_browsable_api_is_not_streamed(self):
+        for url in ('/api/fixtures/', '/api/bets/'):
+            for response in (
+                self.client.get(url, {'stream': 'true', 'format': 'api'}),
+                self.client.get(url, {'stream': 'true'}, headers={'Accept': 'text/html'}),
+            ):
+                self.assertFalse(response.streaming, url)
+                self.assertTrue(response['Content-Type'].startswith('text/html'), url)
+                self.assertIn(b'<html', response.content)
+
+    @override_settings(STREAM_CHUNK_SIZE=2)
+    async def test_async_views_stream(self):
+        for view, url in ((async_views.bet_crud, '/api/bets/'), (async_views.fixture_list, '/api/fixtures/')):
+            expected = await sync_to_async(self.client.get)(url)
+            response = await view(AsyncRequestFactory().get(url, {'stream': 'true'}))
+            self.assertEqual(b''.join([chunk async for chunk in response.streaming_content]), expected.content)
+
+    def seed(self, rows):
+        """Fixtures `rows` kwa INSERT ... SELECT moja (bulk_create ya 100k ni polepole)"""
+        MatchFixture.objects.all().delete()
+        with connection.cursor() as cursor:
+            cursor.execute(f"""
+                WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < %s)
+                INSERT INTO {MatchFixture._meta.db_table} (
+                    "eventId", "time", "date", "homeTeam", "awayTeam", "league", "homeOdds", "drawOdds",
+                    "awayOdds", "homeOddsFire", "drawOddsFire", "awayOddsFire", "betCount",
+                    "hasBoostedOdds", "hasTwoUp", "created_at", "updated_at"
+                )
+                SELECT i, '18:30:00', date('2030-01-01', '+' || (i % 365) || ' days'), 'Home ' || i,
+                       'Away ' || i, 'League ' || (i % 40), '1.50', '3.20', '5.75', i % 2, 0, 0, i % 500,
+                       0, 0, datetime('now'), datetime('now')
+                FROM n
+            """, [rows])
+
+    def stream_peak(self, rows):
+        """Peak ya Python heap (bytes) wakati wa kutuma list ya fixtures `rows`"""
+        self.seed(rows)
+        tracemalloc.start()
+        try:
+            response = self.client.get('/api/fixtures/', {'stream': 'true', 'upcoming': 'false'})
+            size = sum(len(chunk) for chunk in response.streaming_content)
+            return tracemalloc.get_traced_memory()[1], size
+        finally:
+            tracemalloc.stop()
+
+    @tag('slow')
+    def test_peak_memory_is_flat_from_1k_to_100k_rows(self):
+        small_peak, small_size = self.stream_peak(1_000)
+        large_peak, large_size = self.stream_peak(100_000)
+        self.assertGreater(large_size, 90 * small_size)
+        # Body ni mara 100, peak inabaki ya chunk moja (STREAM_CHUNK_SIZE rows)
+        self.assertLess(large_peak, small_peak * 1.5)
+
+
+class ColumnarFormatTests(TestCase):
+    url = '/api/fixtures/'
+    media_type = 'application/vnd.vbclone.columnar+json'
+
+    @classmethod
+    def setUpTestData(cls):
+        make_fixture(event_id=1)
+        make_fixture(event_id=2, homeOddsFire=True, awayOddsFire=True, betCount=42)
+        make_fixture(event_id=3, hasBoostedOdds=True, hasTwoUp=True, time=time(9, 5, 7, 120))
+        make_fixture(event_id=4, drawOddsFire=True, homeOdds=Decimal('10'), awayTeam='Azam FC "B"')
+
+    def expand(self, columnar):
+        """Columnar -> rows za format ya kawaida (kuthibitisha hakuna data iliyopotea)"""
+        header, *rows = columnar
+        expanded = []
+        for values in rows:
+            row = dict(zip(header, values))
+            flags = row.pop('flags')
+            for field, bit in (('homeOdds', 1), ('drawOdds', 2), ('awayOdds', 4)):
+                row[field] = {'value': row[field], 'hasFireIcon': bool(flags & bit)}
+            row['hasBoostedOdds'], row['hasTwoUp'] = bool(flags & 8), bool(flags & 16)
+            expanded.append(row)
+        return expanded
+
+    def test_format_param_and_accept_header(self):
+        regular = self.client.get(self.url).json()
+        for response in (
+            self.client.get(self.url, {'format': 'columnar'}),
+            self.client.get(self.url, headers={'Accept': self.media_type}),
+        ):
+            self.assertEqual(response['Content-Type'], self.media_type)
+            self.assertEqual(response.json()[0], list(FIXTURE_COLUMNAR_FIELDS))
+            self.assertEqual(self.expand(response.json()), regular)
+            self.assertLess(len(response.content), len(self.client.get(self.url).content))
+
+    def test_flags_bitmask(self):
+        header, *rows = self.client.get(self.url, {'format': 'columnar'}).json()
+        flags = {row[header.index('eventId')]: row[header.index('flags')] for row in rows}
+        self.assertEqual(flags, {1: 0, 2: 1 | 4, 3: 1 | 8 | 16, 4: 2})
+
+    def test_etag_per_format(self):
+        etag = self.client.get(self.url, {'format': 'columnar'})['ETag']
+        self.assertNotEqual(self.client.get(self.url)['ETag'], etag)
+        response = self.client.get(self.url, {'format': 'columnar'}, headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(self.client.get(self.url, headers={'If-None-Match': etag}).status_code, 200)
+
+    @override_settings(STREAM_CHUNK_SIZE=3)
+    def test_stream_and_efootball(self):
+        expected = self.client.get(self.url, {'format': 'columnar'}).content
+        response = self.client.get(self.url, {'format': 'columnar', 'stream': 'true'})
+        self.assertEqual(response['Content-Type'], self.media_type)
+        self.assertEqual(b''.join(response.streaming_content), expected)
+        self.assertEqual(self.client.get('/api/efootball/', {'format': 'columnar'}).json(), [
+            list(FIXTURE_COLUMNAR_FIELDS)
+        ])
+
+    async def test_async_view_matches(self):
+        for params, headers in (({'format': 'columnar'}, {}), ({}, {'Accept': self.media_type})):
+            expected = await sync_to_async(self.client.get)(self.url, params, headers=headers)
+            response = await async_views.fixture_list(AsyncRequestFactory().get(self.url, params, headers=headers))
+            self.assertEqual(response.content, expected.content)
+            self.assertEqual(response['ETag'], expected['ETag'])
+
+
+class RequestMetricsTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        make_fixture(event_id=1)
+
+    def setUp(self):
+        registry.reset()
+
+    def metric(self, text, name, view, method='GET'):
+        prefix = f'{name}{{view="{view}",method="{method}"}} '
+        for line in text.splitlines():
+            if line.startswith(prefix):
+                return float(line[len(prefix):])
+        self.fail(f'{prefix} not found')
+
+    def test_records_latency_queries_and_size_per_view(self):
+        body = self.client.get('/api/fixtures/').content
+        self.client.get('/api/fixtures/')
+        self.client.get('/api/nothing-here/')
+
+        response = self.client.get('/api/metrics/')
+        self.assertTrue(response['Content-Type'].startswith('text/plain; version=0.0.4'))
+        text = response.content.decode()
+        self.assertEqual(self.metric(text, 'http_request_duration_seconds_count', 'fixture-list-create'), 2)
+        self.assertIn(
+            'http_request_duration_seconds_bucket{view="fixture-list-create",method="GET",le="+Inf"} 2', text
+        )
+        # ETag aggregate + list kwa kila request
+        self.assertEqual(self.metric(text, 'http_request_db_queries_total', 'fixture-list-create'), 4)
+        self.assertGreater(self.metric(text, 'http_request_db_seconds_total', 'fixture-list-create'), 0)
+        self.assertEqual(self.metric(text, 'http_response_size_bytes_total', 'fixture-list-create'), 2 * len(body))
+        self.assertEqual(self.metric(text, 'http_request_duration_seconds_count', 'unmatched'), 1)
+
+    def test_queries_outside_requests_are_not_counted(self):
+        list(MatchFixture.objects.all())
+        self.client.post('/api/fixtures/', fixture_payload(9), content_type='application/json')
+        text = render_prometheus(registry.collect())
+        self.assertEqual(self.metric(text, 'http_request_duration_seconds_count', 'fixture-list-create', 'POST'), 1)
+        self.assertNotIn('method="GET"', text)
+
+    async def test_async_requests(self):
+        await AsyncClient().get('/api/health/')
+        text = render_prometheus(registry.collect())
+        self.assertEqual(self.metric(text, 'http_request_duration_seconds_count', 'health-check'), 1)
+
+    def test_workers_aggregate_through_metrics_dir(self):
+        directory = Path(tempfile.mkdtemp())
+        with override_settings(METRICS_DIR=str(directory)):
+            self.client.get('/api/health/')
+            registry.flush()
+            written = json.loads(next(directory.glob('worker-*.json')).read_text())
+            self.assertEqual(written, registry.snapshot())
+
+            # Worker mwingine (process nyingine) ameandika file lake
+            other = {key: [value * 2 for value in stats] for key, stats in written.items()}
+            (directory / 'worker-1-abcdef01.json').write_text(json.dumps(other))
+            text = self.client.get('/api/metrics/').content.decode()
+        self.assertEqual(self.metric(text, 'http_request_duration_seconds_count', 'health-check'), 3)
+
+
+class FixtureLoggingTests(TestCase):
+    url = '/api/fixtures/bulk/'
+
+    def post(self, payload):
+        return self.client.post(self.url, payload, content_type='application/json')
+
+    def test_bulk_create_writes_one_summary_line(self):
+        payload = [fixture_payload(i) for i in range(1, 201)] + [fixture_payload(1), 'not-a-fixture']
+        with self.assertLogs('games.views', 'INFO') as logs:
+            self.post(payload)
+        summary = [line for line in logs.output if 'bulk_create ' in line]
+        self.assertEqual(len(summary), 1)
+        self.assertIn('items=202 created=200 updated=0 errors=2', summary[0])
+        self.assertIn('fixture_rejected model=games.matchfixture index=200 fields=eventId', logs.output[0])
+        self.assertIn('index=201 fields=non_field_errors', logs.output[1])
+        # Lines za kila item ni DEBUG tu, na payload haiandikwi
+        self.assertEqual(len(logs.output), 3)
+        self.assertNotIn('Home 1', ''.join(logs.output))
+
+    @override_settings(LOG_ITEM_SAMPLE_FIRST=2, LOG_ITEM_SAMPLE_EVERY=50)
+    def test_item_lines_are_sampled(self):
+        with self.assertLogs('games.views', 'DEBUG') as logs:
+            self.post([fixture_payload(i) for i in range(1, 201)])
+        created = [record.args[2] for record in logs.records if record.msg.startswith('fixture_created')]
+        self.assertEqual(created, [1, 2, 51, 101, 151])
+
+    def test_single_fixture_update_does_not_log_payload(self):
+        fixture = make_fixture(event_id=1)
+        with self.assertLogs('games.views', 'INFO') as logs:
+            self.client.put(
+                f'/api/fixtures/{fixture.pk}/', fixture_payload(1, homeTeam='Simba SC'),
+                content_type='application/json',
+            )
+        self.assertEqual(logs.output, [f'INFO:games.views:fixture_updated model=games.matchfixture id={fixture.pk}'])
+
+
+class QueueLogHandlerTests(SimpleTestCase):
+
+    def logger(self, handler):
+        logger = logging.getLogger(f'games.tests.queue.{id(handler)}')
+        logger.addHandler(handler)
+        logger.propagate = False
+        self.addCleanup(logger.removeHandler, handler)
+        self.addCleanup(handler.stop)
+        return logger
+
+    def test_listener_thread_formats_and_writes(self):
+        stream = StringIO()
+        handler = QueueLogHandler(stream)
+        handler.setFormatter(logging.Formatter('level=%(levelname)s %(message)s'))
+        self.logger(handler).warning('bulk_create items=%d', 3)
+        handler.stop()
+        self.assertEqual(stream.getvalue(), 'level=WARNING bulk_create items=3\n')
+
+    def test_records_are_formatted_on_listener_thread(self):
+        threads = []
+
+        class RecordingFormatter(logging.Formatter):
+            def format(self, record):
+                threads.append(threading.current_thread())
+                return super().format(record)
+
+        stream = StringIO()
+        handler = QueueLogHandler(stream)
+        handler.setFormatter(RecordingFormatter('%(message)s'))
+        self.logger(handler).warning('bulk_create items=%d', 3)
+        handler.stop()
+        self.assertEqual(stream.getvalue(), 'bulk_create items=3\n')
+        self.assertEqual(len(threads), 1)
+        self.assertIsNot(threads[0], threading.current_thread())
+
+    def test_full_queue_drops_instead_of_blocking(self):
+        handler = QueueLogHandler(StringIO(), maxsize=1)
+        handler.listener.stop()
+        logger = self.logger(handler)
+        for _ in range(3):
+            logger.warning('line')
+        self.assertEqual(handler.dropped, 2)
+        handler.listener = None
+
+    def test_restarts_listener_after_fork(self):
+        stream = StringIO()
+        handler = QueueLogHandler(stream)
+        logger = self.logger(handler)
+        parent_queue = handler.queue
+        with mock.patch('games.log.os.getpid', return_value=handler.pid + 1):
+            logger.warning('from child')
+            self.assertIsNot(handler.queue, parent_queue)
+            handler.stop()
+        self.assertEqual(stream.getvalue(), 'from child\n')
@@ -1,26 +1,32 @@
 from django.urls import path
-from . import views
+from . import async_views, views
+from .async_views import read_view
 
 
 urlpatterns = [
     # Badilisha hii - tumia BetCRUDView badala ya CreateBetView
-    path('bets/', views.BetCRUDView.as_view(), name='bet-crud'),
+    path('bets/', read_view(views.BetCRUDView, async_views.bet_crud), name='bet-crud'),
     path('health/', views.health_check, name='health-check'),
+    path('metrics/', views.metrics, name='metrics'),
+    # Lazima iwe kabla ya bets/<str:game_id>/...
+    path('bets/bulk/approve/', views.BetBulkApproveView.as_view(), name='bet-bulk-approve'),
 
     
     # Hizi ni sawa
-    path('bets/<str:game_id>/', views.BetDetailView.as_view(), name='bet-detail'),
+    path('bets/<str:game_id>/', read_view(views.BetDetailView, async_views.bet_detail), name='bet-detail'),
     path('bets/<str:game_id>/approve/', views.BetApproveView.as_view(), name='bet-approve'),
-    path('bets/filter/summary/', views.BetFilterView.as_view(), name='bet-filter'),
+    path('bets/filter/summary/', read_view(views.BetFilterView, async_views.bet_summary), name='bet-filter'),
     path('bets/<str:game_id>/matches/', views.MatchCRUDView.as_view(), name='add-match'),
     path('matches/<int:match_id>/', views.MatchCRUDView.as_view(), name='match-detail'),
     path('balance/', views.AccountBalanceView.as_view(), name='balance-crud'),
+    path('balance/entries/', views.BalanceEntryView.as_view(), name='balance-entries'),
 
 
-    path('fixtures/', views.MatchFixtureListCreateView.as_view(), name='fixture-list-create'),
+    path('fixtures/', read_view(views.MatchFixtureListCreateView, async_views.fixture_list), name='fixture-list-create'),
     path('fixtures/bulk/', views.MatchFixtureBulkCreateView.as_view(), name='fixture-bulk-create'),
     path('fixtures/<int:pk>/', views.MatchFixtureDetailView.as_view(), name='fixture-detail'),
     path('fixtures/bulk/update/', views.MatchFixtureBulkUpdateView.as_view(), name='fixture-bulk-update'),
     path('fixtures/bulk/delete/', views.MatchFixtureBulkDeleteView.as_view(), name='fixture-bulk-delete'),
+    path('fixtures/stream/', views.fixture_stream, name='fixture-stream'),
 
 ]
\ No newline at end of file
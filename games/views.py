@@ -1,13 +1,39 @@
+import logging
+import sys
+import time
+
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.settings import api_settings
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import Count, Q
 from django.utils import timezone
-from .models import Game, Match,Balance, MatchFixture
-from .serializers import CreateBetSerializer,BalanceSerializer, GameResponseSerializer, MatchSerializer, MatchFixtureSerializer
+from .bulk import (
+    bulk_create_fixtures, bulk_delete_fixtures, bulk_settle_games, bulk_update_fixtures,
+    fixture_rows_by_pk,
+)
+from .cache import bet_summary_key, bet_summary_timeout, fixture_list_etag, not_modified
+from .filters import InvalidFixtureFilter, filter_fixtures, fixture_window, window_key
+from .live import fixture_stream_response, publish_fixture_changes
+from .log import log_items
+from .metrics import registry, render_prometheus
+from .ledger import InsufficientBalance, apply_delta, get_balance, set_amount, with_current_amount
+from .models import Game, Match,Balance, BalanceEntry, MatchFixture
+from .odds import game_odds
+from .pagination import InvalidCursor, keyset_page
+from .renderers import ColumnarJSONRenderer
+from .serializers import CreateBetSerializer,BalanceSerializer, BalanceEntrySerializer, GameResponseSerializer, MatchSerializer, MatchFixtureSerializer, FIXTURE_COLUMNAR_FIELDS, FIXTURE_LIST_COLUMNS, build_columnar_rows, build_fixture_rows, fixture_rows_from_objects, serialize_games
+from .streaming import stream_queryset, streaming_json_response, wants_stream
+from .sync import InvalidSyncToken, SyncTokenExpired, changes_since, record_deletions
+
 
 
+from django.http import HttpResponse, JsonResponse
 
-from django.http import JsonResponse
+logger = logging.getLogger(__name__)
 
 def health_check(request):
     return JsonResponse({"status": "healthy", "message": "API is running"})
@@ -39,26 +65,79 @@ class BetCRUDView(APIView):
     # ============================================
     # READ (ALL) - GET /api/bets/
     # ============================================
+    DEFAULT_PAGE_SIZE = 20
+    MAX_PAGE_SIZE = 100
+    
     def get(self, request):
-        """Get all bets or filter by status"""
+        """
+        Get all bets or filter by status.
+        
+        ?page_size= / ?cursor= hurudisha {'results': [...], 'next': <cursor>};
+        bila hizo, response ni list kama zamani (?limit= bado inafanya kazi).
+        ?stream=true inatuma list kwa chunks - angalia games/streaming.py
+        """
         # Get query parameters
         status_filter = request.query_params.get('status', None)
         limit = request.query_params.get('limit', None)
+        cursor = request.query_params.get('cursor', None)
+        page_size = request.query_params.get('page_size', None)
         
-        # Base queryset
-        games = Game.objects.all().order_by('-created_at')
+        games = self.list_queryset(status_filter)
         
-        # Apply filters
-        if status_filter:
-            if status_filter.upper() in ['OPEN', 'SETTLED']:
-                games = games.filter(status=status_filter.upper())
+        # Cursor pagination
+        if cursor is not None or page_size is not None:
+            page_size = self.page_size_param(page_size)
+            
+            try:
+                page, next_cursor = keyset_page(games, cursor, page_size)
+            except InvalidCursor:
+                return Response(
+                    {'error': 'Invalid cursor'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            
+            return Response({
+                'results': GameResponseSerializer(page, many=True).data,
+                'next': next_cursor
+            }, status=status.HTTP_200_OK)
         
         # Apply limit
-        if limit and limit.isdigit():
-            games = games[:int(limit)]
+        limit = self.limit_param(limit)
+        if limit is not None:
+            games = games[:limit]
+        
+        if wants_stream(request.query_params) and isinstance(request.accepted_renderer, JSONRenderer):
+            return streaming_json_response(stream_queryset(games, serialize_games))
         
         serializer = GameResponseSerializer(games, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
+    
+    @staticmethod
+    def list_queryset(status_filter):
+        """Base queryset - matches zote kwa query moja (hakuna N+1 kwenye details)"""
+        games = Game.objects.prefetch_related('matches').order_by('-created_at')
+        
+        # Apply filters
+        if status_filter:
+            if status_filter.upper() in ['OPEN', 'SETTLED', 'EXPIRED']:
+                games = games.filter(status=status_filter.upper())
+        return games
+    
+    @classmethod
+    def page_size_param(cls, page_size):
+        if page_size and page_size.isdecimal() and int(page_size) > 0:
+            return min(int(page_size), cls.MAX_PAGE_SIZE)
+        return cls.DEFAULT_PAGE_SIZE
+    
+    @staticmethod
+    def limit_param(limit):
+        """
+        ?limit= ya list ya zamani, au None (bila limit). Limit kubwa kuliko integer
+        ya SQLite ni sawa na bila limit - haiwezi kuzidi idadi ya rows
+        """
+        if limit and limit.isdecimal() and int(limit) <= sys.maxsize:
+            return int(limit)
+        return None
 
 
 class BetDetailView(APIView):
@@ -213,47 +292,147 @@ class BetApproveView(APIView):
         }, status=status.HTTP_200_OK)
 
 
+class BetBulkApproveView(APIView):
+    """
+    Settle/approve bets nyingi kwa request moja
+    """
+    
+    def post(self, request):
+        """
+        Approve/settle many bets.
+        
+        Body: [{"game_id": "...", "result": "WON" | "LOST"}, ...]
+        """
+        if not isinstance(request.data, list):
+            return Response(
+                {'error': 'Expected a list of {game_id, result} objects'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        settled, errors = bulk_settle_games(request.data)
+        
+        response_data = {
+            'settled': settled,
+            'errors': errors,
+            'total_settled': len(settled),
+            'total_errors': len(errors)
+        }
+        
+        status_code = status.HTTP_200_OK if settled else status.HTTP_400_BAD_REQUEST
+        return Response(response_data, status=status_code)
+
+
 class BetFilterView(APIView):
     """
     View for filtered bet lists
     """
+    DEFAULT_PAGE_SIZE = 20
+    MAX_PAGE_SIZE = 100
+    RECENT_SIZE = 10
+    
+    def get_int_param(self, params, name, default, maximum=None):
+        value = params.get(name, '')
+        value = int(value) if value.isdecimal() and int(value) > 0 else default
+        return min(value, maximum) if maximum else value
+    
+    def summary_params(self, params):
+        """(page_size, active_page, settled_page) kutoka query params"""
+        return (
+            self.get_int_param(params, 'page_size', self.DEFAULT_PAGE_SIZE, self.MAX_PAGE_SIZE),
+            self.get_int_param(params, 'active_page', 1),
+            self.get_int_param(params, 'settled_page', 1),
+        )
     
     def get(self, request):
-        """Get filtered bets"""
-        # Get all active (OPEN) games
-        active_games = Game.objects.filter(
-            status='OPEN', 
-            active_until__gte=timezone.now()
-        ).order_by('-created_at')
-        
-        # Get all settled games
-        settled_games = Game.objects.filter(
-            status='SETTLED'
-        ).order_by('-created_at')
-        
-        # Get recent games (last 10)
-        recent_games = Game.objects.all().order_by('-created_at')[:10]
-        
-        data = {
-            'active': GameResponseSerializer(active_games, many=True).data,
-            'settled': GameResponseSerializer(settled_games, many=True).data,
-            'recent': GameResponseSerializer(recent_games, many=True).data,
+        """Get filtered bets (cached summary, paginated active/settled lists)"""
+        page_size, active_page, settled_page = self.summary_params(request.query_params)
+        
+        cache_key = bet_summary_key(page_size, active_page, settled_page)
+        data = cache.get(cache_key)
+        if data is None:
+            data = self.build_summary(page_size, active_page, settled_page)
+            cache.set(cache_key, data, bet_summary_timeout())
+        
+        return Response(data, status=status.HTTP_200_OK)
+    
+    def build_summary(self, page_size, active_page, settled_page):
+        queries = self.summary_queries(page_size, active_page, settled_page)
+        counts = Game.objects.aggregate(**queries['counts'])
+        active, settled = self.summary_pages(queries, counts)
+        return self.summary_data(queries, counts, list(active), list(settled), list(queries['recent']))
+    
+    def summary_queries(self, page_size, active_page, settled_page):
+        """Queries za summary (sync build_summary na games.async_views zinazitumia zote)"""
+        now = timezone.now()
+        active_filter = Q(status='OPEN', active_until__gte=now)
+        settled_filter = Q(status='SETTLED')
+        
+        return {
+            # Counts zote kwa query moja (conditional aggregation). Count('status')
+            # badala ya 'id' ili query isomwe yote kutoka game_summary_idx
             'counts': {
-                'total': Game.objects.count(),
-                'active': active_games.count(),
-                'settled': settled_games.count(),
-                'pending': Game.objects.filter(result='PENDING').count(),
-                'won': Game.objects.filter(result='WON').count(),
-                'lost': Game.objects.filter(result='LOST').count()
-            }
+                'total': Count('*'),
+                'active': Count('status', filter=active_filter),
+                'settled': Count('status', filter=settled_filter),
+                'pending': Count('status', filter=Q(result='PENDING')),
+                'won': Count('status', filter=Q(result='WON')),
+                'lost': Count('status', filter=Q(result='LOST')),
+            },
+            # Bila slice - summary_pages() inakata page baada ya counts
+            'active': Game.objects.filter(active_filter),
+            'settled': Game.objects.filter(settled_filter),
+            'recent': Game.objects.prefetch_related('matches').order_by('-created_at')[:self.RECENT_SIZE],
+            'page_size': page_size,
+            'active_page': active_page,
+            'settled_page': settled_page,
         }
+    
+    def summary_pages(self, queries, counts):
+        """
+        Querysets za page za active/settled. Page kubwa kuliko total_pages inakuwa
+        page ya mwisho, hivyo OFFSET haizidi idadi ya rows (na haizidi integer ya SQLite)
+        """
+        page_size = queries['page_size']
+        pages = []
+        for name in ('active', 'settled'):
+            last_page = max((counts[name] + page_size - 1) // page_size, 1)
+            number = queries[f'{name}_page'] = min(queries[f'{name}_page'], last_page)
+            start = (number - 1) * page_size
+            pages.append(
+                queries[name].prefetch_related('matches').order_by('-created_at')[start:start + page_size]
+            )
+        return pages
+    
+    def summary_data(self, queries, counts, active, settled, recent):
+        page_size = queries['page_size']
+        
+        def meta(number, total):
+            start = (number - 1) * page_size
+            return {
+                'page': number,
+                'page_size': page_size,
+                'total_pages': (total + page_size - 1) // page_size,
+                'has_next': start + page_size < total,
+            }
         
-        return Response(data, status=status.HTTP_200_OK)
+        return {
+            'active': GameResponseSerializer(active, many=True).data,
+            'settled': GameResponseSerializer(settled, many=True).data,
+            'recent': GameResponseSerializer(recent, many=True).data,
+            'counts': counts,
+            'pagination': {
+                'active': meta(queries['active_page'], counts['active']),
+                'settled': meta(queries['settled_page'], counts['settled']),
+            },
+        }
 
 
 class MatchCRUDView(APIView):
     """
-    CRUD operations for matches
+    CRUD operations for matches.
+    
+    Game.total_odds inahesabiwa upya kutoka legs zote (max 30) kila leg inapobadilika,
+    ndani ya lock ya game - si kwa kuzidisha/kugawanya total iliyozungushwa
     """
     
     # ============================================
@@ -261,32 +440,32 @@ class MatchCRUDView(APIView):
     # ============================================
     def post(self, request, game_id):
         """Add a match to a game"""
-        try:
-            game = Game.objects.get(id=game_id)
-        except Game.DoesNotExist:
-            return Response(
-                {'error': 'Game not found'}, 
-                status=status.HTTP_404_NOT_FOUND
-            )
-        
-        # Check if game can be modified - using 'OPEN'
-        if game.status != 'OPEN':
-            return Response({
-                'error': 'Cannot add matches to a settled game'
-            }, status=status.HTTP_400_BAD_REQUEST)
-        
         serializer = MatchSerializer(data=request.data)
         
-        if serializer.is_valid():
-            match = serializer.save(game=game)
+        with transaction.atomic():
+            try:
+                game = Game.objects.select_for_update().get(id=game_id)
+            except Game.DoesNotExist:
+                return Response(
+                    {'error': 'Game not found'}, 
+                    status=status.HTTP_404_NOT_FOUND
+                )
             
-            # Recalculate total odds
-            self.recalculate_game_odds(game)
+            # Check if game can be modified - using 'OPEN'
+            if game.status != 'OPEN':
+                return Response({
+                    'error': 'Cannot add matches to a settled game'
+                }, status=status.HTTP_400_BAD_REQUEST)
             
-            return Response(
-                MatchSerializer(match).data, 
-                status=status.HTTP_201_CREATED
-            )
+            if serializer.is_valid():
+                match = serializer.save(game=game)
+                
+                self.recalculate_game_odds(game)
+                
+                return Response(
+                    MatchSerializer(match).data, 
+                    status=status.HTTP_201_CREATED
+                )
         
         return Response(
             serializer.errors, 
@@ -298,32 +477,34 @@ class MatchCRUDView(APIView):
     # ============================================
     def put(self, request, match_id):
         """Update a match"""
-        try:
-            match = Match.objects.get(id=match_id)
-        except Match.DoesNotExist:
-            return Response(
-                {'error': 'Match not found'}, 
-                status=status.HTTP_404_NOT_FOUND
-            )
-        
-        # Check if game can be modified - using 'OPEN'
-        if match.game.status != 'OPEN':
-            return Response({
-                'error': 'Cannot update matches of a settled game'
-            }, status=status.HTTP_400_BAD_REQUEST)
-        
-        serializer = MatchSerializer(match, data=request.data)
-        
-        if serializer.is_valid():
-            updated_match = serializer.save()
+        with transaction.atomic():
+            try:
+                match = Match.objects.select_related('game').select_for_update().get(id=match_id)
+            except Match.DoesNotExist:
+                return Response(
+                    {'error': 'Match not found'}, 
+                    status=status.HTTP_404_NOT_FOUND
+                )
             
-            # Recalculate game odds
-            self.recalculate_game_odds(match.game)
+            # Check if game can be modified - using 'OPEN'
+            if match.game.status != 'OPEN':
+                return Response({
+                    'error': 'Cannot update matches of a settled game'
+                }, status=status.HTTP_400_BAD_REQUEST)
             
-            return Response(
-                MatchSerializer(updated_match).data, 
-                status=status.HTTP_200_OK
-            )
+            old_odds = match.odds
+            serializer = MatchSerializer(match, data=request.data)
+            
+            if serializer.is_valid():
+                updated_match = serializer.save()
+                
+                if updated_match.odds != old_odds:
+                    self.recalculate_game_odds(match.game)
+                
+                return Response(
+                    MatchSerializer(updated_match).data, 
+                    status=status.HTTP_200_OK
+                )
         
         return Response(
             serializer.errors, 
@@ -335,63 +516,63 @@ class MatchCRUDView(APIView):
     # ============================================
     def delete(self, request, match_id):
         """Delete a match"""
-        try:
-            match = Match.objects.get(id=match_id)
-        except Match.DoesNotExist:
-            return Response(
-                {'error': 'Match not found'}, 
-                status=status.HTTP_404_NOT_FOUND
-            )
-        
-        # Check if game can be modified - using 'OPEN'
-        if match.game.status != 'OPEN':
-            return Response({
-                'error': 'Cannot delete matches from a settled game'
-            }, status=status.HTTP_400_BAD_REQUEST)
-        
-        game = match.game
-        match_info = {
-            'id': match.id,
-            'match_ref': match.match_ref,
-            'message': f'Match deleted successfully'
-        }
-        
-        match.delete()
-        
-        # Recalculate game odds if matches remain
-        self.recalculate_game_odds(game)
+        with transaction.atomic():
+            try:
+                match = Match.objects.select_related('game').select_for_update().get(id=match_id)
+            except Match.DoesNotExist:
+                return Response(
+                    {'error': 'Match not found'}, 
+                    status=status.HTTP_404_NOT_FOUND
+                )
+            
+            # Check if game can be modified - using 'OPEN'
+            if match.game.status != 'OPEN':
+                return Response({
+                    'error': 'Cannot delete matches from a settled game'
+                }, status=status.HTTP_400_BAD_REQUEST)
+            
+            game = match.game
+            match_info = {
+                'id': match.id,
+                'match_ref': match.match_ref,
+                'message': f'Match deleted successfully'
+            }
+            
+            match.delete()
+            
+            self.recalculate_game_odds(game)
         
         return Response(match_info, status=status.HTTP_200_OK)
     
+    def set_game_odds(self, game, total_odds):
+        game.odds = total_odds
+        game.total_odds = total_odds
+        game.save(update_fields=['odds', 'total_odds'])
+    
     def recalculate_game_odds(self, game):
-        """Helper method to recalculate game total odds"""
-        matches = game.matches.all()
-        
-        if matches.exists():
-            total_odds = 1
-            for match in matches:
-                total_odds *= float(match.odds)
-            
-            game.odds = round(total_odds, 2)
-            game.total_odds = round(total_odds, 2)
-        else:
-            game.odds = 0
-            game.total_odds = 0
-        
-        game.save()
+        """Helper method to recalculate game total odds from every match (query moja)"""
+        self.set_game_odds(game, game_odds(game.matches.values_list('odds', flat=True)))
 
 
 class AccountBalanceView(APIView):
     """
-    View to manage account balance with database persistence
+    View to manage account balance with database persistence.
+    
+    Mabadiliko yote yanaingia kwenye ledger (BalanceEntry) - angalia games/ledger.py
     """
     
     def get_balance_object(self):
-        """Get or create the single balance record"""
-        balance = Balance.objects.first()
-        if not balance:
-            balance = Balance.objects.create(amount=0.00, currency='TSh')
-        return balance
+        """Get or create the single balance record (with the live amount)"""
+        return with_current_amount(get_balance())
+    
+    def save_balance(self, balance, validated_data):
+        """Amount inakuwa ledger entry; currency inabadilishwa moja kwa moja"""
+        currency = validated_data.get('currency')
+        if currency and currency != balance.currency:
+            Balance.objects.filter(pk=balance.pk).update(currency=currency, updated_at=timezone.now())
+        if 'amount' in validated_data:
+            set_amount(balance.pk, validated_data['amount'])
+        return self.get_balance_object()
     
     def get(self, request):
         """Get current account balance"""
@@ -422,10 +603,10 @@ class AccountBalanceView(APIView):
         serializer = BalanceSerializer(balance, data=request.data)
         
         if serializer.is_valid():
-            serializer.save()
+            balance = self.save_balance(balance, serializer.validated_data)
             return Response({
                 'message': 'Balance updated successfully',
-                'data': serializer.data
+                'data': BalanceSerializer(balance).data
             }, status=status.HTTP_200_OK)
         
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -436,54 +617,166 @@ class AccountBalanceView(APIView):
         serializer = BalanceSerializer(balance, data=request.data, partial=True)
         
         if serializer.is_valid():
-            serializer.save()
+            balance = self.save_balance(balance, serializer.validated_data)
             return Response({
                 'message': 'Balance updated successfully',
-                'data': serializer.data
+                'data': BalanceSerializer(balance).data
             }, status=status.HTTP_200_OK)
         
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+
+class BalanceEntryView(APIView):
+    """
+    Credits/debits za balance kama ledger entries (append-only)
+    """
+    DEFAULT_LIMIT = 50
+    MAX_LIMIT = 100
+    
+    # ============================================
+    # LIST ENTRIES - GET /api/balance/entries/
+    # ============================================
+    def get(self, request):
+        """Get latest ledger entries (newest first)"""
+        limit = request.query_params.get('limit', '')
+        limit = min(int(limit), self.MAX_LIMIT) if limit.isdecimal() and int(limit) > 0 else self.DEFAULT_LIMIT
+        
+        entries = BalanceEntry.objects.filter(
+            balance_id=get_balance().pk
+        ).order_by('-id')[:limit]
+        return Response(BalanceEntrySerializer(entries, many=True).data, status=status.HTTP_200_OK)
+    
+    # ============================================
+    # CREDIT/DEBIT - POST /api/balance/entries/
+    # ============================================
+    def post(self, request):
+        """Credit (delta > 0) or debit (delta < 0) the balance"""
+        serializer = BalanceEntrySerializer(data=request.data)
+        
+        if serializer.is_valid():
+            balance = get_balance()
+            try:
+                entry = apply_delta(balance, **serializer.validated_data)
+            except InsufficientBalance as exc:
+                return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+            return Response({
+                'message': 'Balance updated successfully',
+                'entry': BalanceEntrySerializer(entry).data,
+                'data': BalanceSerializer(with_current_amount(balance)).data
+            }, status=status.HTTP_201_CREATED)
+        
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
     
 
  
 
-class MatchFixtureListCreateView(APIView):
+# ============================================
+# FIXTURES ENGINE - /api/fixtures/, /api/efootball/
+# ============================================
+class FixtureEngineMixin:
+    """
+    Views za Fixture* ni engine moja ya sports zote: subclass inaweka `model`
+    (subclass ya models.Fixture) na `serializer_class` tu. Bulk, cache, push
+    na delta sync zinatoka games.bulk/cache/live/sync
+    """
+    model = None
+    serializer_class = None
+
+    @property
+    def label(self):
+        """Jina la model kwenye log lines (mf. games.matchfixture)"""
+        return self.model._meta.label_lower
+
+
+def error_fields(error):
+    """Majina ya fields zenye makosa - log haibebi payload ya client"""
+    detail = error['errors']
+    return ','.join(detail) if isinstance(detail, dict) else 'non_field_errors'
+
+
+class FixtureListCreateView(FixtureEngineMixin, APIView):
     """
     View to list and create match fixtures
     """
+    # ?format=columnar / Accept: application/vnd.vbclone.columnar+json
+    renderer_classes = [*api_settings.DEFAULT_RENDERER_CLASSES, ColumnarJSONRenderer]
     
     def get(self, request):
-        """Get all match fixtures"""
-        fixtures = MatchFixture.objects.all().order_by('date', 'time')
-        serializer = MatchFixtureSerializer(fixtures, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        """
+        Get upcoming match fixtures (304 kama If-None-Match bado ni sahihi).
+        ?date=, ?date_from=/?date_to=, ?league=, ?kickoff_after=, ?upcoming=false
+        - angalia games/filters.py. ?since=<token> inarudisha mabadiliko tu
+        (bila filters) - angalia games/sync.py
+        """
+        since = request.query_params.get('since')
+        if since is not None:
+            # Delta sync - bila ETag aggregate ya table nzima
+            try:
+                return Response(changes_since(self.model, since), status=status.HTTP_200_OK)
+            except InvalidSyncToken:
+                return Response({'error': 'Invalid since token'}, status=status.HTTP_400_BAD_REQUEST)
+            except SyncTokenExpired:
+                return Response(
+                    {'error': 'since token has expired, reload the full list'},
+                    status=status.HTTP_410_GONE
+                )
+        
+        try:
+            window = fixture_window(request.query_params)
+        except InvalidFixtureFilter as exc:
+            return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+        fixtures = filter_fixtures(self.model.objects.all(), window)
+        
+        # Kila format (json, columnar, api) ina ETag yake
+        renderer = request.accepted_renderer
+        etag = fixture_list_etag(self.model, f'{window_key(window)}:{renderer.format}', queryset=fixtures)
+        if not_modified(request, etag):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+        
+        rows = fixtures.order_by('date', 'time').values_list(*FIXTURE_LIST_COLUMNS)
+        headers = {'ETag': etag, 'Cache-Control': 'no-cache', 'Vary': 'Accept'}
+        if renderer.format == ColumnarJSONRenderer.format:
+            build, head = build_columnar_rows, [list(FIXTURE_COLUMNAR_FIELDS)]
+        else:
+            build, head = build_fixture_rows, []
+        
+        # Stream ni JSON tu - browsable API (?format=api) inarudi kwenye Response ya kawaida
+        if wants_stream(request.query_params) and isinstance(renderer, JSONRenderer):
+            return streaming_json_response(
+                stream_queryset(rows, build, head=head),
+                headers=headers,
+                content_type=renderer.media_type
+            )
+        return Response(
+            [*head, *build(rows)],
+            status=status.HTTP_200_OK,
+            headers=headers
+        )
     
     def post(self, request):
         """Create a new match fixture"""
-        print("📥 Received data:", request.data)  # Debug print
-        
-        serializer = MatchFixtureSerializer(data=request.data)
+        serializer = self.serializer_class(data=request.data)
         
         if serializer.is_valid():
             fixture = serializer.save()
-            print("✅ Created fixture:", fixture.id)
+            logger.info('fixture_created model=%s id=%s', self.label, fixture.id)
             return Response(
-                MatchFixtureSerializer(fixture).data,
+                self.serializer_class(fixture).data,
                 status=status.HTTP_201_CREATED
             )
         
-        print("❌ Serializer errors:", serializer.errors)  # Debug print
+        logger.info('fixture_invalid model=%s fields=%s', self.label, ','.join(serializer.errors))
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-class MatchFixtureDetailView(APIView):
+class FixtureDetailView(FixtureEngineMixin, APIView):
     """
     View to retrieve, update or delete a match fixture
     """
     
     def get_object(self, pk):
         try:
-            return MatchFixture.objects.get(pk=pk)
-        except MatchFixture.DoesNotExist:
+            return self.model.objects.get(pk=pk)
+        except self.model.DoesNotExist:
             return None
     
     # ============================================
@@ -499,7 +792,7 @@ class MatchFixtureDetailView(APIView):
                 status=status.HTTP_404_NOT_FOUND
             )
         
-        serializer = MatchFixtureSerializer(fixture)
+        serializer = self.serializer_class(fixture)
         return Response(serializer.data, status=status.HTTP_200_OK)
     
     # ============================================
@@ -515,19 +808,17 @@ class MatchFixtureDetailView(APIView):
                 status=status.HTTP_404_NOT_FOUND
             )
         
-        print(f"📥 Updating fixture {pk} with data:", request.data)
-        
-        serializer = MatchFixtureSerializer(fixture, data=request.data)
+        serializer = self.serializer_class(fixture, data=request.data)
         
         if serializer.is_valid():
             updated_fixture = serializer.save()
-            print(f"✅ Updated fixture {pk}")
+            logger.info('fixture_updated model=%s id=%s', self.label, pk)
             return Response(
-                MatchFixtureSerializer(updated_fixture).data,
+                self.serializer_class(updated_fixture).data,
                 status=status.HTTP_200_OK
             )
         
-        print("❌ Update errors:", serializer.errors)
+        logger.info('fixture_invalid model=%s id=%s fields=%s', self.label, pk, ','.join(serializer.errors))
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
     
     # ============================================
@@ -543,19 +834,17 @@ class MatchFixtureDetailView(APIView):
                 status=status.HTTP_404_NOT_FOUND
             )
         
-        print(f"📥 Partially updating fixture {pk} with data:", request.data)
-        
-        serializer = MatchFixtureSerializer(fixture, data=request.data, partial=True)
+        serializer = self.serializer_class(fixture, data=request.data, partial=True)
         
         if serializer.is_valid():
             updated_fixture = serializer.save()
-            print(f"✅ Partially updated fixture {pk}")
+            logger.info('fixture_updated model=%s id=%s partial=true', self.label, pk)
             return Response(
-                MatchFixtureSerializer(updated_fixture).data,
+                self.serializer_class(updated_fixture).data,
                 status=status.HTTP_200_OK
             )
         
-        print("❌ Partial update errors:", serializer.errors)
+        logger.info('fixture_invalid model=%s id=%s fields=%s', self.label, pk, ','.join(serializer.errors))
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
     
     # ============================================
@@ -577,155 +866,137 @@ class MatchFixtureDetailView(APIView):
             'message': f'Fixture {fixture.id} - {fixture.homeTeam} vs {fixture.awayTeam} deleted successfully'
         }
         
-        fixture.delete()
-        print(f"✅ Deleted fixture {pk}")
+        with transaction.atomic():
+            fixture.delete()
+            record_deletions(self.model, [fixture_info['id']])
+        publish_fixture_changes(self.model, deleted=[fixture_info['id']])
+        logger.info('fixture_deleted model=%s id=%s', self.label, pk)
         
         return Response(fixture_info, status=status.HTTP_200_OK)
 
 
-class MatchFixtureBulkCreateView(APIView):
+class FixtureBulkCreateView(FixtureEngineMixin, APIView):
     """
     View to create multiple match fixtures at once
     """
     
     def post(self, request):
-        """Create multiple match fixtures"""
-        print("📥 Bulk create received:", len(request.data) if isinstance(request.data, list) else "Not a list")
+        """
+        Create multiple match fixtures.
         
+        ?upsert=true - fixtures zenye eventId iliyopo zina-update badala ya kuwa errors
+        """
+        started = time.perf_counter()
         if not isinstance(request.data, list):
             return Response(
                 {'error': 'Expected a list of fixtures'},
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        created_fixtures = []
-        errors = []
+        upsert = request.query_params.get('upsert', '').lower() in ('1', 'true', 'yes')
         
-        for index, fixture_data in enumerate(request.data):
-            print(f"Processing fixture {index}:", fixture_data)
-            serializer = MatchFixtureSerializer(data=fixture_data)
-            if serializer.is_valid():
-                fixture = serializer.save()
-                created_fixtures.append(MatchFixtureSerializer(fixture).data)
-                print(f"✅ Created fixture {index}")
-            else:
-                errors.append({
-                    'index': index,
-                    'data': fixture_data,
-                    'errors': serializer.errors
-                })
-                print(f"❌ Error in fixture {index}:", serializer.errors)
+        try:
+            created, updated, errors = bulk_create_fixtures(
+                self.model, self.serializer_class, request.data, upsert=upsert
+            )
+        except IntegrityError:
+            # eventId iliongezwa na request nyingine kati ya validation na insert
+            return Response(
+                {'error': 'Fixtures changed while saving, please retry'},
+                status=status.HTTP_409_CONFLICT
+            )
+        
+        log_items(logger, logging.DEBUG, 'fixture_created model=%s id=%s eventId=%s', created,
+                  lambda fixture: (self.label, fixture.pk, fixture.eventId))
+        log_items(logger, logging.INFO, 'fixture_rejected model=%s index=%s fields=%s', errors,
+                  lambda error: (self.label, error['index'], error_fields(error)))
+        logger.info(
+            'bulk_create model=%s items=%d created=%d updated=%d errors=%d ms=%.1f',
+            self.label, len(request.data), len(created), len(updated), len(errors),
+            (time.perf_counter() - started) * 1000,
+        )
         
         response_data = {
-            'created': created_fixtures,
+            'created': fixture_rows_from_objects(created),
             'errors': errors,
-            'total_created': len(created_fixtures),
+            'total_created': len(created),
             'total_errors': len(errors)
         }
+        if upsert:
+            response_data['updated'] = fixture_rows_by_pk(self.model, [fixture.pk for fixture in updated])
+            response_data['total_updated'] = len(updated)
         
-        status_code = status.HTTP_201_CREATED if created_fixtures else status.HTTP_400_BAD_REQUEST
+        status_code = status.HTTP_201_CREATED if created or updated else status.HTTP_400_BAD_REQUEST
         return Response(response_data, status=status_code)
    
 
 
-class MatchFixtureBulkUpdateView(APIView):
+class FixtureBulkUpdateView(FixtureEngineMixin, APIView):
     """
     View to update multiple match fixtures at once
     """
     
     def put(self, request):
         """Update multiple match fixtures"""
-        print("📥 Bulk update received:", len(request.data) if isinstance(request.data, list) else "Not a list")
-        
+        started = time.perf_counter()
         if not isinstance(request.data, list):
             return Response(
                 {'error': 'Expected a list of fixtures with ids'},
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        updated_fixtures = []
-        errors = []
+        try:
+            updated, errors = bulk_update_fixtures(self.model, self.serializer_class, request.data)
+        except IntegrityError:
+            # eventId ilichukuliwa na request nyingine wakati wa update
+            return Response(
+                {'error': 'Fixtures changed while saving, please retry'},
+                status=status.HTTP_409_CONFLICT
+            )
         
-        for index, fixture_data in enumerate(request.data):
-            fixture_id = fixture_data.get('id')
-            
-            if not fixture_id:
-                errors.append({
-                    'index': index,
-                    'data': fixture_data,
-                    'errors': {'id': 'This field is required for updates'}
-                })
-                continue
-            
-            try:
-                fixture = MatchFixture.objects.get(pk=fixture_id)
-                serializer = MatchFixtureSerializer(fixture, data=fixture_data)
-                
-                if serializer.is_valid():
-                    updated_fixture = serializer.save()
-                    updated_fixtures.append(MatchFixtureSerializer(updated_fixture).data)
-                    print(f"✅ Updated fixture {fixture_id}")
-                else:
-                    errors.append({
-                        'index': index,
-                        'id': fixture_id,
-                        'data': fixture_data,
-                        'errors': serializer.errors
-                    })
-                    print(f"❌ Error updating fixture {fixture_id}:", serializer.errors)
-                    
-            except MatchFixture.DoesNotExist:
-                errors.append({
-                    'index': index,
-                    'id': fixture_id,
-                    'data': fixture_data,
-                    'errors': {'id': f'Fixture with id {fixture_id} not found'}
-                })
+        log_items(logger, logging.DEBUG, 'fixture_updated model=%s id=%s', updated,
+                  lambda fixture: (self.label, fixture.pk))
+        log_items(logger, logging.INFO, 'fixture_rejected model=%s index=%s fields=%s', errors,
+                  lambda error: (self.label, error['index'], error_fields(error)))
+        logger.info(
+            'bulk_update model=%s items=%d updated=%d errors=%d ms=%.1f',
+            self.label, len(request.data), len(updated), len(errors),
+            (time.perf_counter() - started) * 1000,
+        )
         
         response_data = {
-            'updated': updated_fixtures,
+            'updated': fixture_rows_from_objects(updated),
             'errors': errors,
-            'total_updated': len(updated_fixtures),
+            'total_updated': len(updated),
             'total_errors': len(errors)
         }
         
-        status_code = status.HTTP_200_OK if updated_fixtures else status.HTTP_400_BAD_REQUEST
+        status_code = status.HTTP_200_OK if updated else status.HTTP_400_BAD_REQUEST
         return Response(response_data, status=status_code)
 
 
-class MatchFixtureBulkDeleteView(APIView):
+class FixtureBulkDeleteView(FixtureEngineMixin, APIView):
     """
     View to delete multiple match fixtures at once
     """
     
     def delete(self, request):
         """Delete multiple match fixtures"""
-        fixture_ids = request.data.get('ids', [])
+        started = time.perf_counter()
+        fixture_ids = request.data.get('ids') if isinstance(request.data, dict) else None
         
-        if not fixture_ids:
+        if not fixture_ids or not isinstance(fixture_ids, list):
             return Response(
                 {'error': 'Expected a list of fixture ids'},
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        deleted = []
-        not_found = []
-        
-        for fixture_id in fixture_ids:
-            try:
-                fixture = MatchFixture.objects.get(pk=fixture_id)
-                fixture_info = {
-                    'id': fixture.id,
-                    'eventId': fixture.eventId,
-                    'homeTeam': fixture.homeTeam,
-                    'awayTeam': fixture.awayTeam
-                }
-                fixture.delete()
-                deleted.append(fixture_info)
-                print(f"✅ Deleted fixture {fixture_id}")
-            except MatchFixture.DoesNotExist:
-                not_found.append(fixture_id)
-                print(f"❌ Fixture {fixture_id} not found")
+        deleted, not_found = bulk_delete_fixtures(self.model, fixture_ids)
+        logger.info(
+            'bulk_delete model=%s ids=%d deleted=%d not_found=%d ms=%.1f',
+            self.label, len(fixture_ids), len(deleted), len(not_found),
+            (time.perf_counter() - started) * 1000,
+        )
         
         response_data = {
             'deleted': deleted,
@@ -735,4 +1006,51 @@ class MatchFixtureBulkDeleteView(APIView):
         }
         
         status_code = status.HTTP_200_OK if deleted else status.HTTP_404_NOT_FOUND
-        return Response(response_data, status=status_code)
\ No newline at end of file
+        return Response(response_data, status=status_code)
+
+
+class MatchFixtureListCreateView(FixtureListCreateView):
+    model = MatchFixture
+    serializer_class = MatchFixtureSerializer
+
+
+class MatchFixtureDetailView(FixtureDetailView):
+    model = MatchFixture
+    serializer_class = MatchFixtureSerializer
+
+
+class MatchFixtureBulkCreateView(FixtureBulkCreateView):
+    model = MatchFixture
+    serializer_class = MatchFixtureSerializer
+
+
+class MatchFixtureBulkUpdateView(FixtureBulkUpdateView):
+    model = MatchFixture
+    serializer_class = MatchFixtureSerializer
+
+
+class MatchFixtureBulkDeleteView(FixtureBulkDeleteView):
+    model = MatchFixture
+    serializer_class = MatchFixtureSerializer
+
+
+# ============================================
+# LIVE ODDS - GET /api/fixtures/stream/ (Server-Sent Events, ASGI tu)
+# ============================================
+async def fixture_stream(request):
+    """
+    Push ya rows za MatchFixture zilizobadilika: event 'fixtures' (list ya rows
+    kama /api/fixtures/), 'deleted' (ids) na 'resync' (soma list nzima upya)
+    """
+    return fixture_stream_response(request, MatchFixture)
+
+
+# ============================================
+# METRICS - GET /api/metrics/ (Prometheus text)
+# ============================================
+def metrics(request):
+    """Latency, SQL na response size kwa kila view, jumla ya workers wote (games/metrics.py)"""
+    return HttpResponse(
+        render_prometheus(registry.collect()), content_type='text/plain; version=0.0.4; charset=utf-8'
+    )
+
@@ -14,3 +14,7 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'vbclone_backend.settings')
 
 application = get_asgi_application()
+
+from games.db import set_journal_mode  # noqa: E402 (baada ya django.setup())
+
+set_journal_mode()
@@ -2,6 +2,8 @@
 Django settings for vbclone_backend project.
 """
 
+import os
+import sys
 from pathlib import Path
 
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -27,7 +29,11 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # Ya kwanza ili ipime stack nzima - /api/metrics/ (games/metrics.py)
+    'games.metrics.RequestMetricsMiddleware',
     'corsheaders.middleware.CorsMiddleware',
+    # Reads za GET -> replica (kama ipo), writes -> primary - angalia games/db.py
+    'games.db.ReplicaRoutingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -57,13 +63,152 @@ TEMPLATES = [
 WSGI_APPLICATION = 'vbclone_backend.wsgi.application'
 
 # Database
+# SQLITE_TUNING=0 inarudisha defaults za SQLite (benchmark: bench_sqlite_tuning)
+SQLITE_TUNING = os.environ.get('SQLITE_TUNING', '1') == '1'
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        'NAME': os.environ.get('SQLITE_PATH', BASE_DIR / 'db.sqlite3'),
+        # Persistent connections ni opt-in (sekunde, mf. DB_CONN_MAX_AGE=600) kwa
+        # WSGI workers wenye threads za kudumu tu. Chini ya ASGI (SSE stream, async
+        # views) acha 0 - kila request inaweza kuwa kwenye thread mpya na connections
+        # zisingefungwa
+        'CONN_MAX_AGE': int(os.environ.get('DB_CONN_MAX_AGE', 0)),
+        'CONN_HEALTH_CHECKS': SQLITE_TUNING,
+        'OPTIONS': {
+            # BEGIN IMMEDIATE: writer anasubiri lock (busy_timeout) badala ya kupata
+            # "database is locked" mara moja anapo-upgrade read transaction kuwa write
+            'transaction_mode': 'IMMEDIATE',
+        } if SQLITE_TUNING else {},
+    }
+}
+
+# ========== READ REPLICA ==========
+# SQLITE_REPLICA_PATH inawasha alias 'replica': GETs zinasoma hapo, writes zinabaki
+# 'default'. Locally replica ni nakala ya db.sqlite3 (`manage.py sync_replica`).
+# FIXTURE_SYNC_OVERLAP lazima iwe kubwa kuliko lag ya replica
+REPLICA_DATABASE = None
+if os.environ.get('SQLITE_REPLICA_PATH'):
+    REPLICA_DATABASE = 'replica'
+    DATABASES[REPLICA_DATABASE] = {
+        **DATABASES['default'],
+        'NAME': os.environ['SQLITE_REPLICA_PATH'],
+        # Tests: replica inatumia test database ya default
+        'TEST': {'MIRROR': 'default'},
+    }
+DATABASE_ROUTERS = ['games.db.PrimaryReplicaRouter']
+REPLICA_PIN_SECONDS = 5  # read-your-writes: client aliyeandika anasoma primary kwa muda huu
+REPLICA_SYNC_INTERVAL = 1  # sekunde kati ya nakala za sync_replica
+
+# ========== SQLITE PRAGMAS ==========
+# Zinawekwa kwenye kila connection mpya (games/db.py)
+SQLITE_PRAGMAS = {
+    'busy_timeout': 5000,  # ms za kusubiri lock kabla ya "database is locked"
+    'synchronous': 'NORMAL',  # salama kwa WAL: fsync kwenye checkpoint tu, si kila commit
+    'mmap_size': 134217728,  # 128 MB - reads bila copy kupitia page cache ya OS
+    'cache_size': -20000,  # ~20 MB kwa kila connection (thamani hasi = KB)
+} if SQLITE_TUNING else {}
+# WAL: readers hawazuiwi na writer (na writer hazuiwi na readers). Inadumu kwenye
+# file la database, hivyo inawekwa mara moja server inapoanza (wsgi.py/asgi.py) -
+# si na management commands wala tests, ambazo zingeandika upya db.sqlite3
+SQLITE_JOURNAL_MODE = 'WAL' if SQLITE_TUNING else None
+
+# ========== CACHE ==========
+# Bet summary (/api/bets/filter/summary/) hukaa kwenye cache kwa muda mfupi;
+# inafutwa kila Game/Match ikibadilika. Invalidation inafika workers wote tu kama
+# cache ni ya pamoja (REDIS_URL, mf. redis://127.0.0.1:6379/1 - inahitaji package
+# `redis`). Bila hiyo cache ni LocMemCache ya kila process: write inafuta summary
+# ya worker wake tu, na workers wengine wanaweza kurudisha summary ya zamani hadi
+# BET_SUMMARY_CACHE_TIMEOUT iishe
+if os.environ.get('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['REDIS_URL'],
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
     }
+BET_SUMMARY_CACHE_TIMEOUT = 5  # sekunde - bound ya stale summary kati ya workers bila Redis
+
+# ========== BETS ==========
+# Muda (saa) ambao bet mpya inabaki OPEN kama active_until haijatumwa
+BET_ACTIVE_HOURS = 24
+
+# expire_games: OPEN bets zilizopita active_until zinahamishwa EXPIRED kwa batches
+EXPIRY_SWEEP_BATCH_SIZE = 500
+EXPIRY_SWEEP_INTERVAL = 60  # sekunde kati ya sweeps
+
+# ========== LIVE ODDS (SSE) ==========
+# /api/fixtures/stream/ na /api/efootball/stream/ - zinahitaji ASGI server
+# (mf. `gunicorn vbclone_backend.asgi:application -k uvicorn.workers.UvicornWorker`).
+# InProcessHub ni ya worker mmoja; weka hub ya broker kwa workers wengi
+FIXTURE_PUSH_HUB = 'games.live.InProcessHub'
+FIXTURE_PUSH_QUEUE_SIZE = 100  # messages zinazosubiri kwa kila subscriber kabla ya 'resync'
+FIXTURE_PUSH_KEEPALIVE = 15  # sekunde
+
+# ========== ASYNC READ VIEWS ==========
+# ASYNC_READ_VIEWS=1 (ASGI tu): GET za bets/summary/fixtures/efootball zinatumia async
+# ORM (games/async_views.py). Ni opt-in: SQLite driver ni sync, hivyo kila query ni
+# thread hop - pima kwa `manage.py bench_async_reads` kabla ya kuwasha
+ASYNC_READ_VIEWS = os.environ.get('ASYNC_READ_VIEWS') == '1'
+
+# ========== FIXTURE DELTA SYNC (?since=) ==========
+FIXTURE_SYNC_OVERLAP = 2  # sekunde - token mpya inarudi nyuma kwa hizi (commits zilizochelewa)
+FIXTURE_TOMBSTONE_DAYS = 7  # token ya zamani kuliko hii inapata 410 (soma list nzima)
+
+# ========== STREAMING LISTS ==========
+# Bets/fixtures/efootball lists kwa StreamingHttpResponse (games/streaming.py):
+# ?stream=true kwa request moja, au True hapa kwa zote (?stream=false kuzima)
+STREAM_LIST_RESPONSES = False
+STREAM_CHUNK_SIZE = 500  # rows kwa kila query chunk / kipande cha JSON
+
+# ========== METRICS (/api/metrics/) ==========
+# Kwa gunicorn workers wengi weka METRICS_DIR (directory ya pamoja, ifutwe kabla
+# ya server kuanza) ili /api/metrics/ ijumlishe workers wote
+METRICS_DIR = os.environ.get('METRICS_DIR') or None
+METRICS_FLUSH_INTERVAL = 1  # sekunde
+
+# ========== LOGGING ==========
+# Logs za games/effootball zinapita QueueLogHandler (games/log.py): request inaweka
+# record kwenye queue, thread ya listener inaformat na kuandika stdout. LOG_LEVEL=DEBUG
+# inaongeza lines za kila item ya bulk (sampled) - angalia `manage.py bench_bulk_logging`.
+# Tests (manage.py test / pytest) zinatumia WARNING kama LOG_LEVEL haijawekwa
+TESTING = sys.argv[1:2] == ['test'] or 'pytest' in sys.modules
+LOG_LEVEL = os.environ.get('LOG_LEVEL', 'WARNING' if TESTING else 'INFO')
+LOG_ITEM_SAMPLE_FIRST = 5  # lines za items za kwanza za kila bulk request
+LOG_ITEM_SAMPLE_EVERY = 100  # kisha line moja kati ya items hizi
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'logfmt': {
+            'format': 'time=%(asctime)s level=%(levelname)s logger=%(name)s %(message)s',
+        },
+    },
+    'handlers': {
+        'queue': {
+            '()': 'games.log.QueueLogHandler',
+            'stream': 'ext://sys.stdout',
+            'formatter': 'logfmt',
+        },
+    },
+    'loggers': {
+        'games': {'handlers': ['queue'], 'level': LOG_LEVEL, 'propagate': False},
+        'effootball': {'handlers': ['queue'], 'level': LOG_LEVEL, 'propagate': False},
+    },
 }
 
+# ========== BALANCE LEDGER ==========
+# Idadi ya entries kabla ya kuhamishiwa kwenye snapshot (Balance.amount)
+BALANCE_SNAPSHOT_EVERY = 100
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -104,6 +249,7 @@ CORS_ALLOW_HEADERS = [
     'user-agent',
     'x-csrftoken',
     'x-requested-with',
+    'if-none-match',
 ]
 
 CORS_ALLOW_METHODS = [
@@ -118,6 +264,7 @@ CORS_ALLOW_METHODS = [
 CORS_EXPOSE_HEADERS = [
     'content-type',
     'authorization',
+    'etag',
 ]
 
 CSRF_TRUSTED_ORIGINS = [